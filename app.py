@@ -14,10 +14,32 @@ from src.stock_tracker import StockTracker
 from src.fundamentals_tracker import FundamentalsTracker
 from src.decision_engine import DecisionEngine
 from src.config import COMPANIES, INVESTORS
+from src.timeframes import TimeframeCache, TIMEFRAMES
+from src.summary_store import SummaryStore
+from src.article_archive import ArticleArchive
+from src.news_search import NewsSearchIndex
 
 app = Flask(__name__)
 app.config['DATA_DIR'] = 'data'
 
+# Weekly/monthly chart bars are resampled once per ticker and reused across requests
+timeframe_cache = TimeframeCache()
+
+# News summaries keyed by (ticker, date); the stock page reads only the latest one
+summary_store = SummaryStore(
+    os.path.join(app.config['DATA_DIR'], 'news_summaries.db'),
+    legacy_dir=os.path.join(app.config['DATA_DIR'], 'news_summaries')
+)
+
+# Scraped news by date and ticker, with each article body stored once
+news_archive = ArticleArchive(
+    os.path.join(app.config['DATA_DIR'], 'news_archive.db'),
+    legacy_path=os.path.join(app.config['DATA_DIR'], 'news_data.pkl')
+)
+
+# Full-text index over the archived articles, updated whenever news is saved
+news_search = NewsSearchIndex(os.path.join(app.config['DATA_DIR'], 'news_search.db'), seed=news_archive.history)
+
 # Helper function to load pickle data
 def load_pickle(filename):
     filepath = os.path.join(app.config['DATA_DIR'], filename)
@@ -45,7 +67,7 @@ def index():
     # Check if we have fresh data
     stock_data_fresh = is_data_fresh('stock_data.pkl')
     investor_data_fresh = is_data_fresh('investor_data.pkl')
-    news_data_fresh = is_data_fresh('news_data.pkl')
+    news_data_fresh = is_data_fresh('news_archive.db')
     fundamentals_data_fresh = is_data_fresh('fundamentals_data.pkl')
     recommendations_fresh = is_data_fresh('recommendations.pkl')
     
@@ -115,9 +137,9 @@ def refresh_data():
         
     if data_type == 'news' or data_type == 'all':
         # Refresh news data
-        news_tracker = NewsTracker()
+        news_tracker = NewsTracker(archive_path=news_archive.path, search_path=news_search.path)
         news_data = news_tracker.track(tickers=tickers)
-        news_tracker.save_data(os.path.join(app.config['DATA_DIR'], 'news_data.pkl'))
+        news_tracker.save_data()
 
     
     if data_type == 'fundamentals':
@@ -127,10 +149,11 @@ def refresh_data():
         fundamentals_tracker.save_data(os.path.join(app.config['DATA_DIR'], 'fundamentals_data.pkl'))
     
     if data_type == 'recommendations' or data_type == 'all':
-        # Generate new recommendations
+        # Generate new recommendations from the latest news snapshot
+        latest_news_date = news_archive.latest_date()
         decision_engine = DecisionEngine(
             investor_data=load_pickle('investor_data.pkl'),
-            news_data=load_pickle('news_data.pkl'),
+            news_data={latest_news_date: news_archive.snapshot(latest_news_date)} if latest_news_date else None,
             stock_data=load_pickle('stock_data.pkl'),
             fundamentals_data=load_pickle('fundamentals_data.pkl')
         )
@@ -174,12 +197,8 @@ def investors():
 @app.route('/news')
 def news():
     """News data page"""
-    news_data_history = load_pickle('news_data.pkl')
-    
-    # Get all available dates from the history
-    available_dates = []
-    if news_data_history:
-        available_dates = sorted(news_data_history.keys(), reverse=True)
+    # Get all available dates from the archive
+    available_dates = news_archive.dates()
         
     # Get selected date from query parameter, default to most recent
     selected_date = request.args.get('date', None)
@@ -189,7 +208,7 @@ def news():
         selected_date = available_dates[0] if available_dates else None
         
     # Get the data for the selected date
-    news_data = news_data_history.get(selected_date, {}) if selected_date else {}
+    news_data = news_archive.snapshot(selected_date)
     
     return render_template('news.html', 
                           news_data=news_data,
@@ -241,17 +260,14 @@ def recommendations():
                           selected_date=selected_date)
 
 def load_news_summary(ticker):
-    """Load news summary for a specific ticker"""
-    summary_file = os.path.join(app.config['DATA_DIR'], 'news_summaries', f"{ticker}.pkl")
-    if os.path.exists(summary_file):
-        try:
-            with open(summary_file, 'rb') as f:
-                summaries = pickle.load(f)
-                # Get the most recent summary (should be the latest date)
-                return summaries
-        except Exception as e:
-            print(f"Error loading news summary for {ticker}: {e}")
-    return None
+    """Load the latest news summary for a ticker and the dates of earlier ones"""
+    try:
+        latest_date, summary = summary_store.latest(ticker)
+        if summary is not None:
+            return latest_date, summary, summary_store.dates(ticker)
+    except Exception as e:
+        print(f"Error loading news summary for {ticker}: {e}")
+    return None, None, []
 
 @app.route('/stock/<ticker>')
 def stock_detail(ticker):
@@ -263,11 +279,7 @@ def stock_detail(ticker):
     ticker_data = stock_data.get('stocks', {}).get(ticker, {}) if stock_data else {}
     
     # Load news data
-    news_data_history = load_pickle('news_data.pkl')
-    if news_data_history:
-        latest_date = max(news_data_history.keys()) if news_data_history.keys() else None
-        news_data = news_data_history[latest_date] if latest_date else {}
-    news = news_data.get(ticker, []) if news_data else []
+    news = news_archive.latest(ticker).get(ticker, [])
     
     # Load recommendations data
     recommendations = load_pickle('recommendations.pkl')
@@ -278,7 +290,7 @@ def stock_detail(ticker):
     fundamentals = fundamentals_data.get(ticker, {}) if fundamentals_data else {}
     
     # Load news summary
-    news_summary = load_news_summary(ticker)
+    news_summary_date, news_summary, news_summary_dates = load_news_summary(ticker)
 
     return render_template('stock_detail.html', 
                           ticker=ticker,
@@ -286,11 +298,44 @@ def stock_detail(ticker):
                           news=news,
                           recommendation=recommendation,
                           fundamentals=fundamentals,
-                          news_summary=news_summary)
+                          news_summary=news_summary,
+                          news_summary_date=news_summary_date,
+                          news_summary_dates=news_summary_dates)
+
+@app.route('/api/news_search')
+def news_search_data():
+    """API endpoint for ranked full-text news search (?q=...&ticker=&from=YYYY-MM-DD&to=YYYY-MM-DD&limit=)"""
+    query = request.args.get('q', '').strip()
+    if not query:
+        return jsonify({'error': 'Missing search query (q)'})
+    limit = min(max(request.args.get('limit', 20, type=int), 1), 100)
+    start = datetime.now()
+    results = news_search.search(
+        query,
+        ticker=request.args.get('ticker') or None,
+        date_from=request.args.get('from') or None,
+        date_to=request.args.get('to') or None,
+        limit=limit,
+        offset=max(request.args.get('offset', 0, type=int), 0)
+    )
+    elapsed_ms = (datetime.now() - start).total_seconds() * 1000
+    return jsonify({'query': query, 'count': len(results), 'elapsed_ms': round(elapsed_ms, 2), 'results': results})
+
+@app.route('/api/news_summary/<ticker>/<date>')
+def news_summary_data(ticker, date):
+    """API endpoint for the news summary of a ticker on a given date"""
+    summary = summary_store.get(ticker, date)
+    if summary is None:
+        return jsonify({'error': f'No news summary for {ticker} on {date}'})
+    return jsonify(summary)
 
 @app.route('/api/stock_chart/<ticker>')
 def stock_chart_data(ticker):
-    """API endpoint for stock chart data"""
+    """API endpoint for stock chart data (?timeframe=daily|weekly|monthly)"""
+    timeframe = request.args.get('timeframe', 'daily')
+    if timeframe not in TIMEFRAMES:
+        return jsonify({'error': f'Unsupported timeframe: {timeframe}'})
+    
     stock_data = load_pickle('stock_data.pkl')
     if not stock_data or 'stocks' not in stock_data or ticker not in stock_data['stocks']:
         return jsonify({'error': 'Stock data not available'})
@@ -302,6 +347,7 @@ def stock_chart_data(ticker):
     # Convert to list of dictionaries for JSON
     history = ticker_data['history']
     if isinstance(history, pd.DataFrame):
+        history = timeframe_cache.get(ticker, history, timeframe)
         # Reset index to make date a column
         history = history.reset_index()
         # Convert to records format
@@ -315,18 +361,14 @@ def stock_chart_data(ticker):
 def refresh_summary(ticker):
     """Generate a fresh news summary for a ticker"""
     # Load news data
-    news_data_history = load_pickle('news_data.pkl')
-    if news_data_history:
-        latest_date = max(news_data_history.keys()) if news_data_history.keys() else None
-        news_data = news_data_history[latest_date] if latest_date else {}
-    articles = news_data.get(ticker, []) if news_data else []
+    articles = news_archive.latest(ticker).get(ticker, [])
     
     if not articles:
         flash(f"No news articles found for {ticker}.", "warning")
         return redirect(url_for('stock_detail', ticker=ticker))
     
     # Initialize the news summarizer
-    summarizer = NewsSummarizer()
+    summarizer = NewsSummarizer(store=summary_store)
     
     # Generate the summary
     summary = summarizer.summarize_news(ticker, articles)
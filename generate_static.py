@@ -11,7 +11,7 @@ def check_data_freshness():
     data_files = {
         'stock_data': 'data/stock_data.pkl',
         'investor_data': 'data/investor_data.pkl', 
-        'news_data': 'data/news_data.pkl',
+        'news_data': 'data/news_archive.db',
         'fundamentals_data': 'data/fundamentals_data.pkl',
         'recommendations': 'data/recommendations.pkl'
     }
@@ -0,0 +1,336 @@
+import os
+import json
+import pickle
+from collections import deque
+from datetime import datetime
+from src.config import ALERTS_LOG, DATA_DIR, INDICATOR_WINDOWS
+
+
+class AlertRule:
+    """A named condition evaluated on two consecutive snapshots of a single symbol
+
+    source is either 'bar' (snapshots built from daily bars) or 'recommendation'
+    (entries of the recommendations dict). condition(prev, curr) returns True
+    when the alert should fire; message is formatted with ticker, prev and curr.
+    """
+
+    def __init__(self, name, source, condition, message):
+        self.name = name
+        self.source = source
+        self.condition = condition
+        self.message = message
+
+    def evaluate(self, ticker, prev, curr):
+        """Return an alert dict if the rule fires for this transition, otherwise None"""
+        try:
+            fired = self.condition(prev, curr)
+        except (TypeError, KeyError):
+            fired = False
+        if not fired:
+            return None
+        try:
+            message = self.message.format(ticker=ticker, prev=prev, curr=curr)
+        except (KeyError, IndexError, TypeError, ValueError):
+            message = f"{ticker}: {self.name}"
+        return {
+            'rule': self.name,
+            'ticker': ticker,
+            'message': message,
+            'triggered_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+
+
+def _resolve(snapshot, ref):
+    """Resolve a threshold that is either a constant or another field of the snapshot"""
+    return snapshot.get(ref) if isinstance(ref, str) else ref
+
+
+def crossed_below(name, field, level, message, source='bar'):
+    """Rule that fires when field moves from at/above level to below it"""
+    def condition(prev, curr):
+        before, after = prev.get(field), curr.get(field)
+        before_level, after_level = _resolve(prev, level), _resolve(curr, level)
+        if None in (before, after, before_level, after_level):
+            return False
+        return before >= before_level and after < after_level
+    return AlertRule(name, source, condition, message)
+
+
+def crossed_above(name, field, level, message, source='bar'):
+    """Rule that fires when field moves from at/below level to above it"""
+    def condition(prev, curr):
+        before, after = prev.get(field), curr.get(field)
+        before_level, after_level = _resolve(prev, level), _resolve(curr, level)
+        if None in (before, after, before_level, after_level):
+            return False
+        return before <= before_level and after > after_level
+    return AlertRule(name, source, condition, message)
+
+
+def changed(name, field, message, from_values=None, to_values=None, source='recommendation'):
+    """Rule that fires when field changes value, optionally restricted to given from/to values"""
+    def condition(prev, curr):
+        before, after = prev.get(field), curr.get(field)
+        if before == after:
+            return False
+        if from_values is not None and before not in from_values:
+            return False
+        if to_values is not None and after not in to_values:
+            return False
+        return True
+    return AlertRule(name, source, condition, message)
+
+
+DEFAULT_RULES = [
+    crossed_below('rsi_below_30', 'rsi', 30,
+                  "{ticker} RSI crossed below 30 ({curr[rsi]:.1f})"),
+    crossed_above('rsi_above_30', 'rsi', 30,
+                  "{ticker} RSI crossed back above 30 ({curr[rsi]:.1f})"),
+    crossed_above('rsi_above_70', 'rsi', 70,
+                  "{ticker} RSI crossed above 70 ({curr[rsi]:.1f})"),
+    crossed_below('close_below_ma200', 'latest_close', 'ma200',
+                  "{ticker} close {curr[latest_close]:.2f} broke below MA200 {curr[ma200]:.2f}"),
+    crossed_above('close_above_ma200', 'latest_close', 'ma200',
+                  "{ticker} close {curr[latest_close]:.2f} broke above MA200 {curr[ma200]:.2f}"),
+    changed('recommendation_changed', 'final_recommendation',
+            "{ticker} recommendation changed from {prev[final_recommendation]} to {curr[final_recommendation]} "
+            "(score {prev[score]} -> {curr[score]})")
+]
+
+
+class IncrementalIndicators:
+    """O(1)-per-bar moving averages and RSI for one symbol, matching analyze_price_trends"""
+
+    def __init__(self, windows=None):
+        windows = dict(INDICATOR_WINDOWS, **(windows or {}))
+        self.short_window = windows['ma_short']
+        self.long_window = windows['ma_long']
+        self.rsi_window = windows['rsi']
+        self.closes = deque(maxlen=max(self.short_window, self.long_window))
+        self.short_sum = 0.0
+        self.long_sum = 0.0
+        self.gains = deque(maxlen=self.rsi_window)
+        self.losses = deque(maxlen=self.rsi_window)
+        self.gain_sum = 0.0
+        self.loss_sum = 0.0
+        self.last_close = None
+
+    def update(self, close):
+        """Add one closing price and return the current indicator snapshot"""
+        close = float(close)
+
+        # Drop values leaving each window before appending the new close
+        if len(self.closes) >= self.short_window:
+            self.short_sum -= self.closes[-self.short_window]
+        if len(self.closes) >= self.long_window:
+            self.long_sum -= self.closes[-self.long_window]
+        self.closes.append(close)
+        self.short_sum += close
+        self.long_sum += close
+
+        delta = close - self.last_close if self.last_close is not None else 0.0
+        if len(self.gains) == self.rsi_window:
+            self.gain_sum -= self.gains[0]
+            self.loss_sum -= self.losses[0]
+        self.gains.append(max(delta, 0.0))
+        self.losses.append(max(-delta, 0.0))
+        self.gain_sum += self.gains[-1]
+        self.loss_sum += self.losses[-1]
+        self.last_close = close
+
+        return self.snapshot()
+
+    def snapshot(self):
+        """Current values using the same keys as analyze_price_trends"""
+        count = len(self.closes)
+        rsi = None
+        if len(self.gains) == self.rsi_window:
+            if self.loss_sum > 0:
+                rsi = 100 - (100 / (1 + self.gain_sum / self.loss_sum))
+            elif self.gain_sum > 0:
+                rsi = 100.0
+        return {
+            'latest_close': self.last_close,
+            'ma50': self.short_sum / self.short_window if count >= self.short_window else None,
+            'ma200': self.long_sum / self.long_window if count >= self.long_window else None,
+            'rsi': rsi
+        }
+
+
+class PrintAlertSink:
+    """Print triggered alerts to stdout"""
+
+    def send(self, alert):
+        print(f"ALERT [{alert['rule']}] {alert['message']}")
+
+
+class FileAlertSink:
+    """Append triggered alerts to a local file as JSON lines"""
+
+    def __init__(self, filepath=ALERTS_LOG):
+        self.filepath = filepath
+        os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
+
+    def send(self, alert):
+        with open(self.filepath, 'a') as f:
+            f.write(json.dumps(alert, default=str) + "\n")
+
+
+class AlertEngine:
+    """Evaluate registered rules incrementally as new bars and recommendation snapshots arrive
+
+    Per-symbol state (rolling indicator sums, last processed bar and the last
+    snapshot per source) is kept between calls, so each update only touches
+    the symbols that actually received new data.
+    """
+
+    def __init__(self, rules=None, sinks=None, data_dir=DATA_DIR, indicator_windows=None):
+        self.rules = list(DEFAULT_RULES if rules is None else rules)
+        self.sinks = sinks if sinks is not None else [PrintAlertSink(), FileAlertSink()]
+        self.data_dir = data_dir
+        self.indicator_windows = indicator_windows
+        self.state_file = os.path.join(data_dir, "alert_state.pkl")
+        self.indicators = {}
+        self.last_bar = {}
+        self.snapshots = {'bar': {}, 'recommendation': {}}
+        self._mtimes = {}
+
+    def register(self, rule):
+        """Register an additional AlertRule"""
+        self.rules.append(rule)
+        return rule
+
+    def _evaluate(self, source, ticker, curr):
+        """Run the rules for one source against the stored and new snapshot of a ticker"""
+        prev = self.snapshots[source].get(ticker)
+        self.snapshots[source][ticker] = curr
+        if prev is None:
+            return []
+
+        alerts = []
+        for rule in self.rules:
+            if rule.source != source:
+                continue
+            alert = rule.evaluate(ticker, prev, curr)
+            if alert:
+                alerts.append(alert)
+                for sink in self.sinks:
+                    try:
+                        sink.send(alert)
+                    except Exception as e:
+                        print(f"Error sending alert to {type(sink).__name__}: {e}")
+        return alerts
+
+    def on_bar(self, ticker, timestamp, close):
+        """Feed one new daily bar for a ticker and evaluate the bar rules"""
+        last = self.last_bar.get(ticker)
+        if last is not None and timestamp <= last:
+            return []
+        if ticker not in self.indicators:
+            self.indicators[ticker] = IncrementalIndicators(self.indicator_windows)
+        snapshot = self.indicators[ticker].update(close)
+        self.last_bar[ticker] = timestamp
+        return self._evaluate('bar', ticker, snapshot)
+
+    def on_stock_data(self, stock_data):
+        """Feed only the bars newer than the last one processed for each ticker
+
+        A ticker seen for the first time is warmed up silently from its full
+        history, so alerts start on the next bar rather than replaying the past.
+        """
+        alerts = []
+        for ticker, data in (stock_data or {}).get('stocks', {}).items():
+            hist = data.get('history') if isinstance(data, dict) else None
+            if hist is None or not hasattr(hist, 'index') or len(hist) == 0:
+                continue
+
+            last = self.last_bar.get(ticker)
+            if last is None:
+                indicators = IncrementalIndicators(self.indicator_windows)
+                for close in hist['Close'].dropna():
+                    indicators.update(close)
+                self.indicators[ticker] = indicators
+                self.last_bar[ticker] = hist.index[-1]
+                self.snapshots['bar'][ticker] = indicators.snapshot()
+                continue
+
+            new_bars = hist[hist.index > last]['Close'].dropna()
+            for timestamp, close in new_bars.items():
+                alerts.extend(self.on_bar(ticker, timestamp, close))
+        return alerts
+
+    def on_recommendations(self, recommendations):
+        """Evaluate recommendation rules for tickers whose entry changed since the last snapshot"""
+        alerts = []
+        for ticker, recommendation in (recommendations or {}).items():
+            if not isinstance(recommendation, dict):
+                continue
+            if self.snapshots['recommendation'].get(ticker) == recommendation:
+                continue
+            alerts.extend(self._evaluate('recommendation', ticker, dict(recommendation)))
+        return alerts
+
+    def _changed_since_last_check(self, filepath):
+        """Return True if filepath was modified since the previous check"""
+        try:
+            mtime = os.path.getmtime(filepath)
+        except OSError:
+            return False
+        if self._mtimes.get(filepath) == mtime:
+            return False
+        self._mtimes[filepath] = mtime
+        return True
+
+    def check(self):
+        """Poll the data directory and evaluate only files that changed; cheap when nothing did"""
+        alerts = []
+        updated = False
+        stock_file = os.path.join(self.data_dir, "stock_data.pkl")
+        recommendations_file = os.path.join(self.data_dir, "recommendations.pkl")
+
+        try:
+            if self._changed_since_last_check(stock_file):
+                updated = True
+                with open(stock_file, 'rb') as f:
+                    alerts.extend(self.on_stock_data(pickle.load(f)))
+            if self._changed_since_last_check(recommendations_file):
+                updated = True
+                with open(recommendations_file, 'rb') as f:
+                    alerts.extend(self.on_recommendations(pickle.load(f)))
+        except Exception as e:
+            print(f"Error checking alerts: {e}")
+
+        if updated:
+            self.save_state()
+        return alerts
+
+    def save_state(self):
+        """Persist per-symbol state so a restart does not re-fire or miss alerts"""
+        state = {
+            'indicators': self.indicators,
+            'last_bar': self.last_bar,
+            'snapshots': self.snapshots,
+            'mtimes': self._mtimes
+        }
+        try:
+            os.makedirs(os.path.dirname(self.state_file) or '.', exist_ok=True)
+            with open(self.state_file, 'wb') as f:
+                pickle.dump(state, f)
+        except Exception as e:
+            print(f"Error saving alert state: {e}")
+
+    def load_state(self):
+        """Load previously saved per-symbol state, if any"""
+        if not os.path.exists(self.state_file):
+            return False
+        try:
+            with open(self.state_file, 'rb') as f:
+                state = pickle.load(f)
+            self.indicators = state.get('indicators', {})
+            self.last_bar = state.get('last_bar', {})
+            self.snapshots = state.get('snapshots', {'bar': {}, 'recommendation': {}})
+            self._mtimes = state.get('mtimes', {})
+            return True
+        except Exception as e:
+            print(f"Error loading alert state: {e}")
+            return False
@@ -0,0 +1,168 @@
+import os
+import json
+import zlib
+import pickle
+import sqlite3
+import hashlib
+from contextlib import closing
+from src.config import NEWS_ARCHIVE_DB, NEWS_ARCHIVE_COMPRESSION, DATA_DIR
+
+
+class ArticleArchive:
+    """Content-addressed SQLite archive of scraped news, replacing news_data.pkl
+
+    Article bodies (full_content) are stored once, zlib-compressed and keyed
+    by their SHA-256, however many dates and tickers list them. Each daily
+    snapshot is a small index of (date, ticker, position) rows holding the
+    article's compressed metadata (headline, summary, link, ...) and the hash
+    of its body. Saving a snapshot only writes bodies that are new, and
+    reading one date does not load the rest of the history. On first use,
+    the legacy news_data.pkl history is imported.
+    """
+
+    def __init__(self, path=NEWS_ARCHIVE_DB, legacy_path=os.path.join(DATA_DIR, 'news_data.pkl'),
+                 compression=NEWS_ARCHIVE_COMPRESSION):
+        self.path = path
+        self.compression = compression
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        is_new = not os.path.exists(path)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS bodies (
+                    hash BLOB PRIMARY KEY,
+                    body BLOB NOT NULL
+                ) WITHOUT ROWID
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS snapshots (
+                    date TEXT NOT NULL,
+                    ticker TEXT NOT NULL,
+                    position INTEGER NOT NULL,
+                    body_hash BLOB,
+                    meta BLOB NOT NULL,
+                    PRIMARY KEY (date, ticker, position)
+                ) WITHOUT ROWID
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS snapshots_ticker ON snapshots (ticker, date)")
+        if is_new and legacy_path and os.path.exists(legacy_path):
+            self.import_pickle(legacy_path)
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    @staticmethod
+    def body_hash(body):
+        return hashlib.sha256(body.encode('utf-8')).digest()
+
+    def _pack(self, value):
+        return zlib.compress(json.dumps(value, default=str).encode('utf-8'), self.compression)
+
+    @staticmethod
+    def _unpack(blob):
+        return json.loads(zlib.decompress(blob).decode('utf-8'))
+
+    def _snapshot_rows(self, date, news_data, bodies):
+        rows = []
+        for ticker, articles in news_data.items():
+            for position, article in enumerate(articles or []):
+                meta = {key: value for key, value in article.items() if key != 'full_content'}
+                body = article.get('full_content')
+                digest = None
+                if body is not None:
+                    digest = self.body_hash(body)
+                    bodies.setdefault(digest, body)
+                rows.append((date, ticker, position, digest, self._pack(meta)))
+        return rows
+
+    def put_snapshots(self, history):
+        """Store {date: {ticker: [articles]}}, replacing those dates; returns the number of new bodies"""
+        bodies = {}
+        rows = []
+        for date, news_data in history.items():
+            rows.extend(self._snapshot_rows(date, news_data or {}, bodies))
+        with closing(self._connect()) as conn, conn:
+            known = set()
+            digests = list(bodies)
+            for i in range(0, len(digests), 500):
+                chunk = digests[i:i + 500]
+                known.update(row[0] for row in conn.execute(
+                    f"SELECT hash FROM bodies WHERE hash IN ({','.join('?' * len(chunk))})", chunk))
+            new_bodies = [(digest, zlib.compress(body.encode('utf-8'), self.compression))
+                          for digest, body in bodies.items() if digest not in known]
+            conn.executemany("INSERT OR IGNORE INTO bodies (hash, body) VALUES (?, ?)", new_bodies)
+            conn.executemany("DELETE FROM snapshots WHERE date = ?", [(date,) for date in history])
+            conn.executemany(
+                "INSERT INTO snapshots (date, ticker, position, body_hash, meta) VALUES (?, ?, ?, ?, ?)", rows
+            )
+        return len(new_bodies)
+
+    def put_snapshot(self, date, news_data):
+        """Store one date's {ticker: [articles]}, replacing any snapshot for that date"""
+        return self.put_snapshots({date: news_data})
+
+    def _load(self, where, params):
+        """Rebuild {date: {ticker: [articles]}} for the snapshot rows matching where"""
+        history = {}
+        with closing(self._connect()) as conn:
+            rows = conn.execute(f"""
+                SELECT s.date, s.ticker, s.meta, b.body
+                FROM snapshots s LEFT JOIN bodies b ON b.hash = s.body_hash
+                WHERE {where}
+                ORDER BY s.date, s.ticker, s.position
+            """, params).fetchall()
+        for date, ticker, meta, body in rows:
+            article = self._unpack(meta)
+            if body is not None:
+                article['full_content'] = zlib.decompress(body).decode('utf-8')
+            history.setdefault(date, {}).setdefault(ticker, []).append(article)
+        return history
+
+    def dates(self):
+        """Dates with a snapshot, newest first"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT DISTINCT date FROM snapshots ORDER BY date DESC").fetchall()
+        return [row[0] for row in rows]
+
+    def latest_date(self):
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT MAX(date) FROM snapshots").fetchone()
+        return row[0]
+
+    def snapshot(self, date, ticker=None):
+        """{ticker: [articles]} saved on date, optionally only for one ticker"""
+        if date is None:
+            return {}
+        if ticker is None:
+            return self._load("s.date = ?", (date,)).get(date, {})
+        return self._load("s.date = ? AND s.ticker = ?", (date, ticker)).get(date, {})
+
+    def latest(self, ticker=None):
+        """The latest snapshot as {ticker: [articles]} (like news_data[max(news_data)])"""
+        return self.snapshot(self.latest_date(), ticker)
+
+    def latest_by_ticker(self):
+        """Each ticker's articles from the most recent date that has any"""
+        stored = {}
+        history = self._load("s.date = (SELECT MAX(date) FROM snapshots s2 WHERE s2.ticker = s.ticker)", ())
+        for date in sorted(history):
+            stored.update(history[date])
+        return stored
+
+    def history(self):
+        """The whole archive as {date: {ticker: [articles]}}, the old news_data.pkl layout"""
+        return self._load("1", ())
+
+    def import_pickle(self, pickle_path):
+        """Import a legacy {date: {ticker: [articles]}} news_data pickle"""
+        try:
+            with open(pickle_path, 'rb') as f:
+                history = pickle.load(f)
+        except Exception as e:
+            print(f"Error reading legacy news data {pickle_path}: {e}")
+            return 0
+        history = {date: news_data for date, news_data in (history or {}).items() if isinstance(news_data, dict)}
+        new_bodies = self.put_snapshots(history)
+        print(f"Imported {len(history)} news snapshots ({new_bodies} unique article bodies) "
+              f"from {pickle_path} into {self.path}")
+        return len(history)
@@ -0,0 +1,105 @@
+import math
+import numpy as np
+from collections import Counter
+from src.config import NEWS_TOPIC_SIMILARITY, NEWS_DIGEST_MAX_SUMMARIES, STOPWORDS
+from src.keyword_sentiment import tokenize
+from src.article_dedup import ArticleDeduplicator
+
+
+class TopicClusterer:
+    """Group a ticker's articles into topics and build one digest article per topic
+
+    Articles become L2-normalised TF-IDF vectors over their headline, summary
+    and body (numpy, vocabulary built per call). Clustering is a single greedy
+    pass: each article joins the topic whose centroid it is most similar to
+    if the cosine similarity reaches similarity, otherwise it starts a new
+    topic. With a ticker's handful of articles this is effectively instant.
+
+    A digest keeps the body of the most central article and adds the other
+    headlines and distinct summaries to its summary, so the summarizer sees
+    each event once.
+    """
+
+    def __init__(self, similarity=NEWS_TOPIC_SIMILARITY, max_summaries=NEWS_DIGEST_MAX_SUMMARIES):
+        self.similarity = similarity
+        self.max_summaries = max_summaries
+
+    def vectors(self, articles):
+        """TF-IDF matrix (articles x terms) with unit-length rows"""
+        docs = [
+            [t for t in tokenize(ArticleDeduplicator.article_text(article)) if t not in STOPWORDS and len(t) > 1]
+            for article in articles
+        ]
+        vocabulary = {term: i for i, term in enumerate(sorted({t for doc in docs for t in doc}))}
+        matrix = np.zeros((len(docs), len(vocabulary)))
+        for row, doc in enumerate(docs):
+            for term, count in Counter(doc).items():
+                matrix[row, vocabulary[term]] = 1 + math.log(count)
+        document_frequency = np.count_nonzero(matrix, axis=0)
+        matrix *= np.log((1 + len(docs)) / (1 + document_frequency)) + 1
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.where(norms == 0, 1, norms)
+
+    def cluster(self, articles):
+        """Lists of article indices, one per topic, in order of first appearance"""
+        return self.cluster_vectors(self.vectors(articles)) if articles else []
+
+    def cluster_vectors(self, vectors):
+        """Greedy centroid clustering of unit-length row vectors"""
+        clusters, centroids = [], []
+        for i, vector in enumerate(vectors):
+            if centroids:
+                scores = np.array(centroids) @ vector
+                best = int(np.argmax(scores))
+                if scores[best] >= self.similarity:
+                    clusters[best].append(i)
+                    centroid = vectors[clusters[best]].mean(axis=0)
+                    norm = np.linalg.norm(centroid)
+                    centroids[best] = centroid / norm if norm else centroid
+                    continue
+            clusters.append([i])
+            centroids.append(vector)
+        return clusters
+
+    def digest(self, articles, members, vectors):
+        """Combine one topic's articles into a single article dict"""
+        if len(members) == 1:
+            return articles[members[0]]
+        centroid = vectors[members].mean(axis=0)
+        lead = members[int(np.argmax(vectors[members] @ centroid))]
+        others = [articles[i] for i in members if i != lead]
+        main = articles[lead]
+
+        summaries = []
+        for article in [main] + others:
+            summary = (article.get('summary') or '').strip()
+            if summary and summary not in summaries:
+                summaries.append(summary)
+        headlines = [str(a.get('headline', '')) for a in others if a.get('headline')]
+        sources = sorted({str(a.get('source', '')) for a in [main] + others} - {''})
+        dates = sorted(str(a.get('date', '')) for a in [main] + others if a.get('date'))
+
+        summary = " ".join(summaries[:self.max_summaries])
+        if headlines:
+            summary += " Also reported: " + "; ".join(headlines)
+        return dict(
+            main,
+            date=f"{dates[0]} to {dates[-1]}" if dates and dates[0] != dates[-1] else main.get('date', 'Unknown date'),
+            source=", ".join(sources) or main.get('source', 'Unknown source'),
+            summary=summary.strip(),
+            topic_size=len(members)
+        )
+
+    def digests(self, articles):
+        """Return (digest articles, report) with one digest per topic"""
+        if not articles:
+            return [], {'articles': 0, 'topics': 0, 'largest_topic': 0}
+        vectors = self.vectors(articles)
+        clusters = self.cluster_vectors(vectors)
+        digests = [self.digest(articles, members, vectors) for members in clusters]
+        report = {
+            'articles': len(articles),
+            'topics': len(clusters),
+            'largest_topic': max((len(members) for members in clusters), default=0)
+        }
+        return digests, report
@@ -0,0 +1,91 @@
+import math
+from src.config import (COMPANY_NAMES, SENTIMENT_LEXICON, NEWS_COMPRESSION_AGGRESSIVENESS,
+                        NEWS_COMPRESSED_ARTICLE_TOKENS, CHARS_PER_TOKEN)
+from src.keyword_sentiment import KeywordAutomaton, tokenize
+from src.article_packer import SENTENCE_SPLIT, HAS_NUMBER, estimate_tokens
+
+
+class ArticleCompressor:
+    """Keep only the key sentences of each article's full_content before prompting
+
+    Sentences are scored locally: figures (the prompt asks for numbers),
+    mentions of the ticker or company name, and sentiment-bearing lexicon
+    terms. The lede is always kept (cut short if it exceeds the budget on its
+    own), then the highest scoring sentences, in their original order, until
+    the article reaches its budget: (1 - aggressiveness) of its original
+    size, capped at max_tokens. Sentences with none of those signals are
+    dropped. aggressiveness 0 disables compression; headline and summary are
+    never changed.
+    """
+
+    def __init__(self, aggressiveness=NEWS_COMPRESSION_AGGRESSIVENESS, max_tokens=NEWS_COMPRESSED_ARTICLE_TOKENS,
+                 company_names=None, lexicon=None, chars_per_token=CHARS_PER_TOKEN):
+        if not 0 <= aggressiveness < 1:
+            raise ValueError(f"aggressiveness must be in [0, 1), got {aggressiveness}")
+        self.aggressiveness = aggressiveness
+        self.max_tokens = max_tokens
+        self.company_names = COMPANY_NAMES if company_names is None else company_names
+        self.automaton = KeywordAutomaton(dict(SENTIMENT_LEXICON if lexicon is None else lexicon))
+        self.chars_per_token = chars_per_token
+
+    def _mention_tokens(self, ticker):
+        """Lowercase token sequences that refer to the company"""
+        names = [ticker] + list(self.company_names.get(ticker, []))
+        return [tuple(tokenize(name)) for name in names if tokenize(name)]
+
+    def score_sentence(self, sentence, mentions):
+        tokens = tokenize(sentence)
+        score = 0.0
+        if HAS_NUMBER.search(sentence):
+            score += 2.0
+        joined = " " + " ".join(tokens) + " "
+        if any(" " + " ".join(mention) + " " in joined for mention in mentions):
+            score += 1.5
+        score += min(sum(abs(weight) for _, weight in self.automaton.matches(tokens)), 2.0)
+        return score
+
+    def compress_text(self, text, ticker):
+        """Return the compressed text of one full_content field"""
+        text = text or ''
+        original_tokens = estimate_tokens(text, self.chars_per_token)
+        budget = min(self.max_tokens, int(math.ceil(original_tokens * (1 - self.aggressiveness))))
+        if self.aggressiveness == 0 or original_tokens <= budget:
+            return text
+
+        sentences = [s.strip() for s in SENTENCE_SPLIT.split(text) if s.strip()]
+        if not sentences:
+            return ''
+        room_chars = budget * self.chars_per_token
+        # The lede is always kept; on its own it is cut to the budget like ArticlePacker.truncate_article does
+        if len(sentences[0]) > room_chars:
+            return sentences[0][:max(0, room_chars - len(" [...]"))].rstrip() + " [...]"
+
+        mentions = self._mention_tokens(ticker)
+        scored = [(self.score_sentence(s, mentions), i) for i, s in enumerate(sentences) if i > 0]
+        ranked = sorted((item for item in scored if item[0] > 0), key=lambda item: (-item[0], item[1]))
+
+        keep, used = [0], len(sentences[0])
+        for _, i in ranked:
+            if used + len(sentences[i]) + 1 > room_chars:
+                continue
+            keep.append(i)
+            used += len(sentences[i]) + 1
+        return " ".join(sentences[i] for i in sorted(keep))
+
+    def compress(self, articles, ticker):
+        """Return (compressed articles, report) where report gives the token counts and ratio"""
+        compressed = []
+        tokens_before = tokens_after = 0
+        for article in articles:
+            content = article.get('full_content', '') or ''
+            shorter = self.compress_text(content, ticker)
+            tokens_before += estimate_tokens(content, self.chars_per_token)
+            tokens_after += estimate_tokens(shorter, self.chars_per_token)
+            compressed.append(article if shorter == content else dict(article, full_content=shorter))
+        report = {
+            'articles': len(articles),
+            'content_tokens_before': tokens_before,
+            'content_tokens_after': tokens_after,
+            'compression_ratio': tokens_after / tokens_before if tokens_before else 1.0
+        }
+        return compressed, report
@@ -0,0 +1,119 @@
+import re
+import zlib
+import numpy as np
+from collections import defaultdict
+from src.config import NEWS_DEDUP_THRESHOLD, NEWS_DEDUP_NUM_PERM, NEWS_DEDUP_BANDS, NEWS_DEDUP_SHINGLE_SIZE
+from src.article_packer import estimate_tokens, format_article
+
+WORD_PATTERN = re.compile(r"[a-z0-9$%]+(?:['.][a-z0-9]+)*")
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+
+
+def shingles(text, size=NEWS_DEDUP_SHINGLE_SIZE):
+    """32-bit hashes of the overlapping word n-grams of text"""
+    words = WORD_PATTERN.findall((text or '').lower())
+    if len(words) < size:
+        grams = [" ".join(words)] if words else []
+    else:
+        grams = [" ".join(words[i:i + size]) for i in range(len(words) - size + 1)]
+    return np.unique(np.array([zlib.crc32(g.encode('utf-8')) for g in grams], dtype=np.uint64))
+
+
+class ArticleDeduplicator:
+    """Collapse near-duplicate articles (syndicated copies) with MinHash and LSH
+
+    Each article's headline, summary and body are shingled into word n-grams
+    and reduced to a MinHash signature, computed for all permutations at once
+    with numpy. Signatures are split into bands and bucketed (locality
+    sensitive hashing), so only articles sharing a band are compared; pairs
+    whose estimated Jaccard similarity reaches threshold are merged with
+    union-find. Each group keeps one representative, the copy with the most
+    text, annotated with how many copies it stands for.
+    """
+
+    def __init__(self, threshold=NEWS_DEDUP_THRESHOLD, num_perm=NEWS_DEDUP_NUM_PERM, bands=NEWS_DEDUP_BANDS,
+                 shingle_size=NEWS_DEDUP_SHINGLE_SIZE, seed=1):
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(1, MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+
+    @staticmethod
+    def article_text(article):
+        return " ".join(str(article.get(key, '') or '') for key in ('headline', 'summary', 'full_content'))
+
+    def signature(self, text):
+        """MinHash signature of text (num_perm values)"""
+        hashes = shingles(text, self.shingle_size)
+        if hashes.size == 0:
+            return np.full(self.num_perm, MAX_HASH, dtype=np.uint64)
+        # (a * x + b) mod p, truncated to 32 bits; uint64 wraps like the usual implementation
+        permuted = (np.outer(hashes, self._a) + self._b) % MERSENNE_PRIME & MAX_HASH
+        return permuted.min(axis=0)
+
+    def similarity(self, sig_a, sig_b):
+        """Estimated Jaccard similarity of two signatures"""
+        return float(np.mean(sig_a == sig_b))
+
+    def groups(self, articles):
+        """Indices of articles grouped by near-duplicate cluster, in first-seen order"""
+        signatures = [self.signature(self.article_text(article)) for article in articles]
+        parent = list(range(len(articles)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        buckets = defaultdict(list)
+        for i, sig in enumerate(signatures):
+            if not sig.size or sig[0] == MAX_HASH:
+                continue  # no text to compare
+            for band in range(self.bands):
+                key = (band, sig[band * self.rows:(band + 1) * self.rows].tobytes())
+                for j in buckets[key]:
+                    root_i, root_j = find(i), find(j)
+                    if root_i != root_j and self.similarity(sig, signatures[j]) >= self.threshold:
+                        parent[root_i] = root_j
+                buckets[key].append(i)
+
+        clusters = defaultdict(list)
+        for i in range(len(articles)):
+            clusters[find(i)].append(i)
+        return sorted(clusters.values(), key=lambda members: members[0])
+
+    def deduplicate(self, articles):
+        """Return (representatives, report) with one article per near-duplicate group
+
+        report has the article counts and the estimated prompt tokens before
+        and after, using the same estimate as the batch packer.
+        """
+        kept = []
+        for members in self.groups(articles):
+            best = max(members, key=lambda i: (len(self.article_text(articles[i])), -i))
+            article = articles[best]
+            if len(members) > 1:
+                sources = sorted({str(articles[i].get('source', '')) for i in members} - {''})
+                article = dict(article, duplicates=len(members) - 1, duplicate_sources=sources)
+            kept.append((min(members), article))
+        kept = [article for _, article in sorted(kept, key=lambda item: item[0])]
+
+        tokens_before = sum(estimate_tokens(format_article(i + 1, a)) for i, a in enumerate(articles))
+        tokens_after = sum(estimate_tokens(format_article(i + 1, a)) for i, a in enumerate(kept))
+        report = {
+            'articles_before': len(articles),
+            'articles_after': len(kept),
+            'duplicates_removed': len(articles) - len(kept),
+            'tokens_before': tokens_before,
+            'tokens_after': tokens_after,
+            'tokens_saved': tokens_before - tokens_after
+        }
+        return kept, report
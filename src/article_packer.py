@@ -0,0 +1,148 @@
+import re
+import math
+import hashlib
+from src.config import (NEWS_BATCH_PACKING, NEWS_BATCH_TOKEN_BUDGET, NEWS_MAX_ARTICLES_PER_BATCH,
+                        CHARS_PER_TOKEN)
+
+SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+')
+HAS_NUMBER = re.compile(r'\d')
+
+
+def estimate_tokens(text, chars_per_token=CHARS_PER_TOKEN):
+    """Cheap token estimate from character count (no tokenizer dependency)"""
+    return int(math.ceil(len(text or '') / chars_per_token))
+
+
+def article_digest(article):
+    """Stable content hash of the article fields that go into the prompt"""
+    fields = [str(article.get(key, '')) for key in ('headline', 'date', 'source', 'summary', 'full_content')]
+    return hashlib.sha256("\0".join(fields).encode('utf-8')).hexdigest()
+
+
+def format_article(index, article):
+    """Render one article the way NewsSummarizer embeds it in the prompt"""
+    title = article.get('headline', 'Untitled')
+    date = article.get('date', 'Unknown date')
+    source = article.get('source', 'Unknown source')
+    summary = article.get('summary', '')
+    content = article.get('full_content', '')
+    return f"Article {index}: '{title}' - {date} ({source})\n{summary}\n{content}\n"
+
+
+class ArticlePacker:
+    """Pack articles into LLM requests by estimated token count instead of a fixed count
+
+    'ffd' packing sorts articles by size and places each in the first request
+    with room left (first-fit decreasing), which gives close to the minimum
+    number of requests. 'content' packing walks the articles in order and cuts
+    requests at content-defined boundaries, so unchanged runs of articles
+    produce identical prompts and keep hitting the summary cache. Both respect
+    the token budget and article cap, and truncate articles that would not fit
+    in a request on their own.
+    """
+
+    def __init__(self, token_budget=NEWS_BATCH_TOKEN_BUDGET, max_articles=NEWS_MAX_ARTICLES_PER_BATCH,
+                 strategy=NEWS_BATCH_PACKING, chars_per_token=CHARS_PER_TOKEN):
+        if strategy not in ('ffd', 'content'):
+            raise ValueError(f"Unknown packing strategy: {strategy}")
+        self.token_budget = token_budget
+        self.max_articles = max_articles
+        self.strategy = strategy
+        self.chars_per_token = chars_per_token
+
+    def article_tokens(self, article):
+        """Estimated prompt tokens for one formatted article"""
+        return estimate_tokens(format_article(99, article), self.chars_per_token)
+
+    def truncate_article(self, article, max_tokens):
+        """Shrink full_content so the article fits max_tokens
+
+        Headline and summary are always kept. The leading sentences of the
+        body (the lede) are kept first; remaining room goes to later sentences
+        that contain figures, since the prompt asks for specific numbers.
+        Original sentence order is preserved.
+        """
+        content = article.get('full_content', '') or ''
+        base_tokens = self.article_tokens(dict(article, full_content=''))
+        room_chars = max(0, (max_tokens - base_tokens - 2) * self.chars_per_token)
+        if len(content) <= room_chars:
+            return article
+
+        sentences = [s for s in SENTENCE_SPLIT.split(content) if s.strip()]
+        keep = set()
+        used = 0
+        # Lede first, in order, until a sentence no longer fits
+        for i, sentence in enumerate(sentences):
+            if used + len(sentence) + 1 > room_chars:
+                break
+            keep.add(i)
+            used += len(sentence) + 1
+        # Then any later sentences carrying numbers, while they fit
+        for i, sentence in enumerate(sentences):
+            if i in keep or not HAS_NUMBER.search(sentence):
+                continue
+            if used + len(sentence) + 1 <= room_chars:
+                keep.add(i)
+                used += len(sentence) + 1
+
+        truncated = " ".join(sentences[i] for i in sorted(keep))
+        if not truncated and room_chars:
+            truncated = content[:room_chars]
+        return dict(article, full_content=truncated + " [...]")
+
+    def _prepare(self, articles):
+        """Truncate oversized articles and return (position, article, tokens) triples"""
+        prepared = []
+        for position, article in enumerate(articles):
+            tokens = self.article_tokens(article)
+            if tokens > self.token_budget:
+                article = self.truncate_article(article, self.token_budget)
+                tokens = self.article_tokens(article)
+            prepared.append((position, article, tokens))
+        return prepared
+
+    def pack_ffd(self, articles):
+        """First-fit decreasing by estimated tokens; articles keep their original order within a request"""
+        items = self._prepare(articles)
+        # Ties broken by content hash so the same article set always packs the same way
+        items.sort(key=lambda item: (-item[2], article_digest(item[1])))
+
+        bins = []  # [remaining tokens, [(position, article), ...]]
+        for position, article, tokens in items:
+            for b in bins:
+                if b[0] >= tokens and len(b[1]) < self.max_articles:
+                    b[0] -= tokens
+                    b[1].append((position, article))
+                    break
+            else:
+                bins.append([self.token_budget - tokens, [(position, article)]])
+
+        batches = [sorted(members, key=lambda m: m[0]) for _, members in bins]
+        batches.sort(key=lambda members: members[0][0])
+        return [[article for _, article in members] for members in batches]
+
+    def pack_content_defined(self, articles, boundary_every=4):
+        """Sequential packing with content-defined cut points, capped by the token budget"""
+        batches, current, used = [], [], 0
+        min_size = max(1, boundary_every // 2)
+        for _, article, tokens in self._prepare(articles):
+            if current and (used + tokens > self.token_budget or len(current) >= self.max_articles):
+                batches.append(current)
+                current, used = [], 0
+            current.append(article)
+            used += tokens
+            boundary = int(article_digest(article)[:8], 16) % boundary_every == 0
+            if boundary and len(current) >= min_size:
+                batches.append(current)
+                current, used = [], 0
+        if current:
+            batches.append(current)
+        return batches
+
+    def pack(self, articles):
+        """Split articles into request batches using the configured strategy"""
+        if not articles:
+            return []
+        if self.strategy == 'content':
+            return self.pack_content_defined(articles)
+        return self.pack_ffd(articles)
@@ -0,0 +1,53 @@
+from selenium.webdriver.chrome.options import Options
+from src.config import NEWS_BLOCKED_URL_PATTERNS
+
+BROWSER_PROFILES = ('full', 'lean')
+
+
+def chrome_options(headless=True, profile='lean'):
+    """Chrome options for scraping
+
+    'full' is the original browser session. 'lean' also uses the eager page
+    load strategy (driver.get returns at DOMContentLoaded instead of waiting
+    for every subresource) and disables images; block_requests adds the CDP
+    URL blocking once the driver is running.
+    """
+    if profile not in BROWSER_PROFILES:
+        raise ValueError(f"Unknown browser profile: {profile}")
+    options = Options()
+    if headless:
+        options.add_argument("--headless")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+
+    if profile == 'lean':
+        options.page_load_strategy = 'eager'
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_argument("--mute-audio")
+        options.add_argument("--disable-background-networking")
+        options.add_argument("--disable-component-update")
+        options.add_argument("--disable-default-apps")
+        options.add_argument("--disable-sync")
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+            "profile.managed_default_content_settings.media_stream": 2
+        })
+    return options
+
+
+def block_requests(driver, patterns=NEWS_BLOCKED_URL_PATTERNS):
+    """Block requests matching URL patterns (with * wildcards) through the Chrome DevTools Protocol
+
+    Returns False if the driver does not support CDP commands.
+    """
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+        return True
+    except Exception as e:
+        print(f"Could not enable request blocking: {e}")
+        return False
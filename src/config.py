@@ -20,6 +20,28 @@ INVESTORS = {
 COMPANIES = ["AAPL", "MSFT", "AMZN", "GOOGL", "META", "TSLA", "BRK-B", "JPM", "V", "JNJ", "PLTR", "NVDA", "ASML", "QCOM", "INTC", "AMD", "MU", "TSM"]
 # COMPANIES = ["AAPL"]
 
+# Names the tracked companies go by in news text (the ticker itself always counts)
+COMPANY_NAMES = {
+    "AAPL": ["Apple"],
+    "MSFT": ["Microsoft"],
+    "AMZN": ["Amazon", "AWS"],
+    "GOOGL": ["Alphabet", "Google"],
+    "META": ["Meta Platforms", "Meta", "Facebook"],
+    "TSLA": ["Tesla"],
+    "BRK-B": ["Berkshire Hathaway", "Berkshire"],
+    "JPM": ["JPMorgan", "JPMorgan Chase", "JP Morgan"],
+    "V": ["Visa"],
+    "JNJ": ["Johnson & Johnson", "J&J"],
+    "PLTR": ["Palantir"],
+    "NVDA": ["Nvidia"],
+    "ASML": ["ASML"],
+    "QCOM": ["Qualcomm"],
+    "INTC": ["Intel"],
+    "AMD": ["AMD", "Advanced Micro Devices"],
+    "MU": ["Micron"],
+    "TSM": ["TSMC", "Taiwan Semiconductor"]
+}
+
 # List of commodities to track
 COMMODITIES = ["GC=F", "SI=F", "CL=F", "NG=F", "BTC-USD", "ETH-USD"]
 # COMMODITIES = ["GC=F"]
@@ -46,4 +68,220 @@ MAX_ARTICLES_PER_COMPANY = 20
 # Waiting time between requests (in seconds) to avoid rate limiting
 REQUEST_DELAY = 2
 
-DATA_DIR = 'data'
\ No newline at end of file
+DATA_DIR = 'data'
+
+# Indicator windows used by DecisionEngine.analyze_price_trends
+INDICATOR_WINDOWS = {
+    "ma_short": 50,
+    "ma_long": 200,
+    "rsi": 14,
+    "macd_fast": 12,
+    "macd_slow": 26,
+    "macd_signal": 9,
+    "bollinger": 20,
+    "volume": 50,
+    "pattern": 60,
+    "pattern_gap": 10
+}
+
+# Windows for the weekly and monthly trends, in bars of that timeframe (about the same spans as
+# the daily ones where the 1y history allows: 40 weeks ~ 200 days, 10 months ~ 200 days).
+# A ticker with fewer weekly/monthly bars than ma_long gets an 'INSUFFICIENT DATA' trend.
+# User-tuned indicator_windows only apply to the daily timeframe.
+TIMEFRAME_INDICATOR_WINDOWS = {
+    "weekly": {
+        "ma_short": 10, "ma_long": 40, "rsi": 14, "macd_fast": 12, "macd_slow": 26, "macd_signal": 9,
+        "bollinger": 20, "volume": 10, "pattern": 26, "pattern_gap": 3
+    },
+    "monthly": {
+        "ma_short": 3, "ma_long": 10, "rsi": 6, "macd_fast": 3, "macd_slow": 6, "macd_signal": 3,
+        "bollinger": 6, "volume": 6, "pattern": 11, "pattern_gap": 2
+    }
+}
+
+# Candidate windows evaluated by the indicator parameter sweep
+INDICATOR_SWEEP_GRID = {
+    "ma_short": [10, 20, 50, 100],
+    "ma_long": [100, 150, 200, 250],
+    "rsi": [7, 10, 14, 21, 28],
+    "macd_fast": [8, 12, 16],
+    "macd_slow": [21, 26, 34],
+    "macd_signal": [5, 9, 12],
+    "bollinger": [10, 20, 30, 50]
+}
+
+# Forward horizon (in trading days) used to score historical signal quality
+SIGNAL_HORIZON = 20
+
+# Triggered alerts are appended here as JSON lines
+ALERTS_LOG = 'data/alerts.log'
+
+# Words ignored when scoring sentence salience and building topic vectors
+STOPWORDS = set("""a an the and or but if of to in on at by for with from as is are was were be been being it its
+this that these those he she they we you i his her their our your not no so than then there here which who whom
+what when where why how will would can could should may might has have had do does did about after before over
+under into out up down more most less also just said says say new inc corp co ltd""".split())
+
+# Weighted lexicon for the local keyword sentiment scorer. Phrases are matched on
+# whole words (multi-word phrases allowed); positive weights are bullish.
+SENTIMENT_LEXICON = {
+    # Positive
+    "surge": 1.0, "surges": 1.0, "surged": 1.0, "surging": 1.0,
+    "jump": 1.0, "jumps": 1.0, "jumped": 1.0,
+    "gain": 1.0, "gains": 1.0, "gained": 1.0,
+    "rise": 0.5, "rises": 0.5, "rose": 0.5, "rising": 0.5,
+    "rally": 1.0, "rallies": 1.0, "rallied": 1.0,
+    "growth": 1.0, "grow": 0.5, "grows": 0.5, "grew": 0.5,
+    "profit": 0.5, "profits": 0.5, "profitable": 1.0,
+    "boost": 1.0, "boosts": 1.0, "boosted": 1.0,
+    "positive": 1.0, "success": 1.0, "successful": 1.0,
+    "strong": 1.0, "stronger": 1.0, "strength": 0.5,
+    "beat": 1.0, "beats": 1.0, "exceed": 1.0, "exceeds": 1.0, "exceeded": 1.0,
+    "beat expectations": 1.5, "record high": 1.5, "all-time high": 1.5,
+    "upgrade": 1.5, "upgrades": 1.5, "upgraded": 1.5,
+    "outperform": 1.0, "outperforms": 1.0, "bullish": 1.5,
+    "raises guidance": 2.0, "raised guidance": 2.0, "buyback": 1.0,
+    # Negative
+    "drop": -1.0, "drops": -1.0, "dropped": -1.0,
+    "fall": -1.0, "falls": -1.0, "fell": -1.0, "falling": -1.0,
+    "decline": -1.0, "declines": -1.0, "declined": -1.0,
+    "loss": -1.0, "losses": -1.0, "negative": -1.0,
+    "weak": -1.0, "weaker": -1.0, "weakness": -1.0,
+    "cut": -1.0, "cuts": -1.0, "miss": -1.0, "misses": -1.0, "missed": -1.0,
+    "below": -0.5, "trouble": -1.0, "risk": -0.5, "risks": -0.5,
+    "concern": -1.0, "concerns": -1.0,
+    "plunge": -1.5, "plunges": -1.5, "plunged": -1.5,
+    "slump": -1.5, "slumps": -1.5, "slumped": -1.5,
+    "downgrade": -1.5, "downgrades": -1.5, "downgraded": -1.5,
+    "bearish": -1.5, "lawsuit": -1.0, "investigation": -1.0, "layoffs": -1.0,
+    "missed expectations": -1.5, "cuts guidance": -2.0, "lowered guidance": -2.0
+}
+
+# NewsSummarizer: concurrent LLM batch requests and retry policy
+NEWS_SUMMARY_CONCURRENCY = 5
+NEWS_SUMMARY_MAX_RETRIES = 3
+NEWS_SUMMARY_RETRY_DELAY = 2
+
+# Content-addressed cache of LLM batch summaries
+SUMMARY_CACHE_DIR = 'data/summary_cache'
+SUMMARY_CACHE_TTL = 7 * 24 * 3600  # seconds
+SUMMARY_CACHE_MAX_ENTRIES = 5000
+
+# NewsSummarizer request packing: 'content' (content-defined boundaries) keeps unchanged runs of
+# articles in identical requests, so daily runs keep hitting the summary cache; 'ffd' (first-fit
+# decreasing) makes the fewest calls, but one added or removed article reshuffles every batch
+# and the cache, keyed by prompt, then misses on all of them
+NEWS_BATCH_PACKING = 'content'
+NEWS_BATCH_TOKEN_BUDGET = 6000  # estimated article tokens per request, excluding the prompt template
+NEWS_MAX_ARTICLES_PER_BATCH = 10
+CHARS_PER_TOKEN = 4
+
+# NewsSummarizer backend: 'together' (LLM API) or 'local' (offline extractive).
+# With the Together backend, batches that still fail after retries fall back to 'local'.
+NEWS_SUMMARY_BACKEND = 'together'
+NEWS_SUMMARY_FALLBACK_BACKEND = 'local'
+
+# SQLite store of news summaries keyed by (ticker, date)
+NEWS_SUMMARY_DB = 'data/news_summaries.db'
+
+# Stream LLM completions and parse the JSON as it arrives; abort when reasoning runs past the limit
+NEWS_SUMMARY_STREAM = True
+NEWS_SUMMARY_MAX_THINK_CHARS = 30000
+
+# Near-duplicate article removal before summarization (MinHash + LSH)
+NEWS_DEDUP = True
+NEWS_DEDUP_THRESHOLD = 0.8      # estimated Jaccard similarity of word shingles
+NEWS_DEDUP_NUM_PERM = 64
+NEWS_DEDUP_BANDS = 16           # 16 bands x 4 rows
+NEWS_DEDUP_SHINGLE_SIZE = 3
+
+# Key-sentence compression of article bodies before prompting. It is lossy (the model no longer
+# sees every sentence), so it is off by default: 0 keeps full_content as is; 0.6 keeps at most
+# 40% of each body
+NEWS_COMPRESSION_AGGRESSIVENESS = 0
+NEWS_COMPRESSED_ARTICLE_TOKENS = 600
+
+# Topic clustering: one digest per group of articles covering the same event
+NEWS_TOPIC_CLUSTERING = True
+NEWS_TOPIC_SIMILARITY = 0.35    # cosine similarity of TF-IDF vectors to join a topic
+NEWS_DIGEST_MAX_SUMMARIES = 3
+
+# News scraping: 'http' fetches Yahoo Finance pages directly (Selenium only as fallback), 'selenium' always uses Chrome
+NEWS_SCRAPER_MODE = 'http'
+NEWS_HTTP_TIMEOUT = 10
+NEWS_HTTP_WORKERS = 8
+
+# Tickers scraped in parallel. Each ticker runs its browser sources concurrently, so by default
+# the pool holds NEWS_TICKER_WORKERS browsers per source that needs one (4 with the default
+# sources in 'http' mode); a fixed NEWS_DRIVER_POOL_SIZE overrides that, and tickers then run
+# pool size // browser sources at a time. Browsers are only started when first needed.
+NEWS_TICKER_WORKERS = 2
+NEWS_DRIVER_POOL_SIZE = None
+NEWS_DRIVER_MAX_USES = 25
+
+# Per-site page readiness timeouts (seconds) used instead of fixed sleeps after navigation.
+# load: page load and readyState, element: key selector, consent: how long to look for a
+# consent dialog, idle: quiet period for network-idle waits on script-heavy pages
+PAGE_TIMEOUT_PROFILES = {
+    'default': {'load': 15, 'element': 10, 'consent': 2, 'idle': 0.5, 'network_idle': False},
+    'finance.yahoo.com': {'load': 15, 'element': 10, 'consent': 3},
+    'wsj.com': {'load': 20, 'element': 10, 'consent': 2},
+    'ft.com': {'load': 20, 'element': 10, 'consent': 3},
+    'marketwatch.com': {'load': 20, 'element': 15, 'consent': 2, 'network_idle': True},
+    'reuters.com': {'load': 20, 'element': 10, 'consent': 5, 'network_idle': True}
+}
+
+# Index of already-scraped article links so known articles are not fetched again
+NEWS_URL_INDEX_DB = 'data/seen_urls.db'
+NEWS_URL_BLOOM_CAPACITY = 100000
+NEWS_URL_BLOOM_ERROR_RATE = 0.001
+
+# Incremental news ingestion: scrape each source only down to the newest article already ingested
+NEWS_INCREMENTAL = True
+# Only listings sorted newest first can stop there; keyword searches ranked by relevance
+# (MarketWatch, WSJ, FT) are always scraped in full, relying on the URL index to skip known links
+NEWS_DATE_SORTED_SOURCES = ['Yahoo Finance', 'Reuters']
+
+# Content-addressed news archive: article bodies stored once, zlib-compressed (level 1-9)
+NEWS_ARCHIVE_DB = 'data/news_archive.db'
+NEWS_ARCHIVE_COMPRESSION = 6
+
+# Chrome profile for scraping: 'lean' loads pages eagerly without images and blocks the URL
+# patterns below over CDP, 'full' is a regular browser session
+NEWS_BROWSER_PROFILE = 'lean'
+NEWS_BLOCKED_URL_PATTERNS = [
+    # Non-essential resource types
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.mp4', '*.webm', '*.m3u8',
+    # Ad and tracker domains
+    '*doubleclick.net*', '*googlesyndication.com*', '*googletagmanager.com*', '*googletagservices.com*',
+    '*google-analytics.com*', '*adservice.google.com*', '*amazon-adsystem.com*', '*adnxs.com*',
+    '*criteo.com*', '*taboola.com*', '*outbrain.com*', '*scorecardresearch.com*', '*quantserve.com*',
+    '*chartbeat.com*', '*moatads.com*', '*pubmatic.com*', '*rubiconproject.com*', '*casalemedia.com*',
+    '*facebook.net*', '*hotjar.com*', '*segment.io*', '*optimizely.com*', '*permutive.com*'
+]
+
+# Full-text search over saved news: BM25 weights of headline, summary and article body matches
+NEWS_SEARCH_DB = 'data/news_search.db'
+NEWS_SEARCH_WEIGHTS = (10.0, 5.0, 1.0)
+
+# Sources collected concurrently for every ticker, and how long each may take (seconds) before it is skipped
+NEWS_COLLECT_SOURCES = ['Yahoo Finance', 'MarketWatch', 'Reuters']
+NEWS_SOURCE_DEADLINES = {
+    'Yahoo Finance': 60,
+    'Wall Street Journal': 45,
+    'Financial Times': 45,
+    'MarketWatch': 45,
+    'Reuters': 90
+}
+
+# Crawl frontier politeness budgets per domain: requests in flight at once, and minimum seconds
+# between request starts. Subdomains share their parent's budget; other hosts get 'default'
+CRAWL_DOMAIN_BUDGETS = {
+    'default': {'concurrency': 2, 'delay': 1.0},
+    'finance.yahoo.com': {'concurrency': 4, 'delay': 0.25},
+    'wsj.com': {'concurrency': 1, 'delay': 2.0},
+    'ft.com': {'concurrency': 1, 'delay': 2.0},
+    'marketwatch.com': {'concurrency': 2, 'delay': 1.0},
+    'reuters.com': {'concurrency': 2, 'delay': 1.0}
+}
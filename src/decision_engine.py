@@ -5,9 +5,13 @@ from scipy.signal import argrelextrema
 import pickle
 from datetime import datetime
 from src.news_summarizer import NewsSummarizer
+from src.config import INDICATOR_WINDOWS, TIMEFRAME_INDICATOR_WINDOWS
+from src.timeframes import TimeframeCache, PERIODS_PER_YEAR
+from src.keyword_sentiment import KeywordSentimentScorer
+from src.peer_groups import PeerGroupIndex
 
 class DecisionEngine:
-    def __init__(self, investor_data=None, news_data=None, stock_data=None, fundamentals_data=None):
+    def __init__(self, investor_data=None, news_data=None, stock_data=None, fundamentals_data=None, indicator_windows=None):
         self.investor_data = investor_data.get(max(investor_data.keys())) if investor_data else {}
         self.news_data = news_data.get(max(news_data.keys())) if news_data else {}        
         self.stock_data = stock_data or {}
@@ -15,6 +19,10 @@ class DecisionEngine:
         self.recommendations = {}
         self.news_summarizer = NewsSummarizer()
         self.news_summaries = {}
+        self.keyword_scorer = KeywordSentimentScorer()
+        self.indicator_windows = dict(INDICATOR_WINDOWS, **(indicator_windows or {}))
+        self.timeframe_cache = TimeframeCache()
+        self.trend_timeframes = ['weekly', 'monthly']
     
     def analyze_position_changes(self):
         """Analyze the significant position changes by investors"""
@@ -61,7 +69,7 @@ class DecisionEngine:
         return insights
     
     def analyze_news_sentiment(self):
-        """Analyze news sentiment using Together AI via NewsSummarizer"""
+        """Analyze news sentiment via NewsSummarizer (its configured backend, with its fallback)"""
         if not self.news_data:
             return {'error': 'No news data available'}
         
@@ -71,17 +79,20 @@ class DecisionEngine:
         if not hasattr(self, 'news_summarizer'):
             self.news_summarizer = NewsSummarizer()
         
+        # Local first pass over every article; also serves as the fallback below
+        keyword_sentiments = self.keyword_scorer.score_news_data(self.news_data)
+        
         for company, articles in self.news_data.items():
             if not articles:
                 continue
             
-            print(f"Analyzing news sentiment for {company} using Together AI...")
+            print(f"Analyzing news sentiment for {company}...")
             
             # Use the news summarizer to get a comprehensive analysis
             summary_result = self.news_summarizer.summarize_news(company, articles)
             
             # Extract sentiment from the summary result
-            if isinstance(summary_result, dict):
+            if isinstance(summary_result, dict) and summary_result.get('sentiment'):
                 sentiment_value = summary_result.get('sentiment', {})
                 print(sentiment_value)
                 # Standardize sentiment values
@@ -109,61 +120,21 @@ class DecisionEngine:
                     'positive_factors': positive_factors,
                     'negative_factors': negative_factors,
                     'price_impact': summary_result.get('price_impact', 'Unknown'),
-                    'article_count': len(articles)
+                    'summarizer': summary_result.get('backend'),
+                    'article_count': len(articles),
+                    'keyword_sentiment': keyword_sentiments.get(company, {}).get('sentiment'),
+                    'keyword_score': keyword_sentiments.get(company, {}).get('score')
                 }
             else:
-                # Fallback to the original keyword-based method if the API call fails
-                print(f"Warning: Together AI summarization failed for {company}. Falling back to keyword method.")
-                sentiments[company] = self._analyze_news_sentiment_keywords(articles)
+                # Every batch failed, including the summarizer's own fallback backend (if any)
+                print(f"Warning: no news summary for {company}, using keyword sentiment instead.")
+                sentiments[company] = keyword_sentiments.get(company) or self._analyze_news_sentiment_keywords(articles)
         
         return sentiments
 
     def _analyze_news_sentiment_keywords(self, articles):
-        """Legacy keyword-based sentiment analysis as a fallback"""
-        positive_keywords = ['surge', 'jump', 'gain', 'rise', 'growth', 'profit', 
-                            'boost', 'positive', 'success', 'strong', 'beat', 'exceed']
-        negative_keywords = ['drop', 'fall', 'decline', 'loss', 'negative', 'weak', 
-                            'cut', 'miss', 'below', 'trouble', 'risk', 'concern']
-        
-        positive_count = 0
-        negative_count = 0
-        neutral_count = 0
-        
-        for article in articles:
-            text = (article.get('headline', '') + ' ' + article.get('summary', '')).lower()
-            
-            pos_matches = sum(1 for word in positive_keywords if word in text)
-            neg_matches = sum(1 for word in negative_keywords if word in text)
-            
-            if pos_matches > neg_matches:
-                positive_count += 1
-            elif neg_matches > pos_matches:
-                negative_count += 1
-            else:
-                neutral_count += 1
-        
-        total = positive_count + negative_count + neutral_count
-        if total > 0:
-            sentiment_score = (positive_count - negative_count) / total
-            
-            if sentiment_score > 0.2:
-                sentiment = 'POSITIVE'
-            elif sentiment_score < -0.2:
-                sentiment = 'NEGATIVE'
-            else:
-                sentiment = 'NEUTRAL'
-        else:
-            sentiment = 'NEUTRAL'
-            sentiment_score = 0
-        
-        return {
-            'sentiment': sentiment,
-            'score': sentiment_score,
-            'positive_articles': positive_count,
-            'negative_articles': negative_count,
-            'neutral_articles': neutral_count,
-            'article_count': len(articles)
-        }
+        """Keyword-based sentiment analysis as a fallback, using the weighted lexicon automaton"""
+        return self.keyword_scorer.score_articles(articles)
     
     def analyze_fundamentals(self):
         """Analyze company fundamentals"""
@@ -221,11 +192,31 @@ class DecisionEngine:
         
         return analysis
     
-    def analyze_price_trends(self):
-        """Analyze price trends from stock data using multiple financial heuristics"""
+    def analyze_peer_groups(self, level='sector'):
+        """Compare each ticker against the median of its sector (or industry) peers"""
+        if not self.stock_data or 'stocks' not in self.stock_data:
+            return {'error': 'No stock price data available'}
+        
+        peer_index = PeerGroupIndex(self.stock_data, self.fundamentals_data)
+        return peer_index.analyze(level=level)
+    
+    def analyze_price_trends(self, timeframe='daily'):
+        """Analyze price trends from stock data using multiple financial heuristics
+
+        Args:
+            timeframe: 'daily', 'weekly' or 'monthly'. Weekly and monthly bars come from
+                the resampling cache and use TIMEFRAME_INDICATOR_WINDOWS, counted in those bars.
+                On those timeframes the trend is 'INSUFFICIENT DATA' with fewer bars than
+                the long moving average, and without enough bars for RSI and Bollinger
+                Bands the whole entry is. Daily results are unaffected.
+        """
         if not self.stock_data or 'stocks' not in self.stock_data:
             return {'error': 'No stock price data available'}
             
+        if timeframe == 'daily':
+            windows = self.indicator_windows
+        else:
+            windows = dict(INDICATOR_WINDOWS, **TIMEFRAME_INDICATOR_WINDOWS[timeframe])
         trends = {}
         for ticker, data in self.stock_data.get('stocks', {}).items():
             if 'history' not in data or data['history'].empty:
@@ -233,10 +224,23 @@ class DecisionEngine:
                 continue
                 
             hist = data['history']
+            if timeframe != 'daily':
+                # Work on a copy so indicator columns are not written into the cached frame
+                hist = self.timeframe_cache.get(ticker, hist, timeframe).copy()
+            
+            min_bars = max(windows['rsi'], windows['bollinger']) + 1
+            if timeframe != 'daily' and len(hist) < min_bars:
+                print(f"Only {len(hist)} {timeframe} bars for {ticker}, at least {min_bars} needed")
+                trends[ticker] = {
+                    'trend': 'INSUFFICIENT DATA',
+                    'recommendation': 'INSUFFICIENT DATA',
+                    'bars': len(hist)
+                }
+                continue
             
             # Calculate moving averages
-            hist['MA50'] = hist['Close'].rolling(window=50).mean()
-            hist['MA200'] = hist['Close'].rolling(window=200).mean()
+            hist['MA50'] = hist['Close'].rolling(window=windows['ma_short']).mean()
+            hist['MA200'] = hist['Close'].rolling(window=windows['ma_long']).mean()
             
             # Get latest values
             latest_close = hist['Close'].iloc[-1]
@@ -262,45 +266,47 @@ class DecisionEngine:
                 else:
                     trend = 'SIDEWAYS'
                     trend_strength = 'NEUTRAL'
+            elif timeframe != 'daily' and len(hist) < windows['ma_long']:
+                trend = 'INSUFFICIENT DATA'
             
             # Calculate volatility (using standard deviation of returns)
             returns = hist['Close'].pct_change().dropna()
-            volatility = returns.std() * np.sqrt(252)  # Annualized volatility
+            volatility = returns.std() * np.sqrt(PERIODS_PER_YEAR[timeframe])  # Annualized volatility
             
             # NEW: Calculate RSI (Relative Strength Index)
             delta = hist['Close'].diff()
             gain = delta.where(delta > 0, 0)
             loss = -delta.where(delta < 0, 0)
-            avg_gain = gain.rolling(window=14).mean()
-            avg_loss = loss.rolling(window=14).mean()
+            avg_gain = gain.rolling(window=windows['rsi']).mean()
+            avg_loss = loss.rolling(window=windows['rsi']).mean()
             rs = avg_gain / avg_loss
             hist['RSI'] = 100 - (100 / (1 + rs))
             latest_rsi = hist['RSI'].iloc[-1] if not pd.isna(hist['RSI'].iloc[-1]) else None
             
             # NEW: Calculate MACD
-            hist['EMA12'] = hist['Close'].ewm(span=12, adjust=False).mean()
-            hist['EMA26'] = hist['Close'].ewm(span=26, adjust=False).mean()
+            hist['EMA12'] = hist['Close'].ewm(span=windows['macd_fast'], adjust=False).mean()
+            hist['EMA26'] = hist['Close'].ewm(span=windows['macd_slow'], adjust=False).mean()
             hist['MACD'] = hist['EMA12'] - hist['EMA26']
-            hist['Signal'] = hist['MACD'].ewm(span=9, adjust=False).mean()
+            hist['Signal'] = hist['MACD'].ewm(span=windows['macd_signal'], adjust=False).mean()
             hist['MACD_Histogram'] = hist['MACD'] - hist['Signal']
             latest_macd = hist['MACD'].iloc[-1] if not pd.isna(hist['MACD'].iloc[-1]) else None
             latest_signal = hist['Signal'].iloc[-1] if not pd.isna(hist['Signal'].iloc[-1]) else None
             
             # NEW: Calculate Bollinger Bands
-            hist['BB_Middle'] = hist['Close'].rolling(window=20).mean()
-            hist['BB_Std'] = hist['Close'].rolling(window=20).std()
+            hist['BB_Middle'] = hist['Close'].rolling(window=windows['bollinger']).mean()
+            hist['BB_Std'] = hist['Close'].rolling(window=windows['bollinger']).std()
             hist['BB_Upper'] = hist['BB_Middle'] + (hist['BB_Std'] * 2)
             hist['BB_Lower'] = hist['BB_Middle'] - (hist['BB_Std'] * 2)
             bb_width = (hist['BB_Upper'].iloc[-1] - hist['BB_Lower'].iloc[-1]) / hist['BB_Middle'].iloc[-1]
             
             # NEW: Volume analysis
-            avg_volume = hist['Volume'].rolling(window=50).mean().iloc[-1]
+            avg_volume = hist['Volume'].rolling(window=windows['volume']).mean().iloc[-1]
             latest_volume = hist['Volume'].iloc[-1]
             volume_trend = 'HIGH' if latest_volume > avg_volume * 1.5 else 'NORMAL'
             
             # NEW: Beta calculation (market correlation)
             if 'market' in self.stock_data and 'history' in self.stock_data['market']:
-                market_hist = self.stock_data['market']['history']
+                market_hist = self.timeframe_cache.get('market', self.stock_data['market']['history'], timeframe)
                 if len(market_hist) > 30 and len(hist) > 30:
                     # Align dates
                     stock_returns = hist['Close'].pct_change().dropna()
@@ -323,14 +329,14 @@ class DecisionEngine:
             
             # NEW: Price patterns
             # Simple check for potential double bottom
-            if len(hist) > 60:
-                last_60 = hist['Close'].iloc[-60:]
-                recent_lows = argrelextrema(last_60.values, np.less)[0]
+            if len(hist) > windows['pattern']:
+                last_bars = hist['Close'].iloc[-windows['pattern']:]
+                recent_lows = argrelextrema(last_bars.values, np.less)[0]
                 double_bottom = False
                 if len(recent_lows) >= 2:
                     last_two_lows = recent_lows[-2:]
-                    if abs(last_60.iloc[last_two_lows[0]] - last_60.iloc[last_two_lows[1]]) < last_60.iloc[last_two_lows[0]] * 0.05:
-                        if last_two_lows[1] - last_two_lows[0] > 10:  # At least 10 days apart
+                    if abs(last_bars.iloc[last_two_lows[0]] - last_bars.iloc[last_two_lows[1]]) < last_bars.iloc[last_two_lows[0]] * 0.05:
+                        if last_two_lows[1] - last_two_lows[0] > windows['pattern_gap']:  # Lows far enough apart
                             double_bottom = True
             else:
                 double_bottom = None
@@ -390,6 +396,8 @@ class DecisionEngine:
         news_sentiment = self.analyze_news_sentiment()
         fundamental_analysis = self.analyze_fundamentals()
         price_trends = self.analyze_price_trends()
+        timeframe_trends = {tf: self.analyze_price_trends(timeframe=tf) for tf in self.trend_timeframes}
+        peer_analysis = self.analyze_peer_groups()
         
         recommendations = {}
         
@@ -428,6 +436,17 @@ class DecisionEngine:
                 'pattern_double_bottom': price_trends.get(ticker, {}).get('pattern_double_bottom', 'NO DATA')
             }
             
+            # Trend and indicator verdict on the longer timeframes
+            for tf, tf_trends in timeframe_trends.items():
+                recommendation[f'{tf}_trend'] = tf_trends.get(ticker, {}).get('trend', 'NO DATA')
+                recommendation[f'{tf}_recommendation'] = tf_trends.get(ticker, {}).get('recommendation', 'NO DATA')
+            
+            # Sector-relative context
+            peers = peer_analysis.get(ticker, {})
+            recommendation['sector'] = peers.get('sector', 'NO DATA')
+            recommendation['relative_pe'] = peers.get('relative_pe', 'NO DATA')
+            recommendation['sector_relative_return_3m'] = peers.get('relative_return_3m', 'NO DATA')
+            
             # Simple scoring system
             score = 0
             
@@ -273,7 +273,7 @@ class FundamentalsTracker:
             text = re.sub(r'<think>.*?</think>', '', summary, flags=re.DOTALL)
             
             # Check if there's a JSON code block
-            json_block_match = re.search(r'(?:json)?\s*([\s\S]*?)', text, re.DOTALL)
+            json_block_match = re.search(r'```(?:json)?\s*([\s\S]*?)```', text, re.DOTALL)
             
             if json_block_match:
                 # Extract the content inside the code block
@@ -0,0 +1,211 @@
+import itertools
+import time
+import numpy as np
+import pandas as pd
+from src.config import INDICATOR_SWEEP_GRID, SIGNAL_HORIZON
+
+
+class IndicatorSweep:
+    """Evaluate grids of indicator windows across the whole price panel at once.
+
+    Closing prices for every ticker are aligned into a single (dates x tickers)
+    array. Prefix sums of the closes, squared closes and RSI gains/losses are
+    computed once, so each additional rolling window is a single O(N)
+    subtraction over the panel instead of a fresh O(N*W) rolling pass.
+    """
+
+    def __init__(self, stock_data=None, grid=None, horizon=SIGNAL_HORIZON, min_signals=20):
+        self.stock_data = stock_data or {}
+        self.grid = dict(INDICATOR_SWEEP_GRID, **(grid or {}))
+        self.horizon = horizon
+        self.min_signals = min_signals
+        self.tickers = []
+        self.dates = None
+        self.close = None
+        self.forward_returns = None
+        self._prefix = {}
+        self._ema_cache = {}
+        self.results = {}
+
+    def build_price_panel(self):
+        """Align the close history of every ticker into one (dates x tickers) array"""
+        closes = {}
+        for ticker, data in self.stock_data.get('stocks', {}).items():
+            hist = data.get('history') if isinstance(data, dict) else None
+            if isinstance(hist, pd.DataFrame) and not hist.empty and 'Close' in hist:
+                closes[ticker] = hist['Close']
+
+        if not closes:
+            return None
+
+        panel = pd.DataFrame(closes).sort_index()
+        self.tickers = list(panel.columns)
+        self.dates = panel.index
+        self.close = panel.to_numpy(dtype=float)
+
+        # Forward returns over the scoring horizon, NaN where the horizon runs past the data
+        self.forward_returns = np.full_like(self.close, np.nan)
+        if len(self.close) > self.horizon:
+            with np.errstate(divide='ignore', invalid='ignore'):
+                self.forward_returns[:-self.horizon] = self.close[self.horizon:] / self.close[:-self.horizon] - 1
+
+        # RSI gains/losses, matching analyze_price_trends (first diff counts as zero)
+        delta = np.vstack([np.full((1, self.close.shape[1]), np.nan), np.diff(self.close, axis=0)])
+        gains = np.where(delta > 0, delta, 0.0)
+        losses = np.where(delta < 0, -delta, 0.0)
+        # Keep gaps in the panel as gaps so windows spanning them stay undefined
+        gains[np.isnan(self.close)] = np.nan
+        losses[np.isnan(self.close)] = np.nan
+
+        self._prefix = {
+            'close': self._prefix_sums(self.close),
+            'close_sq': self._prefix_sums(self.close ** 2),
+            'gain': self._prefix_sums(gains),
+            'loss': self._prefix_sums(losses)
+        }
+        self._ema_cache = {}
+        return panel
+
+    def _prefix_sums(self, values):
+        """Return zero-padded cumulative sums and cumulative valid counts along the date axis"""
+        valid = ~np.isnan(values)
+        zeros = np.zeros((1, values.shape[1]))
+        sums = np.vstack([zeros, np.cumsum(np.where(valid, values, 0.0), axis=0)])
+        counts = np.vstack([zeros, np.cumsum(valid, axis=0)])
+        return sums, counts
+
+    def _window_sum(self, key, window):
+        """Rolling sum of a prefixed series in O(N); NaN until a full window of valid values exists"""
+        sums, counts = self._prefix[key]
+        out = np.full((sums.shape[0] - 1, sums.shape[1]), np.nan)
+        if window > out.shape[0]:
+            return out
+        window_sums = sums[window:] - sums[:-window]
+        window_counts = counts[window:] - counts[:-window]
+        out[window - 1:] = np.where(window_counts == window, window_sums, np.nan)
+        return out
+
+    def rolling_mean(self, window):
+        """Rolling mean of the close panel"""
+        return self._window_sum('close', window) / window
+
+    def rolling_std(self, window):
+        """Rolling sample standard deviation of the close panel (ddof=1, as pandas)"""
+        total = self._window_sum('close', window)
+        total_sq = self._window_sum('close_sq', window)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            variance = (total_sq - total ** 2 / window) / (window - 1)
+        return np.sqrt(np.clip(variance, 0, None))
+
+    def rsi(self, window):
+        """Simple-moving-average RSI of the close panel"""
+        avg_gain = self._window_sum('gain', window) / window
+        avg_loss = self._window_sum('loss', window) / window
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return 100 - (100 / (1 + avg_gain / avg_loss))
+
+    def ema(self, span, values=None):
+        """Exponential moving average along the date axis (adjust=False, as in analyze_price_trends)"""
+        if values is None:
+            if span not in self._ema_cache:
+                self._ema_cache[span] = pd.DataFrame(self.close).ewm(span=span, adjust=False).mean().to_numpy()
+            return self._ema_cache[span]
+        return pd.DataFrame(values).ewm(span=span, adjust=False).mean().to_numpy()
+
+    def score_signal(self, signal):
+        """Score a +1/-1/0 signal panel by the forward return it would have captured"""
+        directional = signal * self.forward_returns
+        mask = (signal != 0) & ~np.isnan(directional)
+        count = int(mask.sum())
+        if count < self.min_signals:
+            return {'signals': count, 'mean_return': None, 'hit_rate': None}
+        captured = directional[mask]
+        return {
+            'signals': count,
+            'mean_return': float(captured.mean()),
+            'hit_rate': float((captured > 0).mean())
+        }
+
+    def sweep_moving_averages(self):
+        """Score the MA trend signal (close > MA short > MA long) for every short/long pair"""
+        means = {w: self.rolling_mean(w) for w in set(self.grid['ma_short']) | set(self.grid['ma_long'])}
+        results = []
+        for short, long in itertools.product(self.grid['ma_short'], self.grid['ma_long']):
+            if short >= long:
+                continue
+            ma_short, ma_long = means[short], means[long]
+            with np.errstate(invalid='ignore'):
+                signal = np.where((self.close > ma_short) & (ma_short > ma_long), 1,
+                                  np.where((self.close < ma_short) & (ma_short < ma_long), -1, 0))
+            results.append(dict(self.score_signal(signal), params={'ma_short': short, 'ma_long': long}))
+        return results
+
+    def sweep_rsi(self):
+        """Score the oversold/overbought RSI signal (below 30 bullish, above 70 bearish)"""
+        results = []
+        for window in self.grid['rsi']:
+            rsi = self.rsi(window)
+            with np.errstate(invalid='ignore'):
+                signal = np.where(rsi < 30, 1, np.where(rsi > 70, -1, 0))
+            results.append(dict(self.score_signal(signal), params={'rsi': window}))
+        return results
+
+    def sweep_macd(self):
+        """Score the MACD/signal-line crossover state for every fast/slow/signal triple"""
+        results = []
+        for fast, slow in itertools.product(self.grid['macd_fast'], self.grid['macd_slow']):
+            if fast >= slow:
+                continue
+            macd = self.ema(fast) - self.ema(slow)
+            for signal_span in self.grid['macd_signal']:
+                signal_line = self.ema(signal_span, macd)
+                with np.errstate(invalid='ignore'):
+                    signal = np.where(macd > signal_line, 1, np.where(macd < signal_line, -1, 0))
+                params = {'macd_fast': fast, 'macd_slow': slow, 'macd_signal': signal_span}
+                results.append(dict(self.score_signal(signal), params=params))
+        return results
+
+    def sweep_bollinger(self, num_std=2):
+        """Score the band-break signal (below lower band bullish, above upper band bearish)"""
+        results = []
+        for window in self.grid['bollinger']:
+            middle = self.rolling_mean(window)
+            band = self.rolling_std(window) * num_std
+            with np.errstate(invalid='ignore'):
+                signal = np.where(self.close < middle - band, 1, np.where(self.close > middle + band, -1, 0))
+            results.append(dict(self.score_signal(signal), params={'bollinger': window}))
+        return results
+
+    def run(self):
+        """Run every sweep and rank the settings by mean captured forward return"""
+        if self.build_price_panel() is None:
+            return {'error': 'No stock price data available'}
+
+        start = time.perf_counter()
+        sweeps = {
+            'moving_average': self.sweep_moving_averages(),
+            'rsi': self.sweep_rsi(),
+            'macd': self.sweep_macd(),
+            'bollinger': self.sweep_bollinger()
+        }
+
+        results = {'best': {}}
+        for indicator, rows in sweeps.items():
+            scored = [r for r in rows if r['mean_return'] is not None]
+            scored.sort(key=lambda r: (r['mean_return'], r['hit_rate']), reverse=True)
+            results[indicator] = scored
+            if scored:
+                results['best'][indicator] = scored[0]
+
+        results['elapsed_seconds'] = time.perf_counter() - start
+        results['tickers'] = len(self.tickers)
+        results['bars'] = len(self.dates)
+        self.results = results
+        return results
+
+    def best_windows(self):
+        """Return the winning settings in the shape DecisionEngine's indicator_windows expects"""
+        windows = {}
+        for result in self.results.get('best', {}).values():
+            windows.update(result['params'])
+        return windows
@@ -0,0 +1,142 @@
+import re
+from collections import deque
+from src.config import SENTIMENT_LEXICON
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:['\-][a-z0-9]+)*")
+
+
+def tokenize(text):
+    """Lowercase word tokens; hyphenated and apostrophe words stay single tokens"""
+    return TOKEN_PATTERN.findall(text.lower()) if text else []
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton over word tokens for a weighted phrase lexicon
+
+    Running the automaton over the token stream of a document finds every
+    lexicon phrase in a single left-to-right pass, independent of lexicon
+    size. Because the alphabet is whole words, matches always respect word
+    boundaries ("gain" does not match "against"). Overlapping matches are
+    resolved leftmost-longest, so "beat expectations" counts once rather than
+    also counting "beat".
+    """
+
+    def __init__(self, lexicon):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [()]
+
+        for phrase, weight in lexicon.items():
+            tokens = tokenize(phrase)
+            if not tokens:
+                continue
+            state = 0
+            for token in tokens:
+                next_state = self.goto[state].get(token)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][token] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(())
+                state = next_state
+            self.output[state] = self.output[state] + ((phrase, weight, len(tokens)),)
+
+        # Breadth-first construction of failure links; outputs inherit from the failure state
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and token not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[next_state] = self.goto[fallback].get(token, 0)
+                self.output[next_state] = self.output[next_state] + self.output[self.fail[next_state]]
+
+    def matches(self, tokens):
+        """Yield (phrase, weight) for the leftmost-longest, non-overlapping lexicon phrases in the token stream"""
+        goto, fail, output = self.goto, self.fail, self.output
+        found = []
+        state = 0
+        for end, token in enumerate(tokens):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            for phrase, weight, length in output[state]:
+                found.append((end - length + 1, -length, phrase, weight))
+        found.sort()
+        covered = 0
+        for start, negative_length, phrase, weight in found:
+            if start >= covered:
+                covered = start - negative_length
+                yield phrase, weight
+
+    def score(self, text):
+        """Return (total weight, positive hits, negative hits) for a piece of text"""
+        total = 0.0
+        positive = 0
+        negative = 0
+        for _, weight in self.matches(tokenize(text)):
+            total += weight
+            if weight > 0:
+                positive += 1
+            elif weight < 0:
+                negative += 1
+        return total, positive, negative
+
+
+class KeywordSentimentScorer:
+    """Fast local news sentiment from a weighted lexicon, usable as first pass or fallback"""
+
+    def __init__(self, lexicon=None, threshold=0.2):
+        self.lexicon = dict(SENTIMENT_LEXICON if lexicon is None else lexicon)
+        self.threshold = threshold
+        self.automaton = KeywordAutomaton(self.lexicon)
+
+    def score_article(self, article):
+        """Score one article's headline and summary"""
+        text = (article.get('headline', '') or '') + ' ' + (article.get('summary', '') or '')
+        total, positive, negative = self.automaton.score(text)
+        return {'score': total, 'positive_hits': positive, 'negative_hits': negative}
+
+    def _summarize(self, article_scores):
+        """Aggregate per-article scores into the company-level result shape"""
+        positive_count = sum(1 for s in article_scores if s['score'] > 0)
+        negative_count = sum(1 for s in article_scores if s['score'] < 0)
+        neutral_count = len(article_scores) - positive_count - negative_count
+
+        total = len(article_scores)
+        if total > 0:
+            sentiment_score = (positive_count - negative_count) / total
+            if sentiment_score > self.threshold:
+                sentiment = 'POSITIVE'
+            elif sentiment_score < -self.threshold:
+                sentiment = 'NEGATIVE'
+            else:
+                sentiment = 'NEUTRAL'
+        else:
+            sentiment = 'NEUTRAL'
+            sentiment_score = 0
+
+        return {
+            'sentiment': sentiment,
+            'score': sentiment_score,
+            'lexicon_score': sum(s['score'] for s in article_scores),
+            'positive_articles': positive_count,
+            'negative_articles': negative_count,
+            'neutral_articles': neutral_count,
+            'article_count': total
+        }
+
+    def score_articles(self, articles):
+        """Score a single company's articles"""
+        return self._summarize([self.score_article(article) for article in articles or []])
+
+    def score_news_data(self, news_data):
+        """Score every article of every company in news_data ({ticker: [articles]}) in one pass"""
+        results = {}
+        for company, articles in (news_data or {}).items():
+            if isinstance(articles, list):
+                results[company] = self.score_articles(articles)
+        return results
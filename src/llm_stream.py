@@ -0,0 +1,299 @@
+import json
+
+THINK_OPEN = '<think>'
+THINK_CLOSE = '</think>'
+WHITESPACE = ' \t\r\n'
+MAX_PREAMBLE = 2000
+
+
+class MalformedStreamError(ValueError):
+    """Raised as soon as a streamed completion can no longer be valid output"""
+
+
+class ThinkFilter:
+    """Drop <think>...</think> reasoning from a stream of text chunks
+
+    Tags split across chunk boundaries are handled by holding back a tail
+    that could still be the start of a tag. If a closing tag arrives with no
+    opening tag (some reasoning models omit it), everything seen so far was
+    reasoning; the reset flag is set so the caller can discard what it parsed.
+    seen_tag tells whether any think tag has appeared yet: until then, visible
+    text may still turn out to be reasoning. max_think_chars bounds the
+    reasoning length before the stream is aborted.
+    """
+
+    def __init__(self, max_think_chars=None):
+        self.max_think_chars = max_think_chars
+        self.in_think = False
+        self.think_chars = 0
+        self.reset = False
+        self.seen_tag = False
+        self._pending = ''
+
+    def _partial_tag_length(self, text, tag):
+        """Length of the longest suffix of text that is a proper prefix of tag"""
+        for size in range(min(len(tag) - 1, len(text)), 0, -1):
+            if text.endswith(tag[:size]):
+                return size
+        return 0
+
+    def feed(self, chunk):
+        """Return the visible part of chunk"""
+        self.reset = False
+        text = self._pending + chunk
+        self._pending = ''
+        visible = []
+        while text:
+            if self.in_think:
+                end = text.find(THINK_CLOSE)
+                if end == -1:
+                    hold = self._partial_tag_length(text, THINK_CLOSE)
+                    self.think_chars += len(text) - hold
+                    self._pending = text[len(text) - hold:]
+                    text = ''
+                else:
+                    self.think_chars += end
+                    self.in_think = False
+                    text = text[end + len(THINK_CLOSE):]
+                if self.max_think_chars is not None and self.think_chars > self.max_think_chars:
+                    raise MalformedStreamError(f"Reasoning exceeded {self.max_think_chars} characters")
+                continue
+
+            start = text.find(THINK_OPEN)
+            stray_close = text.find(THINK_CLOSE)
+            if stray_close != -1 and (start == -1 or stray_close < start):
+                # Closing tag without an opening one: drop everything before it
+                visible = []
+                self.reset = True
+                self.seen_tag = True
+                text = text[stray_close + len(THINK_CLOSE):]
+                continue
+            if start == -1:
+                hold = max(self._partial_tag_length(text, THINK_OPEN), self._partial_tag_length(text, THINK_CLOSE))
+                visible.append(text[:len(text) - hold])
+                self._pending = text[len(text) - hold:]
+                text = ''
+            else:
+                visible.append(text[:start])
+                self.in_think = True
+                self.seen_tag = True
+                text = text[start + len(THINK_OPEN):]
+        return ''.join(visible)
+
+    def flush(self):
+        """Return any held-back text once the stream has ended"""
+        text, self._pending = self._pending, ''
+        return '' if self.in_think else text
+
+
+class IncrementalJSONParser:
+    """Parse a streamed JSON object, publishing each top-level field as soon as it completes
+
+    Text before the opening brace (a ```json fence, whitespace or a short
+    preamble) is skipped; anything after the closing brace is ignored. The
+    top-level object structure is checked character by character and each
+    member value is decoded with json.loads when its last character arrives.
+    on_field(key, value) is called for every member.
+
+    A brace in the preamble (e.g. in reasoning that lost its <think> tag) can
+    start an object that turns out to be malformed. With resync, parsing then
+    restarts at the next '{' after the failed one and the abandoned attempt's
+    fields are dropped (on_field has already seen them). Without resync the
+    first malformed character raises MalformedStreamError. max_preamble
+    (None for no limit) bounds the text skipped before an object starts.
+    """
+
+    def __init__(self, on_field=None, max_preamble=MAX_PREAMBLE, resync=True):
+        self.on_field = on_field
+        self.max_preamble = max_preamble
+        self.resync = resync
+        self.done = False
+        self._preamble = 0
+        self._restart()
+
+    def _restart(self):
+        self.fields = {}
+        self._state = 'preamble'
+        self._attempt = []
+        self._buffer = []
+        self._key = None
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def _fail(self, message):
+        raise MalformedStreamError(message)
+
+    def _finish_value(self):
+        text = ''.join(self._buffer).strip()
+        self._buffer = []
+        try:
+            value = json.loads(text)
+        except json.JSONDecodeError as e:
+            self._fail(f"Invalid value for {self._key!r}: {e}")
+        self.fields[self._key] = value
+        if self.on_field is not None:
+            self.on_field(self._key, value)
+        self._key = None
+
+    def _scan_string(self, ch):
+        """Track escapes and the closing quote of the current string"""
+        if self._escape:
+            self._escape = False
+        elif ch == '\\':
+            self._escape = True
+        elif ch == '"':
+            self._in_string = False
+
+    def feed(self, text):
+        while text and not self.done:
+            text = self._consume(text)
+        return self.fields
+
+    def _consume(self, text):
+        """Parse text; returns the text to rescan after a failed object, else ''"""
+        for index, ch in enumerate(text):
+            if self.done:
+                break
+            if self._state == 'preamble':
+                if ch == '{':
+                    self._state = 'key'
+                else:
+                    self._preamble += 1
+                    if self.max_preamble is not None and self._preamble > self.max_preamble:
+                        self._fail("No JSON object found in the response")
+                continue
+            self._attempt.append(ch)
+            try:
+                self._step(ch)
+            except MalformedStreamError:
+                if not self.resync:
+                    raise
+                # Not the answer after all: rescan everything after the brace that started it
+                replay = ''.join(self._attempt) + text[index + 1:]
+                self._restart()
+                return replay
+        return ''
+
+    def _step(self, ch):
+        """Advance the object parser by one character"""
+        state = self._state
+
+        if state == 'key':
+            if ch in WHITESPACE:
+                return
+            if ch == '"':
+                self._buffer = [ch]
+                self._in_string = True
+                self._state = 'key_string'
+            elif ch == '}' and not self.fields:
+                self.done = True
+            else:
+                self._fail(f"Expected a key, got {ch!r}")
+
+        elif state == 'key_string':
+            self._buffer.append(ch)
+            self._scan_string(ch)
+            if not self._in_string:
+                try:
+                    self._key = json.loads(''.join(self._buffer))
+                except json.JSONDecodeError as e:
+                    self._fail(f"Invalid key: {e}")
+                self._buffer = []
+                self._state = 'colon'
+
+        elif state == 'colon':
+            if ch in WHITESPACE:
+                return
+            if ch != ':':
+                self._fail(f"Expected ':' after {self._key!r}, got {ch!r}")
+            self._state = 'value'
+
+        elif state == 'value':
+            if ch in WHITESPACE:
+                return
+            self._buffer = [ch]
+            if ch == '"':
+                self._in_string = True
+                self._state = 'string_value'
+            elif ch in '{[':
+                self._depth = 1
+                self._state = 'nested_value'
+            elif ch in '-0123456789tfn':
+                self._state = 'scalar_value'
+            else:
+                self._fail(f"Unexpected {ch!r} at the start of {self._key!r}")
+
+        elif state == 'string_value':
+            self._buffer.append(ch)
+            self._scan_string(ch)
+            if not self._in_string:
+                self._finish_value()
+                self._state = 'comma'
+
+        elif state == 'nested_value':
+            self._buffer.append(ch)
+            if self._in_string:
+                self._scan_string(ch)
+            elif ch == '"':
+                self._in_string = True
+            elif ch in '{[':
+                self._depth += 1
+            elif ch in '}]':
+                self._depth -= 1
+                if self._depth == 0:
+                    self._finish_value()
+                    self._state = 'comma'
+
+        elif state == 'scalar_value':
+            if ch in ',}' or ch in WHITESPACE:
+                self._finish_value()
+                self._state = 'comma'
+                if ch == ',':
+                    self._state = 'key'
+                elif ch == '}':
+                    self.done = True
+            else:
+                self._buffer.append(ch)
+
+        elif state == 'comma':
+            if ch in WHITESPACE:
+                return
+            if ch == ',':
+                self._state = 'key'
+            elif ch == '}':
+                self.done = True
+            else:
+                self._fail(f"Expected ',' or '}}' after a value, got {ch!r}")
+
+    def result(self):
+        """The parsed object; raises if the stream ended before it closed"""
+        if not self.done:
+            raise MalformedStreamError("Response ended before the JSON object was complete")
+        return self.fields
+
+
+def parse_stream(chunks, on_field=None, max_think_chars=None):
+    """Parse the JSON answer from an iterable of completion text chunks
+
+    Reasoning is filtered with ThinkFilter. Until a think tag has been seen
+    the visible text may still be reasoning whose opening tag was omitted,
+    so the preamble is not limited, a malformed object resyncs at the next
+    brace and a complete object does not end the stream early. Once a tag
+    has been seen, what follows is the answer: it gets a fresh parser that
+    raises on the first malformed character, so bad output aborts the stream
+    at once. Returns the parsed object; raises MalformedStreamError.
+    """
+    think = ThinkFilter(max_think_chars)
+    parser = IncrementalJSONParser(on_field, max_preamble=None)
+    strict = False
+    for text in chunks:
+        visible = think.feed(text)
+        if think.seen_tag and (think.reset or not strict):
+            parser = IncrementalJSONParser(on_field, resync=False)
+            strict = True
+        parser.feed(visible)
+        if parser.done and strict:
+            break
+    parser.feed(think.flush())
+    return parser.result()
@@ -0,0 +1,102 @@
+import time
+import threading
+from urllib.parse import urlsplit, urlunsplit
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+
+def link_key(link):
+    """Normalized link for deduplication: no query string, fragment, trailing slash or www."""
+    if not link:
+        return None
+    parts = urlsplit(link.strip())
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    return urlunsplit((parts.scheme.lower(), host, parts.path.rstrip('/'), '', ''))
+
+
+def merge_articles(results, order):
+    """Concatenate per-source article lists in source order, dropping repeated links"""
+    merged = []
+    seen = set()
+    for name in order:
+        for article in results.get(name) or []:
+            key = link_key(article.get('link')) or article.get('headline')
+            if key in seen:
+                continue
+            seen.add(key)
+            merged.append(article)
+    return merged
+
+
+class SourceDeadline:
+    """When one source run must end; cancelled is set once the collector has given up on it"""
+
+    def __init__(self, seconds):
+        self.expires = time.monotonic() + seconds
+        self.cancelled = threading.Event()
+
+    def remaining(self):
+        return max(0.0, self.expires - time.monotonic())
+
+    def expired(self):
+        return self.cancelled.is_set() or self.remaining() == 0
+
+
+class NewsCollector:
+    """Runs a ticker's news sources concurrently, each bounded by its own deadline
+
+    sources maps a source name to a callable(company, deadline) returning
+    articles, where deadline is the run's SourceDeadline. Every source gets a
+    worker; collect returns once all sources have finished or run out of
+    time, so a slow or broken source costs at most its deadline. A worker
+    cannot be interrupted: a late one has its deadline cancelled, should stop
+    at its next check of deadline.expired(), and its result is dropped.
+    merge_articles combines the per-source results in source order,
+    deduplicated by link.
+    """
+
+    def __init__(self, sources, deadlines, default_deadline=60, max_workers=None):
+        self.sources = dict(sources)
+        self.deadlines = deadlines
+        self.default_deadline = default_deadline
+        self.executor = ThreadPoolExecutor(max_workers=max_workers or max(1, len(self.sources)),
+                                           thread_name_prefix='news-source')
+
+    def deadline(self, name):
+        return self.deadlines.get(name, self.default_deadline)
+
+    def collect(self, company):
+        """Return (results, report): articles of the sources that finished in time, and each
+        source's status ('ok', 'error' or 'timeout'), article count and seconds"""
+        start = time.monotonic()
+        deadlines = {name: SourceDeadline(self.deadline(name)) for name in self.sources}
+        pending = {self.executor.submit(scrape, company, deadlines[name]): name
+                   for name, scrape in self.sources.items()}
+        results = {}
+        report = {}
+        while pending:
+            now = time.monotonic()
+            next_deadline = min(start + self.deadline(name) for name in pending.values())
+            done, _ = wait(pending, timeout=max(0, next_deadline - now), return_when=FIRST_COMPLETED)
+            elapsed = round(time.monotonic() - start, 2)
+            for future in done:
+                name = pending.pop(future)
+                try:
+                    results[name] = future.result()
+                    report[name] = {'status': 'ok', 'articles': len(results[name] or []), 'seconds': elapsed}
+                except Exception as e:
+                    print(f"Error collecting {name} news for {company}: {e}")
+                    report[name] = {'status': 'error', 'error': str(e), 'articles': 0, 'seconds': elapsed}
+            for future, name in list(pending.items()):
+                if elapsed >= self.deadline(name):
+                    future.cancel()
+                    deadlines[name].cancelled.set()
+                    del pending[future]
+                    print(f"{name} missed its {self.deadline(name)}s deadline for {company}, skipping it")
+                    report[name] = {'status': 'timeout', 'articles': 0, 'seconds': elapsed}
+        return results, report
+
+    def close(self):
+        """Stop accepting work; workers still running finish in the background"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,124 @@
+import os
+import re
+import sqlite3
+from contextlib import closing
+from src.config import NEWS_SEARCH_DB, NEWS_SEARCH_WEIGHTS
+
+
+def match_query(text):
+    """Turn free text into an FTS5 query that matches documents containing every word
+
+    Each word is quoted so punctuation and FTS5 operators in user input
+    cannot cause syntax errors; a trailing * keeps prefix search ("earn*").
+    """
+    terms = []
+    for match in re.finditer(r"(\w+)(\*?)", text or "", re.UNICODE):
+        word, star = match.groups()
+        terms.append(f'"{word}"{star}')
+    return " ".join(terms)
+
+
+class NewsSearchIndex:
+    """SQLite FTS5 full-text index over scraped news articles
+
+    Every (ticker, link) pair is indexed once, on the first date it is saved,
+    so updating the index with a daily snapshot only tokenizes new articles.
+    The FTS table is contentless (bodies stay in the article archive); the
+    documents table keeps the fields returned with results. Matches are
+    ranked by BM25 with headline and summary hits weighted above body hits.
+    """
+
+    def __init__(self, path=NEWS_SEARCH_DB, seed=None, weights=NEWS_SEARCH_WEIGHTS):
+        self.path = path
+        self.weights = weights
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        is_new = not os.path.exists(path)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS documents (
+                    id INTEGER PRIMARY KEY,
+                    ticker TEXT NOT NULL,
+                    link TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    headline TEXT,
+                    summary TEXT,
+                    source TEXT,
+                    published TEXT,
+                    UNIQUE (ticker, link)
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS documents_date ON documents (date)")
+            conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS documents_fts USING fts5(
+                    headline, summary, full_content, content='', tokenize='porter unicode61'
+                )
+            """)
+        if is_new and seed is not None:
+            history = seed()
+            for date in sorted(history or {}):
+                self.add(date, history[date])
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def add(self, date, news_data):
+        """Index the new articles of one date's {ticker: [articles]}; returns how many were added"""
+        added = 0
+        with closing(self._connect()) as conn, conn:
+            for ticker, articles in (news_data or {}).items():
+                for article in articles or []:
+                    link = article.get('link') or article.get('headline')
+                    if not link:
+                        continue
+                    cursor = conn.execute("""
+                        INSERT OR IGNORE INTO documents (ticker, link, date, headline, summary, source, published)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """, (ticker, link, date, article.get('headline'), article.get('summary'),
+                          article.get('source'), article.get('date')))
+                    if cursor.rowcount != 1:
+                        continue
+                    content = article.get('full_content')
+                    if content == "No content available":
+                        content = None
+                    conn.execute(
+                        "INSERT INTO documents_fts (rowid, headline, summary, full_content) VALUES (?, ?, ?, ?)",
+                        (cursor.lastrowid, article.get('headline') or '', article.get('summary') or '',
+                         content or '')
+                    )
+                    added += 1
+        return added
+
+    def search(self, query, ticker=None, date_from=None, date_to=None, limit=20, offset=0):
+        """Ranked matches for query as dicts (best first), optionally filtered by ticker and date range"""
+        expression = match_query(query)
+        if not expression:
+            return []
+        where = ["documents_fts MATCH ?"]
+        params = [expression]
+        if ticker:
+            where.append("d.ticker = ?")
+            params.append(ticker)
+        if date_from:
+            where.append("d.date >= ?")
+            params.append(date_from)
+        if date_to:
+            where.append("d.date <= ?")
+            params.append(date_to)
+        weights = ", ".join(str(float(weight)) for weight in self.weights)
+        with closing(self._connect()) as conn:
+            rows = conn.execute(f"""
+                SELECT d.ticker, d.date, d.headline, d.summary, d.link, d.source, d.published,
+                       bm25(documents_fts, {weights}) AS score
+                FROM documents_fts JOIN documents d ON d.id = documents_fts.rowid
+                WHERE {' AND '.join(where)}
+                ORDER BY score
+                LIMIT ? OFFSET ?
+            """, params + [limit, offset]).fetchall()
+        columns = ('ticker', 'date', 'headline', 'summary', 'link', 'source', 'published')
+        # bm25 is lower for better matches; report it so that higher is better
+        return [dict(zip(columns, row[:-1]), score=round(-row[-1], 4)) for row in rows]
+
+    def __len__(self):
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
@@ -1,33 +1,47 @@
 import os
-import pickle
 from datetime import datetime
-import json
-import re
+import time
+import random
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
-from together import Together
+from src.config import (NEWS_SUMMARY_CONCURRENCY, NEWS_SUMMARY_MAX_RETRIES, NEWS_SUMMARY_RETRY_DELAY,
+                        NEWS_SUMMARY_BACKEND, NEWS_SUMMARY_FALLBACK_BACKEND, NEWS_DEDUP,
+                        NEWS_TOPIC_CLUSTERING)
+from src.summary_cache import SummaryCache
+from src.summary_store import SummaryStore
+from src.article_dedup import ArticleDeduplicator
+from src.article_compressor import ArticleCompressor
+from src.article_clusters import TopicClusterer
+from src.article_packer import ArticlePacker, format_article
+from src.summarizer_backends import get_backend
 
 class NewsSummarizer:
-    def __init__(self):
+    def __init__(self, max_concurrency=NEWS_SUMMARY_CONCURRENCY, max_retries=NEWS_SUMMARY_MAX_RETRIES,
+                 retry_delay=NEWS_SUMMARY_RETRY_DELAY, use_cache=True, packer=None,
+                 backend=NEWS_SUMMARY_BACKEND, fallback_backend=NEWS_SUMMARY_FALLBACK_BACKEND, store=None,
+                 deduplicator=None, dedup=NEWS_DEDUP, compressor=None, clusterer=None,
+                 topic_clustering=NEWS_TOPIC_CLUSTERING):
         load_dotenv()
-        api_key = os.environ.get("TOGETHER_API_KEY")
-        if not api_key:
+        if backend == 'together' and not os.environ.get("TOGETHER_API_KEY"):
             print("Warning: TOGETHER_API_KEY environment variable not set. News summarization may not work.")
-        self.client = Together(api_key=api_key)
-        self.model = "deepseek-ai/DeepSeek-R1-Distill-Llama-70B-free"
-        self.summaries_dir = "data/news_summaries"
+        self.backend = get_backend(backend)
+        self.client = getattr(self.backend, 'client', None)
+        self.model = self.backend.cache_name
+        self.fallback_backend = get_backend(fallback_backend) if fallback_backend and fallback_backend != backend else None
         self.summaries = {}
-        os.makedirs(self.summaries_dir, exist_ok=True)
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.cache = SummaryCache() if use_cache and self.backend.cacheable else None
+        self.packer = packer or ArticlePacker()
+        self.deduplicator = (deduplicator or ArticleDeduplicator()) if dedup else None
+        self.compressor = compressor or ArticleCompressor()
+        self.clusterer = (clusterer or TopicClusterer()) if topic_clustering else None
+        self.store = store or SummaryStore()
         
     # Format articles for the prompt
-    def process_article_batch(self, ticker, articles_batch):
-        formatted_articles = []
-        for i, article in enumerate(articles_batch):
-            title = article.get('headline', 'Untitled')
-            date = article.get('date', 'Unknown date')
-            source = article.get('source', 'Unknown source')
-            summary = article.get('summary', '')
-            content = article.get('full_content', '')
-            formatted_articles.append(f"Article {i+1}: '{title}' - {date} ({source})\n{summary}\n{content}\n")
+    def build_prompt(self, ticker, articles_batch):
+        formatted_articles = [format_article(i + 1, article) for i, article in enumerate(articles_batch)]
         
         articles_text = "\n".join(formatted_articles)
         
@@ -58,35 +72,66 @@ class NewsSummarizer:
         "sentiment": "positive/negative/neutral/mixed",
         "price_impact": "likely impact on price for the {ticker}"        
     }}"""
+        return prompt
 
+    def process_article_batch(self, ticker, articles_batch):
+        prompt = self.build_prompt(ticker, articles_batch)
         try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-            )
-            summary = response.choices[0].message.content
-            # Remove <think>...</think> blocks
-            text = re.sub(r'<think>.*?</think>', '', summary, flags=re.DOTALL)
-            # Check if there's a JSON code block
-            json_block_match = re.search(r'```(?:json)?([\s\S]*?)```', text, re.DOTALL)
-            if json_block_match:
-                json_str = json_block_match.group(1).strip()
-            else:
-                json_str = text.strip()
-            return json.loads(json_str)
+            return self.backend.summarize(ticker, articles_batch, prompt)
         except Exception as e:
             return {"summary": f"Error generating summary: {str(e)}", "error": str(e)}
 
+    def process_article_batch_with_retries(self, ticker, articles_batch):
+        """Run process_article_batch, retrying failed batches with exponential backoff and jitter
+
+        Successful results are cached under a hash of the model and prompt, so an
+        unchanged batch is answered from the cache without an LLM call. Results
+        name the backend that produced them under 'backend'.
+        """
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(self.model, self.build_prompt(ticker, articles_batch))
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
+        retry_delay = self.retry_delay
+        attempts = max(1, self.max_retries)  # max_retries 0 still makes the one initial attempt
+        for attempt in range(attempts):
+            result = self.process_article_batch(ticker, articles_batch)
+            if "error" not in result:
+                result = dict(result, backend=self.backend.name)
+                if cache_key is not None:
+                    self.cache.put(cache_key, result)
+                return result
+            print(f"Error summarizing batch for {ticker} (attempt {attempt + 1}/{attempts}): {result['error']}")
+            if attempt < attempts - 1:
+                time.sleep(retry_delay + random.uniform(0, retry_delay / 2))
+                retry_delay *= 2  # Exponential backoff
+        
+        if self.fallback_backend is not None:
+            print(f"Falling back to {self.fallback_backend.name} summarizer for a {ticker} batch")
+            try:
+                result = self.fallback_backend.summarize(ticker, articles_batch, None)
+                return dict(result, backend=self.fallback_backend.name)
+            except Exception as e:
+                print(f"Fallback summarizer failed for {ticker}: {e}")
+        return result
+
     def merge_summaries(self, summaries_list):
         merged = {
             "summary": "",
             "positive_factors": [],
             "negative_factors": [],
             "sentiment": "",
-            "price_impact": ""
+            "price_impact": "",
+            "backend": None
         }
+        backends = []
         for summary in summaries_list:
             if isinstance(summary, dict) and "error" not in summary:
+                if summary.get("backend") and summary["backend"] not in backends:
+                    backends.append(summary["backend"])
                 merged["summary"] += summary.get("summary", "") + " "
                 merged["positive_factors"].extend(summary.get("positive_factors", []))
                 merged["negative_factors"].extend(summary.get("negative_factors", []))
@@ -104,21 +149,45 @@ class NewsSummarizer:
             positive_count = sentiments.count("positive")
             negative_count = sentiments.count("negative")
             merged["sentiment"] = "positive" if positive_count > negative_count else "negative" if negative_count > positive_count else "neutral"
+        # Which summarizer answered (several if the fallback covered some batches)
+        merged["backend"] = ", ".join(backends) or None
 
         return merged
 
     def summarize_news(self, ticker, articles):
-        """Summarize news articles for a ticker using Together AI"""
+        """Summarize news articles for a ticker with the configured backend"""
         if not articles:
             return {"summary": "No recent news articles found for this ticker."}
         
-        batch_size = 4
-        summaries = []
+        # Collapse syndicated copies so each story is paid for once
+        if self.deduplicator is not None:
+            articles, report = self.deduplicator.deduplicate(articles)
+            if report['duplicates_removed']:
+                print(f"{ticker}: removed {report['duplicates_removed']} near-duplicate articles, "
+                      f"saving ~{report['tokens_saved']} prompt tokens")
         
-        for i in range(0, len(articles), batch_size):
-            batch = articles[i:i + batch_size]
-            batch_summary = self.process_article_batch(ticker, batch)
-            summaries.append(batch_summary)
+        # One digest per topic instead of every article about the same event
+        if self.clusterer is not None:
+            articles, report = self.clusterer.digests(articles)
+            print(f"{ticker}: grouped {report['articles']} articles into {report['topics']} topics")
+        
+        # Keep only the sentences carrying figures, company mentions or sentiment
+        if self.compressor.aggressiveness > 0:
+            articles, report = self.compressor.compress(articles, ticker)
+            print(f"{ticker}: compressed article bodies to {report['compression_ratio']:.0%} "
+                  f"({report['content_tokens_before']} -> {report['content_tokens_after']} tokens)")
+        
+        # Fill each request up to the token budget rather than a fixed article count
+        batches = self.packer.pack(articles)
+        print(f"{ticker}: packed {len(articles)} articles into {len(batches)} requests")
+        
+        # Dispatch batches concurrently; map() keeps results in the original batch order
+        max_workers = max(1, min(self.max_concurrency, len(batches)))
+        cache_hits = self.cache.hits if self.cache is not None else 0
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            summaries = list(executor.map(lambda batch: self.process_article_batch_with_retries(ticker, batch), batches))
+        if self.cache is not None:
+            print(f"{ticker}: {self.cache.hits - cache_hits}/{len(batches)} batches served from summary cache")
         
         merged_summary = self.merge_summaries(summaries)
         
@@ -130,31 +199,17 @@ class NewsSummarizer:
         return merged_summary
     
     def save_summary(self, ticker, summary):
-        """Save news summary to a file"""
-        filename = f"{self.summaries_dir}/{ticker}.pkl"
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
-        
+        """Save news summary to the summary store"""
         current_date = datetime.now().strftime("%Y-%m-%d")
-        new_data = {
-            current_date: {
-                "summary": summary["summary"],
-                "sentiment": summary["sentiment"],
-                "price_impact": summary["price_impact"],
-                "positive_factors": summary["positive_factors"],
-                "negative_factors": summary["negative_factors"],
-                "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }        
-        }
-        
-        if os.path.exists(filename):
-            with open(filename, 'rb') as f:
-                existing_data = pickle.load(f)
-                existing_data.update(new_data)
-            with open(filename, 'wb') as f:
-                pickle.dump(existing_data, f)
-        else:
-            with open(filename, 'wb') as f:
-                pickle.dump(new_data, f)
+        self.store.put(ticker, current_date, {
+            "summary": summary["summary"],
+            "sentiment": summary["sentiment"],
+            "price_impact": summary["price_impact"],
+            "positive_factors": summary["positive_factors"],
+            "negative_factors": summary["negative_factors"],
+            "backend": summary.get("backend"),
+            "last_updated": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        })
         
-        print(f"Data saved to {filename}")   
-        return filename
\ No newline at end of file
+        print(f"Summary for {ticker} saved to {self.store.path}")
+        return self.store.path
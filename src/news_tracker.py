@@ -1,13 +1,24 @@
 import time
+import threading
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
-from src.config import COMPANIES, NEWS_SOURCES, MAX_ARTICLES_PER_COMPANY, REQUEST_DELAY
+from src.config import (COMPANIES, NEWS_SOURCES, MAX_ARTICLES_PER_COMPANY, NEWS_SCRAPER_MODE,
+                        NEWS_DRIVER_POOL_SIZE, NEWS_DRIVER_MAX_USES, NEWS_INCREMENTAL, NEWS_ARCHIVE_DB,
+                        NEWS_BROWSER_PROFILE, NEWS_SEARCH_DB, NEWS_COLLECT_SOURCES, NEWS_SOURCE_DEADLINES,
+                        NEWS_TICKER_WORKERS, NEWS_DATE_SORTED_SOURCES)
+from src.yahoo_news import YahooNewsClient, take_until
+from src.seen_urls import SeenURLIndex
+from src.article_archive import ArticleArchive
+from src.news_search import NewsSearchIndex
+from src.news_collector import NewsCollector, merge_articles
+from src.crawl_frontier import CrawlFrontier, PRIORITY_LISTING, PRIORITY_ARTICLE, PRIORITY_FOLLOWUP
+from src.webdriver_pool import WebDriverPool
+from src.browser_profile import chrome_options, block_requests
+from src.page_readiness import load_page, wait_for_elements, dismiss_consent, site_profile
 import requests
 import os
 from dotenv import load_dotenv
@@ -18,24 +29,108 @@ from src.storage_helper import GistStorage
 load_dotenv()
 
 class NewsTracker:
-    def __init__(self, tickers=COMPANIES, headless=True):
-        """Initialize the news scraper with a Selenium WebDriver"""
-        chrome_options = Options()
-        if headless:
-            chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--window-size=1920,1080")
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
+    def __init__(self, tickers=COMPANIES, headless=True, scraper_mode=NEWS_SCRAPER_MODE,
+                 pool_size=NEWS_DRIVER_POOL_SIZE, incremental=NEWS_INCREMENTAL, archive_path=NEWS_ARCHIVE_DB,
+                 browser_profile=NEWS_BROWSER_PROFILE, search_path=NEWS_SEARCH_DB, sources=NEWS_COLLECT_SOURCES):
+        """Initialize the news scraper; Selenium WebDrivers are started on first use
+
+        In incremental mode each date-sorted source (NEWS_DATE_SORTED_SOURCES)
+        is only scraped down to the newest article ingested on an earlier run
+        (its high-water mark), and the new articles are put in front of the
+        ticker's stored ones. sources lists
+        the sources collected concurrently for every ticker (see SCRAPERS).
+        pool_size None gives NEWS_TICKER_WORKERS WebDrivers per browser source.
+        """
+        # 'lean' skips images, fonts, media and ad/tracker requests (see src/browser_profile.py)
+        self.browser_profile = browser_profile
+        self.chrome_options = chrome_options(headless, browser_profile)
         
         # Specify Chrome binary location if needed
-        # chrome_options.binary_location = "/usr/bin/google-chrome"  # Uncomment and adjust path as needed
+        # self.chrome_options.binary_location = "/usr/bin/google-chrome"  # Uncomment and adjust path as needed
+        self._local = threading.local()
+        
+        # Saved news, and the links scraped on earlier runs (seeded once from the saved news)
+        self.archive = ArticleArchive(archive_path)
+        self.url_index = SeenURLIndex(seed=self.archive.history)
+        self.search_index = NewsSearchIndex(search_path, seed=self.archive.history)
+        self.incremental = incremental
+        self.new_articles = {}
+        self.stored_articles = {}
+        self.pending_marks = {}
+        
+        self.scraper_mode = scraper_mode
+        # Every page load goes through the frontier, which enforces per-domain rate limits
+        self.frontier = CrawlFrontier()
+        self.http_client = (YahooNewsClient(url_index=self.url_index, frontier=self.frontier)
+                            if scraper_mode == 'http' else None)
+        
+        unknown = [name for name in sources if name not in self.SCRAPERS]
+        if unknown:
+            raise ValueError(f"Unknown news sources: {', '.join(unknown)}")
+        self.sources = list(sources)
+        if pool_size is None:
+            pool_size = NEWS_TICKER_WORKERS * max(1, len(self._browser_sources()))
+        self.driver_pool = WebDriverPool(self._start_driver, size=pool_size, max_uses=NEWS_DRIVER_MAX_USES)
+        self.collector = None
+        self.source_reports = {}
         
+        self.articles = {}
+        self.tickers = tickers
+    
+    # News source name -> scraper method; every scraper takes (company, max_articles, stop_at)
+    SCRAPERS = {
+        "Yahoo Finance": "scrape_yahoo_finance",
+        "Wall Street Journal": "scrape_wsj",
+        "Financial Times": "scrape_ft",
+        "MarketWatch": "scrape_marketwatch",
+        "Reuters": "scrape_reuters"
+    }
+    
+    @property
+    def driver(self):
+        """This thread's WebDriver, checked out of the pool on first use
+
+        Started lazily so HTTP-only runs never launch Chrome. Worker threads
+        return theirs with release_driver when their ticker is done. Inside a
+        collector run, waiting for a free driver is bounded by the source's
+        deadline.
+        """
+        driver = getattr(self._local, 'driver', None)
+        if driver is None:
+            deadline = getattr(self._local, 'deadline', None)
+            driver = self.driver_pool.checkout(timeout=deadline.remaining() if deadline is not None else None)
+            self._local.driver = driver
+        return driver
+    
+    def _source_expired(self):
+        """True once the collector has given up on this thread's source run"""
+        deadline = getattr(self._local, 'deadline', None)
+        return deadline is not None and deadline.expired()
+    
+    def release_driver(self):
+        """Return this thread's WebDriver (if any) to the pool"""
+        driver = getattr(self._local, 'driver', None)
+        if driver is not None:
+            self._local.driver = None
+            self.driver_pool.checkin(driver)
+        return driver is not None
+    
+    def _start_driver(self):
+        driver = self._launch_chrome()
+        if self.browser_profile == 'lean':
+            block_requests(driver)
+        return driver
+    
+    def load_page(self, url, priority=PRIORITY_LISTING, **kwargs):
+        """Load url in this thread's WebDriver once the crawl frontier allows a request to its site"""
+        with self.frontier.slot(url, priority):
+            return load_page(self.driver, url, **kwargs)
+    
+    def _launch_chrome(self):
         try:
-            self.driver = webdriver.Chrome(
+            return webdriver.Chrome(
                 service=Service(ChromeDriverManager().install()),
-                options=chrome_options
+                options=self.chrome_options
             )
         except Exception as e:
             print(f"Error initializing Chrome WebDriver: {e}")
@@ -44,30 +139,24 @@ class NewsTracker:
                 # Try with explicit driver path
                 driver_path = ChromeDriverManager().install()
                 print(f"Using ChromeDriver at: {driver_path}")
-                self.driver = webdriver.Chrome(
+                return webdriver.Chrome(
                     service=Service(driver_path),
-                    options=chrome_options
+                    options=self.chrome_options
                 )
             except Exception as e:
                 print(f"Failed to initialize Chrome WebDriver: {e}")
                 raise
         
-        self.articles = {}
-        self.tickers = tickers
-        
-    def scrape_wsj(self, company, max_articles=MAX_ARTICLES_PER_COMPANY):
+    def scrape_wsj(self, company, max_articles=MAX_ARTICLES_PER_COMPANY, stop_at=None):
         """Scrape Wall Street Journal articles about a company"""
         print(f"Scraping WSJ for news about {company}...")
         search_url = f"{NEWS_SOURCES['WSJ']}{company}"
         
-        self.driver.get(search_url)
-        time.sleep(3)  # Allow time for the page to load
+        self.load_page(search_url)
         
         articles = []
         try:
-            article_elements = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, "article.article"))
-            )
+            article_elements = wait_for_elements(self.driver, "article.article", site_profile(search_url)['element'])
             
             for article in article_elements[:max_articles]:
                 try:
@@ -75,6 +164,8 @@ class NewsTracker:
                     summary = article.find_element(By.CSS_SELECTOR, "p").text
                     date = article.find_element(By.CSS_SELECTOR, "p.WSJTheme--timestamp--1K7Z5rGT").text
                     link = article.find_element(By.CSS_SELECTOR, "h3 a").get_attribute("href")
+                    if stop_at is not None and link == stop_at:
+                        break
                     
                     articles.append({
                         "headline": headline,
@@ -90,19 +181,17 @@ class NewsTracker:
         
         return articles
     
-    def scrape_ft(self, company, max_articles=MAX_ARTICLES_PER_COMPANY):
+    def scrape_ft(self, company, max_articles=MAX_ARTICLES_PER_COMPANY, stop_at=None):
         """Scrape Financial Times articles about a company"""
         print(f"Scraping Financial Times for news about {company}...")
         search_url = f"{NEWS_SOURCES['Financial Times']}{company}"
         
-        self.driver.get(search_url)
-        time.sleep(3)  # Allow time for the page to load
+        self.load_page(search_url)
         
         articles = []
         try:
-            article_elements = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, "li.o-teaser-collection__item"))
-            )
+            article_elements = wait_for_elements(self.driver, "li.o-teaser-collection__item",
+                                                  site_profile(search_url)['element'])
             
             for article in article_elements[:max_articles]:
                 try:
@@ -112,6 +201,8 @@ class NewsTracker:
                     date_element = article.find_elements(By.CSS_SELECTOR, "div.o-teaser__timestamp")
                     date = date_element[0].text if date_element else "No date available"
                     link = article.find_element(By.CSS_SELECTOR, "a.js-teaser-heading-link").get_attribute("href")
+                    if stop_at is not None and link == stop_at:
+                        break
                     
                     articles.append({
                         "headline": headline,
@@ -127,36 +218,45 @@ class NewsTracker:
         
         return articles
     
-    def scrape_yahoo_finance(self, company, max_articles=MAX_ARTICLES_PER_COMPANY):
-        """Scrape Yahoo Finance articles about a company"""
+    def scrape_yahoo_finance(self, company, max_articles=MAX_ARTICLES_PER_COMPANY, stop_at=None):
+        """Scrape Yahoo Finance articles about a company, over HTTP when possible
+
+        With stop_at, only articles listed above that link are scraped.
+        """
+        if self.http_client is not None:
+            print(f"Fetching Yahoo Finance news for {company} over HTTP...")
+            start = time.time()
+            try:
+                articles = self.http_client.get_news(company, max_articles, stop_at=stop_at)
+                print(f"Found {len(articles)} articles in {time.time() - start:.2f}s.")
+                return articles
+            except Exception as e:
+                print(f"HTTP scrape of Yahoo Finance failed for {company} ({e}), falling back to Selenium")
+        return self.scrape_yahoo_finance_selenium(company, max_articles, stop_at=stop_at)
+    
+    def scrape_yahoo_finance_selenium(self, company, max_articles=MAX_ARTICLES_PER_COMPANY, stop_at=None):
+        """Scrape Yahoo Finance articles about a company with the Selenium WebDriver"""
         print(f"Scraping Yahoo Finance for news about {company}...")
         search_url = f"https://finance.yahoo.com/quote/{company}/news"
 
         articles = []
         try:
-            self.driver.get(search_url)
-            time.sleep(REQUEST_DELAY)  # Allow time for the page to load
+            self.load_page(search_url)
             
-            # Accept cookies if a consent dialog appears
-            try:
-                consent_button = WebDriverWait(self.driver, 5).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, "button[name='agree']"))
-                )
-                consent_button.click()
-                time.sleep(1)
-            except:
-                pass  # No consent dialog or different selector
+            # Accept cookies if we were redirected to the consent page
+            if "consent." in self.driver.current_url:
+                dismiss_consent(self.driver, [(By.CSS_SELECTOR, "button[name='agree']")], url=search_url)
 
             # Find the news articles
-            article_elements = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, "li.story-item"))
-            )
+            article_elements = wait_for_elements(self.driver, "li.story-item", site_profile(search_url)['element'])
             print(f"Found {len(article_elements)} articles.")
             for article in article_elements[:max_articles]:
                 try:
                     headline = article.find_element(By.CSS_SELECTOR, "h3").text
                     link_element = article.find_element(By.CSS_SELECTOR, "a")
                     link = link_element.get_attribute("href")
+                    if stop_at is not None and link == stop_at:
+                        break  # everything below was ingested on an earlier run
 
                     # For summary, we either need to click into the article or use the preview if available
                     summary_element = article.find_elements(By.CSS_SELECTOR, "p")
@@ -170,13 +270,18 @@ class NewsTracker:
                 except Exception as e:
                     print(f"Error extracting article details: {e}")
 
-            # After processing all articles, navigate to each link to get the full content
-            for article in articles:
+            # After processing all articles, navigate to each new link to get the full content;
+            # articles scraped on an earlier run are filled from the URL index instead
+            new_articles = self.url_index.fill_known(articles)
+            print(f"{len(articles) - len(new_articles)} articles already known, visiting {len(new_articles)}")
+            for article in new_articles:
+                if self._source_expired():
+                    print(f"Yahoo Finance ran out of time for {company}, returning its WebDriver")
+                    break
                 try:
-                    self.driver.get(article["link"])
-                    time.sleep(REQUEST_DELAY)  # Allow time for the page to load
-                    # Extract full content from the article page
-                    content_wrapper = self.driver.find_element(By.CSS_SELECTOR, "div.atoms-wrapper")
+                    # Extract full content from the article page once its body has rendered
+                    content_wrapper = self.load_page(article["link"], PRIORITY_ARTICLE,
+                                                     ready_selector="div.atoms-wrapper")[0]
 
                     if content_wrapper:
                         # Find all paragraph elements within the wrapper
@@ -187,6 +292,8 @@ class NewsTracker:
                         full_content = "No content available"
 
                     article["full_content"] = full_content
+                    if full_content and full_content != "No content available":
+                        self.url_index.put(article["link"], full_content)
                 except Exception as e:
                     if "retry" in str(e).lower():
                         print(f"Retry error encountered, aborting article processing: {e}")
@@ -194,39 +301,31 @@ class NewsTracker:
                     print(e)
                     
         except Exception as e:
-            # import pdb
-            # pdb.set_trace()
             print(f"Error scraping Yahoo Finance for {company}: {e}")
         
         return articles
     
-    def scrape_marketwatch(self, company, max_articles=MAX_ARTICLES_PER_COMPANY):
+    def scrape_marketwatch(self, company, max_articles=MAX_ARTICLES_PER_COMPANY, stop_at=None):
         """Scrape MarketWatch articles about a company"""
         print(f"Scraping MarketWatch for news about {company}...")
         search_url = f"https://www.marketwatch.com/search?q={company}&m=Keyword"
         
-        self.driver.get(search_url)
-        time.sleep(3)  # Allow time for the page to load
-        
+        timeout = site_profile(search_url)['element']
         articles = []
         try:
             # First, switch to the iframe where the content is located
-            iframe = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "iframe"))
-            )
+            iframe = self.load_page(search_url, ready_selector="iframe", by=By.TAG_NAME)[0]
             self.driver.switch_to.frame(iframe)
             print("Successfully switched to iframe")
-            # import pdb
-            # pdb.set_trace()
-            article_elements = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div.element.element--article"))
-            )
+            article_elements = wait_for_elements(self.driver, "div.element.element--article", timeout)
             print(f"Found {len(article_elements)} article elements")
             for article in article_elements[:max_articles]:
                 try:
                     headline_element = article.find_element(By.CSS_SELECTOR, "h3.article__headline")
                     headline = headline_element.text
                     link = headline_element.find_element(By.CSS_SELECTOR, "a").get_attribute("href")
+                    if stop_at is not None and link == stop_at:
+                        break
                     
                     summary_element = article.find_elements(By.CSS_SELECTOR, "p.article__summary")
                     summary = summary_element[0].text if summary_element else "No summary available"
@@ -248,34 +347,32 @@ class NewsTracker:
         
         return articles
     
-    def scrape_reuters(self, company, max_articles=MAX_ARTICLES_PER_COMPANY):
+    def scrape_reuters(self, company, max_articles=MAX_ARTICLES_PER_COMPANY, stop_at=None):
         """Scrape Reuters articles about a company"""
         print(f"Scraping Reuters for news about {company}...")
-        search_url = f"https://www.reuters.com/site-search/?query={company}"
+        # Sorted by date (relevance is the default) so the listing can stop at the high-water mark
+        search_url = f"https://www.reuters.com/site-search/?query={company}&sort=newest"
         
-        self.driver.get(search_url)
-        time.sleep(3)  # Allow time for the page to load
-        # import pdb
-        # pdb.set_trace()
         articles = []
         try:
+            self.load_page(search_url)
+
             # Try to handle cookie consent if it appears
             try:
-                cookie_button = WebDriverWait(self.driver, 5).until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Accept All')]"))
-                )
-                cookie_button.click()
-                time.sleep(1)
-            except:
-                print("No cookie consent dialog found or unable to click it")
+                if not dismiss_consent(self.driver, [(By.XPATH, "//button[contains(text(), 'Accept All')]")],
+                                       url=search_url):
+                    print("No cookie consent dialog found")
+            except Exception as e:
+                print(f"Unable to dismiss cookie consent dialog: {e}")
         
             # Find all article elements
-            article_elements = WebDriverWait(self.driver, 10).until(
-                EC.presence_of_all_elements_located((By.CSS_SELECTOR, "li[class*='search_results']"))
-            )
+            article_elements = wait_for_elements(self.driver, "li[class*='search_results']",
+                                                 site_profile(search_url)['element'])
         
             print(f"Found {len(article_elements)} Reuters articles about {company}")
         
+            # Read the whole listing first: visiting an article navigates the driver away
+            # and leaves the listing elements stale
             for article in article_elements[:max_articles]:
                 try:
                     # Extract headline
@@ -287,24 +384,41 @@ class NewsTracker:
                     link = link_element.get_attribute("href")
                     if link and not link.startswith("http"):
                         link = "https://www.reuters.com" + link
+                    if stop_at is not None and link == stop_at:
+                        break
 
-                    # Extract summary
-                    summary_element = self.get_full_article_content(link)
-                    summary = summary_element[0].text.strip() if summary_element else "No summary available"
-                
                     # Extract date
                     date_element = article.find_elements(By.CSS_SELECTOR, "div[class*='date']")
                     date = date_element[0].text.strip() if date_element else "No date available"
                 
                     articles.append({
                         "headline": headline,
-                        "summary": summary,
                         "date": date,
                         "link": link,
                         "source": "Reuters"
                     })
                 except Exception as e:
                     print(f"Error extracting Reuters article details: {e}")
+
+            # Then fetch each new article; its first paragraph doubles as the summary
+            for article in self.url_index.fill_known(articles):
+                if self._source_expired():
+                    print(f"Reuters ran out of time for {company}, returning its WebDriver")
+                    break
+                try:
+                    content = self.get_full_article_content(article["link"])
+                except Exception as e:
+                    print(f"Error retrieving Reuters article {article['link']}: {e}")
+                    content = ""
+                article["full_content"] = content or "No content available"
+                if content:
+                    self.url_index.put(article["link"], content)
+            for article in articles:
+                content = article.get("full_content")
+                if content and content != "No content available":
+                    article["summary"] = content.split("\n\n")[0].strip()
+                else:
+                    article["summary"] = "No summary available"
         except Exception as e:
             print(f"Error scraping Reuters for {company}: {e}")
         
@@ -314,15 +428,18 @@ class NewsTracker:
         """Visit an article URL and extract the full article content"""
         print(f"Retrieving full article content from: {article_url}")
         
-        self.driver.get(article_url)
-        time.sleep(3)  # Allow time for the page to load
+        try:
+            self.load_page(article_url, PRIORITY_FOLLOWUP, ready_selector="p", by=By.TAG_NAME)
+        except Exception as e:
+            print(f"Note: no paragraphs appeared on {article_url}: {e}")
         
         # Handle potential cookie/consent dialogs
         try:
-            cookie_buttons = self.driver.find_elements(By.XPATH, "//button[contains(text(), 'Accept') or contains(text(), 'I agree') or contains(text(), 'Continue')]")
-            if cookie_buttons:
-                cookie_buttons[0].click()
-                time.sleep(1)
+            dismiss_consent(
+                self.driver,
+                [(By.XPATH, "//button[contains(text(), 'Accept') or contains(text(), 'I agree') or contains(text(), 'Continue')]")],
+                url=article_url
+            )
         except Exception as e:
             print(f"Note: {e}")
         
@@ -370,28 +487,97 @@ class NewsTracker:
         
         return article_content
 
+    def _scrape_source(self, source, company, deadline=None):
+        """Run one source's scraper in a collector worker, then return its WebDriver to the pool"""
+        self._local.deadline = deadline
+        try:
+            scraper = getattr(self, self.SCRAPERS[source])
+            return scraper(company, stop_at=self._stop_at(company, source))
+        finally:
+            self._local.deadline = None
+            self.release_driver()
+    
+    def _make_collector(self, ticker_workers=1):
+        sources = {name: (lambda company, deadline, name=name: self._scrape_source(name, company, deadline))
+                   for name in self.sources}
+        # The pool has no spare WebDrivers: a source past its deadline stops before its next article
+        # visit and returns its driver, and a source waiting for a driver gives up at its own deadline.
+        # The extra workers only let the next ticker's sources start while late ones wind down.
+        return NewsCollector(sources, NEWS_SOURCE_DEADLINES, max_workers=2 * len(sources) * ticker_workers)
+    
     def get_news_for_company(self, company):
-        """Get news articles about a company from all configured sources"""
-        all_articles = []
-        
-        yahoo_articles = self.scrape_yahoo_finance(company)
-        all_articles.extend(yahoo_articles)
-        time.sleep(REQUEST_DELAY)
-        
-        # marketwatch_articles = self.scrape_marketwatch(company)
-        # all_articles.extend(marketwatch_articles)
-
-        # reuters_articles = self.scrape_reuters(company)
-        # all_articles.extend(reuters_articles)
+        """Get news articles about a company from all configured sources, collected concurrently"""
+        collector = self.collector or self._make_collector()
+        try:
+            results, report = collector.collect(company)
+        finally:
+            if collector is not self.collector:
+                collector.close()
+        self.source_reports[company] = report
+        print(f"{company}: " + ", ".join(
+            f"{name} {r['status']} ({r['articles']} articles, {r['seconds']:.1f}s)" for name, r in report.items()))
+        
+        for source, articles in results.items():
+            self._mark_newest(company, source, articles)
+        all_articles = merge_articles(results, self.sources)
     
+        if self.incremental:
+            self.new_articles[company] = all_articles
+            print(f"{len(all_articles)} new articles for {company}")
+            all_articles = self._merge_with_stored(company, all_articles)
         self.articles[company] = all_articles
         return all_articles
     
+    def _stop_at(self, company, source):
+        """High-water mark to stop a source's listing at, for listings sorted newest first"""
+        if not self.incremental or source not in NEWS_DATE_SORTED_SOURCES:
+            return None
+        return self.url_index.high_water_mark(company, source)
+    
+    def _mark_newest(self, company, source, articles):
+        """Remember the newest article of a date-sorted source; written with save_data"""
+        if articles and source in NEWS_DATE_SORTED_SOURCES:
+            self.pending_marks[(company, source)] = articles[0]["link"]
+    
+    def _merge_with_stored(self, company, new_articles):
+        """New articles first, then the ticker's stored ones, up to the article cap"""
+        links = {article.get("link") for article in new_articles}
+        stored = [article for article in self.stored_articles.get(company, []) if article.get("link") not in links]
+        limit = max(MAX_ARTICLES_PER_COMPANY, len(new_articles))
+        return (new_articles + stored)[:limit]
+    
+    def _load_stored_articles(self):
+        """The latest saved articles per ticker, that new articles are merged into"""
+        try:
+            return self.archive.latest_by_ticker()
+        except Exception as e:
+            print(f"Error loading stored news from {self.archive.path}: {e}")
+            return {}
+    
+    def _get_news_worker(self, ticker):
+        try:
+            return self.get_news_for_company(ticker)
+        except Exception as e:
+            print(f"Error getting news for {ticker}: {e}")
+            self.articles[ticker] = []
+            return []
+        finally:
+            self.release_driver()
+    
+    def _browser_sources(self):
+        """Sources that need a WebDriver (Yahoo Finance is fetched over plain HTTP in 'http' mode)"""
+        return [name for name in self.sources if not (name == "Yahoo Finance" and self.scraper_mode == 'http')]
+
     def get_news_for_tickers(self, tickers):
-        """Get news for a list of company tickers"""
-        for ticker in tickers:
-            self.get_news_for_company(ticker)
-            time.sleep(REQUEST_DELAY)
+        """Get news for a list of company tickers, as many at once as the WebDriver pool can serve"""
+        ticker_workers = max(1, self.driver_pool.size // max(1, len(self._browser_sources())))
+        self.collector = self._make_collector(ticker_workers)
+        try:
+            with ThreadPoolExecutor(max_workers=ticker_workers) as executor:
+                list(executor.map(self._get_news_worker, tickers))
+        finally:
+            self.collector.close()
+            self.collector = None
             
         return self.articles
 
@@ -401,6 +587,9 @@ class NewsTracker:
         if not tickers:
             tickers = self.tickers
         self.articles = {}
+        self.new_articles = {}
+        self.pending_marks = {}
+        self.stored_articles = self._load_stored_articles() if self.incremental else {}
         try:
             self.get_news_for_tickers(self.tickers)
             
@@ -417,9 +606,13 @@ class NewsTracker:
             self.close()        
     
     def close(self):
-        """Close the Selenium WebDriver"""
-        if self.driver:
-            self.driver.quit()
+        """Close the Selenium WebDrivers, crawl frontier and HTTP session"""
+        self._local.driver = None
+        self.driver_pool.close()
+        self.frontier.close()
+        self.url_index.save()
+        if self.http_client is not None:
+            self.http_client.close()
 
     def get_news_from_fmp(self, ticker, time_from, time_to):
         """Get news from Financial Modeling Prep API for a given ticker and time range."""
@@ -459,26 +652,18 @@ class NewsTracker:
             print(f"Error fetching news from FMP API: {e}")
             return []
     
-    def save_data(self, filepath="data/news_data.pkl"):
-        """Save the tracked data to a pickle file"""
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    def save_data(self, filepath=None):
+        """Save today's articles to the news archive (filepath: another archive database)"""
+        archive = self.archive if filepath is None or filepath == self.archive.path else ArticleArchive(filepath)
         
         current_date = datetime.now().strftime("%Y-%m-%d")
-        new_data = {
-            current_date: self.articles
-        }
+        new_bodies = archive.put_snapshot(current_date, self.articles)
+        indexed = self.search_index.add(current_date, self.articles)
         
-        if os.path.exists(filepath):
-            with open(filepath, 'rb') as f:
-                existing_data = pickle.load(f)
-                existing_data.update(new_data)
-            with open(filepath, 'wb') as f:
-                pickle.dump(existing_data, f)
-        else:
-            with open(filepath, 'wb') as f:
-                pickle.dump(new_data, f)
-        
-        print(f"News data saved to {filepath}")
+        # Only advance the high-water marks once the articles above them are stored
+        self.url_index.set_high_water_marks(self.pending_marks)
+        self.pending_marks = {}
+        print(f"News data saved to {archive.path} ({new_bodies} new article bodies, {indexed} articles indexed for search)")
 
     def save_latest_data(self, filepath="data/news_data_latest.pkl"):
         """Save only the latest data (for cloud upload)"""
@@ -0,0 +1,109 @@
+import time
+from urllib.parse import urlparse
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
+from src.config import PAGE_TIMEOUT_PROFILES
+
+NETWORK_IDLE_POLL = 0.1
+
+
+def site_profile(url):
+    """Timeout profile for the site serving url (longest matching domain suffix wins)"""
+    host = urlparse(url).netloc.lower()
+    matches = [domain for domain in PAGE_TIMEOUT_PROFILES if domain != 'default' and
+               (host == domain or host.endswith('.' + domain))]
+    profile = dict(PAGE_TIMEOUT_PROFILES['default'])
+    if matches:
+        profile.update(PAGE_TIMEOUT_PROFILES[max(matches, key=len)])
+    return profile
+
+
+def wait_for_ready_state(driver, timeout, states=('interactive', 'complete')):
+    """Wait until document.readyState reaches one of states; False on timeout"""
+    try:
+        WebDriverWait(driver, timeout).until(
+            lambda d: d.execute_script("return document.readyState") in states
+        )
+        return True
+    except TimeoutException:
+        return False
+
+
+def wait_for_network_idle(driver, idle_time, timeout):
+    """Wait until no new resources have loaded for idle_time seconds; False on timeout
+
+    Uses the Resource Timing API, so it sees requests started by scripts
+    (lazy-loaded lists, iframes) that readyState does not cover.
+    """
+    deadline = time.monotonic() + timeout
+    last_count = -1
+    quiet_since = time.monotonic()
+    while time.monotonic() < deadline:
+        try:
+            count = driver.execute_script("return performance.getEntriesByType('resource').length")
+        except Exception:
+            return False
+        now = time.monotonic()
+        if count != last_count:
+            last_count, quiet_since = count, now
+        elif now - quiet_since >= idle_time:
+            return True
+        time.sleep(NETWORK_IDLE_POLL)
+    return False
+
+
+def wait_for_elements(driver, selector, timeout, by=By.CSS_SELECTOR):
+    """Wait for at least one element matching selector and return all matches
+
+    Raises TimeoutException like WebDriverWait, so callers keep their
+    existing error handling.
+    """
+    return WebDriverWait(driver, timeout).until(EC.presence_of_all_elements_located((by, selector)))
+
+
+def load_page(driver, url, ready_selector=None, network_idle=None, by=By.CSS_SELECTOR):
+    """Navigate to url and return as soon as the page is usable
+
+    Waits for document.readyState, then, with ready_selector, for the first
+    matching element (returning the matches), and optionally for the network
+    to go idle. Timeouts come from the site's profile instead of a fixed sleep.
+    """
+    profile = site_profile(url)
+    driver.set_page_load_timeout(profile['load'])
+    try:
+        driver.get(url)
+    except TimeoutException:
+        print(f"Page load timed out after {profile['load']}s, continuing with what has loaded: {url}")
+    wait_for_ready_state(driver, profile['load'])
+    elements = None
+    if ready_selector:
+        elements = wait_for_elements(driver, ready_selector, profile['element'], by=by)
+    if network_idle is None:
+        network_idle = profile['network_idle']
+    if network_idle:
+        wait_for_network_idle(driver, profile['idle'], profile['load'])
+    return elements
+
+
+def dismiss_consent(driver, locators, url=None):
+    """Click the first clickable consent button among locators and wait for it to go away
+
+    Returns True if a button was clicked. Waits only for the profile's
+    consent timeout when no dialog is shown.
+    """
+    profile = site_profile(url or driver.current_url)
+    conditions = [EC.element_to_be_clickable(locator) for locator in locators]
+    try:
+        button = WebDriverWait(driver, profile['consent']).until(EC.any_of(*conditions))
+    except TimeoutException:
+        return False
+    button.click()
+    try:
+        WebDriverWait(driver, profile['element']).until(
+            EC.any_of(EC.staleness_of(button), EC.invisibility_of_element(button))
+        )
+    except TimeoutException:
+        pass
+    return True
@@ -0,0 +1,179 @@
+import warnings
+import numpy as np
+import pandas as pd
+
+# Look-back windows (in trading days) for sector-relative returns
+RETURN_HORIZONS = {
+    '1m': 21,
+    '3m': 63,
+    '1y': 252
+}
+
+# A history this close to a horizon (e.g. the ~250 bars of a 1y download for '1y') is
+# measured over its whole length instead of leaving the horizon empty
+HORIZON_COVERAGE = 0.9
+
+# Fundamental ratios compared against the peer-group median
+PEER_RATIOS = ['P/E', 'Forward P/E', 'Price/Book', 'Debt/Equity', 'ROE', 'Profit Margin']
+
+
+def _clean(value):
+    """Convert NaN to None so results match the rest of the analysis dicts"""
+    return None if pd.isna(value) else float(value)
+
+
+class PeerGroupIndex:
+    """Precomputed sector/industry peer groups over aligned price and fundamentals panels
+
+    Tickers get a fixed column position shared by the close-price panel
+    (dates x tickers) and the ratio panel (tickers x ratios). Each sector and
+    industry maps to an integer index array of its members, and group
+    statistics are computed with grouped vectorized operations over the
+    factorized group codes rather than per-ticker loops.
+    """
+
+    def __init__(self, stock_data=None, fundamentals_data=None, min_peers=2):
+        self.stock_data = stock_data or {}
+        self.fundamentals_data = fundamentals_data or {}
+        self.min_peers = min_peers
+        self.tickers = []
+        self.ticker_index = {}
+        self.close = None
+        self.ratios = None
+        self.codes = {}
+        self.labels = {}
+        self.members = {}
+        self.build()
+
+    def _latest_ratios(self, ticker):
+        """Return the most recent ratios dict for a ticker from fundamentals_data"""
+        data = self.fundamentals_data.get(ticker) or {}
+        if 'ratios' in data:
+            return data['ratios'] or {}
+        dated = [key for key, value in data.items() if isinstance(value, dict) and value.get('ratios')]
+        return data[max(dated)]['ratios'] if dated else {}
+
+    def build(self):
+        """Build the ticker ordering, panels and group membership arrays"""
+        stocks = self.stock_data.get('stocks', {})
+        self.tickers = sorted(set(stocks.keys()) | set(self.fundamentals_data.keys()))
+        self.ticker_index = {ticker: i for i, ticker in enumerate(self.tickers)}
+
+        closes = {}
+        sectors, industries = [], []
+        for ticker in self.tickers:
+            data = stocks.get(ticker) or {}
+            hist = data.get('history')
+            if isinstance(hist, pd.DataFrame) and not hist.empty and 'Close' in hist:
+                closes[ticker] = hist['Close']
+            info = data.get('info') or {}
+            sectors.append(info.get('sector'))
+            industries.append(info.get('industry'))
+
+        # Reindex to self.tickers so panel column i is always ticker i
+        self.close = pd.DataFrame(closes).sort_index().reindex(columns=self.tickers)
+        self.ratios = pd.DataFrame(
+            [self._latest_ratios(ticker) for ticker in self.tickers],
+            index=self.tickers
+        ).reindex(columns=PEER_RATIOS).apply(pd.to_numeric, errors='coerce')
+
+        for level, values in (('sector', sectors), ('industry', industries)):
+            codes, labels = pd.factorize(pd.Series(values, dtype=object))
+            self.codes[level] = codes
+            self.labels[level] = list(labels)
+            self.members[level] = {label: np.flatnonzero(codes == k) for k, label in enumerate(labels)}
+
+    def peers(self, ticker, level='sector'):
+        """Return the other members of a ticker's peer group"""
+        i = self.ticker_index.get(ticker)
+        if i is None or self.codes[level][i] < 0:
+            return []
+        group = self.labels[level][self.codes[level][i]]
+        return [self.tickers[j] for j in self.members[level][group] if j != i]
+
+    def _group_keys(self, level):
+        """Group code per ticker, NaN for tickers without a group or in groups below min_peers"""
+        codes = pd.Series(self.codes[level], index=self.tickers, dtype=float)
+        sizes = codes.map(codes.value_counts())
+        return codes.where((codes >= 0) & (sizes >= self.min_peers))
+
+    def trailing_returns(self):
+        """Trailing returns for every ticker and horizon, computed on the whole panel at once"""
+        close = self.close.ffill()
+        returns = {}
+        for name, bars in RETURN_HORIZONS.items():
+            if len(close) <= bars and len(close) - 1 >= bars * HORIZON_COVERAGE:
+                bars = len(close) - 1
+            if len(close) > bars:
+                returns[name] = close.iloc[-1] / close.iloc[-1 - bars] - 1
+            else:
+                returns[name] = pd.Series(np.nan, index=self.tickers)
+        return pd.DataFrame(returns).reindex(self.tickers)
+
+    def _peer_median(self, values, keys):
+        """Median over each ticker's group excluding the ticker itself, NaN outside a group
+
+        Each group is one (member x peer x column) block with the member's own
+        row masked out, reduced with nanmedian.
+        """
+        result = pd.DataFrame(np.nan, index=values.index, columns=values.columns)
+        data = values.to_numpy(dtype=float)
+        codes = keys.to_numpy()
+        for code in keys.dropna().unique():
+            rows = np.flatnonzero(codes == code)
+            block = np.repeat(data[rows][np.newaxis], len(rows), axis=0)
+            block[np.arange(len(rows)), np.arange(len(rows))] = np.nan
+            with warnings.catch_warnings():
+                # Peers without a value for a column give an all-NaN slice
+                warnings.simplefilter('ignore', RuntimeWarning)
+                result.iloc[rows] = np.nanmedian(block, axis=1)
+        return result
+
+    def relative_metrics(self, level='sector'):
+        """Sector-relative returns, relative valuation and peer-median ratio comparisons
+
+        Peer medians leave the ticker itself out, so it is compared with its peers only.
+        """
+        keys = self._group_keys(level)
+        returns = self.trailing_returns()
+
+        peer_returns = self._peer_median(returns, keys)
+        peer_ratios = self._peer_median(self.ratios, keys)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            relative_ratios = self.ratios / peer_ratios
+
+        frame = pd.concat({
+            'return': returns,
+            'peer_median_return': peer_returns,
+            'relative_return': returns - peer_returns,
+            'ratio': self.ratios,
+            'peer_median_ratio': peer_ratios,
+            'relative_ratio': relative_ratios.replace([np.inf, -np.inf], np.nan)
+        }, axis=1)
+        return frame
+
+    def analyze(self, level='sector'):
+        """Return per-ticker peer comparisons as plain dicts, in the style of DecisionEngine analyses"""
+        if not self.tickers:
+            return {'error': 'No data available for peer groups'}
+
+        frame = self.relative_metrics(level)
+        group_labels = self.labels[level]
+        analysis = {}
+        for i, ticker in enumerate(self.tickers):
+            row = frame.loc[ticker]
+            code = self.codes[level][i]
+            entry = {
+                level: group_labels[code] if code >= 0 else None,
+                'peers': self.peers(ticker, level)
+            }
+            for horizon in RETURN_HORIZONS:
+                entry[f'return_{horizon}'] = _clean(row[('return', horizon)])
+                entry[f'peer_median_return_{horizon}'] = _clean(row[('peer_median_return', horizon)])
+                entry[f'relative_return_{horizon}'] = _clean(row[('relative_return', horizon)])
+            entry['peer_median_ratios'] = {ratio: _clean(row[('peer_median_ratio', ratio)]) for ratio in PEER_RATIOS}
+            entry['relative_ratios'] = {ratio: _clean(row[('relative_ratio', ratio)]) for ratio in PEER_RATIOS}
+            entry['relative_pe'] = entry['relative_ratios']['P/E']
+            analysis[ticker] = entry
+        return analysis
+
@@ -9,6 +9,7 @@ from src.stock_tracker import StockTracker
 from src.news_tracker import NewsTracker
 from src.fundamentals_tracker import FundamentalsTracker
 from src.decision_engine import DecisionEngine
+from src.alert_engine import AlertEngine
 from src.config import COMPANIES, INVESTORS
 import numpy as np
 import schedule
@@ -37,6 +38,10 @@ class TaskScheduler:
         self.data_dir = "data"
         os.makedirs(self.data_dir, exist_ok=True)
         
+        # Alert engine, resumed from its saved per-symbol state
+        self.alert_engine = AlertEngine(data_dir=self.data_dir)
+        self.alert_engine.load_state()
+        
         # File to track last daily run
         self.last_run_file = os.path.join(self.data_dir, "last_daily_run.txt")
         
@@ -149,7 +154,7 @@ class TaskScheduler:
         if not self.skip_news:
             print("Collecting news articles...")
             news_data = self.news_tracker.track(tickers=self.tickers)
-            self.news_tracker.save_data(f"{self.data_dir}/news_data.pkl")
+            self.news_tracker.save_data(f"{self.data_dir}/news_archive.db")
         else:
             print("Skipping news collection as requested.")
         
@@ -366,6 +371,13 @@ class TaskScheduler:
         
         print(f"Full analysis completed at {datetime.now()}")
     
+    def check_alerts(self):
+        """Evaluate alert rules against any stock or recommendation data written since the last check"""
+        alerts = self.alert_engine.check()
+        if alerts:
+            print(f"{len(alerts)} alert(s) triggered at {datetime.now()}")
+        return alerts
+    
     def schedule_tasks(self):
         """Schedule daily and monthly tasks with startup compensation"""
         # Check if we missed the daily run due to system being powered off
@@ -380,9 +392,13 @@ class TaskScheduler:
             # Schedule daily tasks at 8 AM
             schedule.every().day.at("08:00").do(self.run_daily_tasks)
         
+        # Alert rules only touch data that changed, so checking every minute is cheap
+        schedule.every().minute.do(self.check_alerts)
+        
         print("Scheduled tasks:")
         print("- Daily tasks at 8:00 AM")
         print("- Monthly tasks on the 1st of each month at 10:00 AM")
+        print("- Alert checks every minute")
         print("- Startup compensation for missed daily runs")
         
         print("Scheduler running continuously. Press Ctrl+C to exit.")
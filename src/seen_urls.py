@@ -0,0 +1,205 @@
+import os
+import math
+import pickle
+import sqlite3
+import hashlib
+import threading
+from datetime import datetime
+from contextlib import closing
+from src.config import NEWS_URL_INDEX_DB, NEWS_URL_BLOOM_CAPACITY, NEWS_URL_BLOOM_ERROR_RATE
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings, using double hashing of one BLAKE2b digest"""
+
+    def __init__(self, capacity, error_rate):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, key):
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class SeenURLIndex:
+    """Persistent index of scraped article links and their extracted text
+
+    A SQLite table maps link -> content hash, full_content and first/last
+    seen times. A Bloom filter in front of it, kept in a file next to the
+    database, answers "never seen" for new links without touching SQLite,
+    so only links that might be known cost a lookup. The filter is rebuilt
+    from the table with twice the capacity once it fills up.
+
+    It also keeps the high-water mark of incremental ingestion: the link of
+    the newest article ingested per ticker and source.
+    """
+
+    def __init__(self, path=NEWS_URL_INDEX_DB, capacity=NEWS_URL_BLOOM_CAPACITY,
+                 error_rate=NEWS_URL_BLOOM_ERROR_RATE, seed=None):
+        self.path = path
+        self.bloom_path = f"{os.path.splitext(path)[0]}.bloom"
+        self.error_rate = error_rate
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        is_new = not os.path.exists(path)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS seen_urls (
+                    link TEXT PRIMARY KEY,
+                    content_hash TEXT,
+                    full_content TEXT,
+                    first_seen TEXT,
+                    last_seen TEXT
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS high_water_marks (
+                    ticker TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    link TEXT NOT NULL,
+                    updated TEXT,
+                    PRIMARY KEY (ticker, source)
+                )
+            """)
+        self.bloom = self._load_bloom(capacity)
+        if is_new and seed is not None:
+            self.import_history(seed())
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def __len__(self):
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM seen_urls").fetchone()[0]
+
+    def _load_bloom(self, capacity):
+        if os.path.exists(self.bloom_path):
+            try:
+                with open(self.bloom_path, 'rb') as f:
+                    bloom = pickle.load(f)
+                if bloom.count <= bloom.capacity:
+                    return bloom
+            except Exception as e:
+                print(f"Error loading URL Bloom filter, rebuilding: {e}")
+        return self._rebuild_bloom(max(capacity, 2 * len(self)))
+
+    def _rebuild_bloom(self, capacity):
+        bloom = BloomFilter(capacity, self.error_rate)
+        with closing(self._connect()) as conn:
+            for (link,) in conn.execute("SELECT link FROM seen_urls"):
+                bloom.add(link)
+        return bloom
+
+    def save(self):
+        """Write the Bloom filter to disk (the table is always up to date)"""
+        temp_path = f"{self.bloom_path}.tmp"
+        with self._lock:
+            with open(temp_path, 'wb') as f:
+                pickle.dump(self.bloom, f)
+        os.replace(temp_path, self.bloom_path)
+
+    @staticmethod
+    def content_hash(text):
+        return hashlib.sha256((text or '').encode('utf-8')).hexdigest()
+
+    def might_contain(self, link):
+        """False means the link was definitely never stored"""
+        with self._lock:
+            return link in self.bloom
+
+    def get(self, link):
+        """Return {'content_hash', 'full_content'} for a stored link, or None"""
+        if not self.might_contain(link):
+            return None
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT content_hash, full_content FROM seen_urls WHERE link = ?", (link,)
+            ).fetchone()
+        return {'content_hash': row[0], 'full_content': row[1]} if row else None
+
+    def put_many(self, items):
+        """Store (link, full_content) pairs, keeping the first-seen time of known links"""
+        items = [(link, content) for link, content in items if link]
+        if not items:
+            return
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with closing(self._connect()) as conn, conn:
+            conn.executemany("""
+                INSERT INTO seen_urls (link, content_hash, full_content, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(link) DO UPDATE SET
+                    content_hash = excluded.content_hash,
+                    full_content = excluded.full_content,
+                    last_seen = excluded.last_seen
+            """, [(link, self.content_hash(content), content, now, now) for link, content in items])
+        with self._lock:
+            for link, _ in items:
+                if link not in self.bloom:
+                    self.bloom.add(link)
+            if self.bloom.count > self.bloom.capacity:
+                self.bloom = self._rebuild_bloom(2 * max(self.bloom.capacity, self.bloom.count))
+
+    def put(self, link, full_content):
+        self.put_many([(link, full_content)])
+
+    def fill_known(self, articles):
+        """Copy stored full_content into articles whose link is known
+
+        Returns the articles that still need fetching.
+        """
+        missing = []
+        for article in articles:
+            known = self.get(article.get('link'))
+            if known is not None and known['full_content']:
+                article['full_content'] = known['full_content']
+            else:
+                missing.append(article)
+        return missing
+
+    def high_water_mark(self, ticker, source):
+        """Link of the newest article ingested for ticker from source, or None"""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT link FROM high_water_marks WHERE ticker = ? AND source = ?", (ticker, source)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_high_water_marks(self, marks):
+        """Record {(ticker, source): link} as the newest ingested articles"""
+        if not marks:
+            return
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO high_water_marks (ticker, source, link, updated) VALUES (?, ?, ?, ?)",
+                [(ticker, source, link, now) for (ticker, source), link in marks.items()]
+            )
+
+    def import_history(self, history):
+        """Seed the index with every article body in a {date: {ticker: [articles]}} history"""
+        contents = {}
+        for snapshot in (history or {}).values():
+            for articles in (snapshot or {}).values():
+                for article in articles or []:
+                    content = article.get('full_content')
+                    if article.get('link') and content and content != "No content available":
+                        contents[article['link']] = content
+        self.put_many(contents.items())
+        self.save()
+        print(f"Indexed {len(contents)} known article links")
+        return len(contents)
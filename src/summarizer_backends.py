@@ -0,0 +1,225 @@
+import os
+import re
+import json
+from collections import Counter
+from src.keyword_sentiment import KeywordAutomaton, tokenize
+from src.llm_stream import parse_stream
+from src.config import SENTIMENT_LEXICON, STOPWORDS, NEWS_SUMMARY_STREAM, NEWS_SUMMARY_MAX_THINK_CHARS
+
+SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+|\n+')
+FIGURE_PATTERN = re.compile(
+    r'[$€£]?\d[\d,]*(?:\.\d+)?\s?(?:%|percent\b|billion\b|million\b|trillion\b|bn\b|mn\b|[BMK]\b)?'
+)
+
+
+class SummarizerBackend:
+    """Interface for NewsSummarizer backends
+
+    summarize(ticker, articles_batch, prompt) returns a dict with the keys
+    summary, positive_factors, negative_factors, sentiment and price_impact,
+    and raises on failure. cache_name identifies the backend in summary cache
+    keys; backends that are cheap to rerun set cacheable to False.
+    """
+
+    name = 'base'
+    cacheable = True
+
+    @property
+    def cache_name(self):
+        return self.name
+
+    def summarize(self, ticker, articles_batch, prompt):
+        raise NotImplementedError
+
+
+class TogetherBackend(SummarizerBackend):
+    """Chat-completions summarization through the Together API
+
+    With stream enabled, <think> reasoning is dropped as it arrives and the
+    JSON answer is parsed incrementally: on_field(ticker, key, value) fires
+    as each top-level field completes, and malformed output or reasoning
+    longer than max_think_chars aborts the request immediately so the
+    summarizer can retry.
+    """
+
+    name = 'together'
+
+    def __init__(self, model="deepseek-ai/DeepSeek-R1-Distill-Llama-70B-free", api_key=None, client=None,
+                 stream=NEWS_SUMMARY_STREAM, max_think_chars=NEWS_SUMMARY_MAX_THINK_CHARS, on_field=None):
+        from together import Together
+        self.model = model
+        self.client = client or Together(api_key=api_key or os.environ.get("TOGETHER_API_KEY"))
+        self.stream = stream
+        self.max_think_chars = max_think_chars
+        self.on_field = on_field
+
+    @property
+    def cache_name(self):
+        return self.model
+
+    def summarize(self, ticker, articles_batch, prompt):
+        if self.stream:
+            return self.summarize_stream(ticker, prompt)
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+        )
+        summary = response.choices[0].message.content
+        # Remove <think>...</think> blocks
+        text = re.sub(r'<think>.*?</think>', '', summary, flags=re.DOTALL)
+        # Check if there's a JSON code block
+        json_block_match = re.search(r'```(?:json)?([\s\S]*?)```', text, re.DOTALL)
+        if json_block_match:
+            json_str = json_block_match.group(1).strip()
+        else:
+            json_str = text.strip()
+        return json.loads(json_str)
+
+    def summarize_stream(self, ticker, prompt):
+        """Stream the completion and return the parsed JSON object"""
+        on_field = None
+        if self.on_field is not None:
+            on_field = lambda key, value: self.on_field(ticker, key, value)
+        stream = self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            stream=True,
+        )
+        chunks = (chunk.choices[0].delta.content for chunk in stream
+                  if chunk.choices and chunk.choices[0].delta.content)
+        try:
+            return parse_stream(chunks, on_field, self.max_think_chars)
+        finally:
+            # Closing early stops generation we no longer need (trailing text or an aborted answer)
+            close = getattr(stream, 'close', None)
+            if close is not None:
+                close()
+
+
+class LocalExtractiveBackend(SummarizerBackend):
+    """Offline extractive summarizer producing the same JSON shape as the LLM prompt
+
+    Sentences are scored by term centrality within the batch, presence of
+    figures (numbers, percentages, money), mentions of the ticker and
+    lexicon sentiment strength. The top sentences form the summary; the
+    strongest positive and negative sentences become factors with their
+    extracted figures as metrics. No network access or model downloads.
+    """
+
+    name = 'local'
+    cacheable = False
+
+    def __init__(self, lexicon=None, summary_sentences=6, max_factors=4, sentiment_threshold=1.0):
+        self.automaton = KeywordAutomaton(dict(SENTIMENT_LEXICON if lexicon is None else lexicon))
+        self.summary_sentences = summary_sentences
+        self.max_factors = max_factors
+        self.sentiment_threshold = sentiment_threshold
+
+    def _sentences(self, articles_batch):
+        """Split every article into (article index, position, sentence) triples, dropping duplicates"""
+        seen = set()
+        sentences = []
+        for a, article in enumerate(articles_batch):
+            position = 0
+            for field in ('headline', 'summary', 'full_content'):
+                for sentence in SENTENCE_SPLIT.split(article.get(field, '') or ''):
+                    sentence = sentence.strip()
+                    key = sentence.lower()
+                    if len(sentence) < 20 or key in seen:
+                        continue
+                    seen.add(key)
+                    sentences.append((a, position, sentence))
+                    position += 1
+        return sentences
+
+    def summarize(self, ticker, articles_batch, prompt=None):
+        sentences = self._sentences(articles_batch)
+        if not sentences:
+            return {
+                "summary": f"No substantive article text available for {ticker}.",
+                "positive_factors": [],
+                "negative_factors": [],
+                "sentiment": "neutral",
+                "price_impact": "No clear impact from the available articles"
+            }
+
+        tokens = [tokenize(sentence) for _, _, sentence in sentences]
+        frequencies = Counter(t for sentence_tokens in tokens for t in sentence_tokens if t not in STOPWORDS)
+        top_frequency = max(frequencies.values()) if frequencies else 1
+        ticker_token = ticker.lower()
+
+        scored = []
+        total_sentiment = 0.0
+        for (article, position, sentence), sentence_tokens in zip(sentences, tokens):
+            content = [t for t in sentence_tokens if t not in STOPWORDS]
+            centrality = sum(frequencies[t] for t in content) / (top_frequency * max(len(content), 1))
+            figures = [m.group(0).strip() for m in FIGURE_PATTERN.finditer(sentence)]
+            sentiment = sum(weight for _, weight in self.automaton.matches(sentence_tokens))
+            total_sentiment += sentiment
+
+            score = centrality
+            score += 1.0 if figures else 0.0
+            score += 0.5 if ticker_token in sentence_tokens else 0.0
+            score += 0.3 * min(abs(sentiment), 3)
+            score += 0.5 if position == 0 else 0.0  # headline / lede
+            scored.append({
+                'article': article,
+                'position': position,
+                'sentence': sentence,
+                'figures': figures,
+                'sentiment': sentiment,
+                'score': score
+            })
+
+        ranked = sorted(scored, key=lambda s: s['score'], reverse=True)
+        summary_sentences = sorted(ranked[:self.summary_sentences], key=lambda s: (s['article'], s['position']))
+
+        def factors(sign):
+            candidates = [s for s in ranked if s['sentiment'] * sign > 0]
+            candidates.sort(key=lambda s: (bool(s['figures']), abs(s['sentiment']), s['score']), reverse=True)
+            return [
+                {"factor": s['sentence'], "metrics": ", ".join(s['figures']) if s['figures'] else "No figures reported"}
+                for s in candidates[:self.max_factors]
+            ]
+
+        positive_factors = factors(1)
+        negative_factors = factors(-1)
+
+        if total_sentiment > self.sentiment_threshold:
+            sentiment = "positive"
+        elif total_sentiment < -self.sentiment_threshold:
+            sentiment = "negative"
+        elif positive_factors and negative_factors:
+            sentiment = "mixed"
+        else:
+            sentiment = "neutral"
+
+        if sentiment == "positive":
+            price_impact = f"Likely upward pressure on {ticker} (lexicon score {total_sentiment:+.1f})"
+        elif sentiment == "negative":
+            price_impact = f"Likely downward pressure on {ticker} (lexicon score {total_sentiment:+.1f})"
+        else:
+            price_impact = f"No clear directional impact on {ticker} (lexicon score {total_sentiment:+.1f})"
+
+        return {
+            "summary": " ".join(s['sentence'] for s in summary_sentences),
+            "positive_factors": positive_factors,
+            "negative_factors": negative_factors,
+            "sentiment": sentiment,
+            "price_impact": price_impact
+        }
+
+
+BACKENDS = {
+    'together': TogetherBackend,
+    'local': LocalExtractiveBackend
+}
+
+
+def get_backend(backend):
+    """Resolve a backend name or instance to a SummarizerBackend"""
+    if isinstance(backend, SummarizerBackend):
+        return backend
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown summarizer backend: {backend}. Expected one of {list(BACKENDS)}")
+    return BACKENDS[backend]()
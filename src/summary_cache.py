@@ -0,0 +1,119 @@
+import os
+import time
+import pickle
+import hashlib
+import threading
+from src.config import SUMMARY_CACHE_DIR, SUMMARY_CACHE_TTL, SUMMARY_CACHE_MAX_ENTRIES
+
+
+class SummaryCache:
+    """Persistent content-addressed cache of LLM results with TTL and LRU size bound
+
+    Each entry is a small pickle named by the SHA-256 of the model name and
+    the exact prompt, so identical inputs map to the same file no matter
+    which run or ticker produced them. Entries older than ttl seconds are
+    treated as misses; when more than max_entries exist, the least recently
+    used ones are deleted. Safe to use from the summarizer's worker threads.
+    Hits across runs depend on the batches coming out the same, which is why
+    NEWS_BATCH_PACKING defaults to content-defined packing.
+    """
+
+    def __init__(self, cache_dir=SUMMARY_CACHE_DIR, ttl=SUMMARY_CACHE_TTL, max_entries=SUMMARY_CACHE_MAX_ENTRIES):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._index = {}
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        # Rebuild the access index from file modification times
+        for filename in os.listdir(self.cache_dir):
+            if filename.endswith('.pkl'):
+                path = os.path.join(self.cache_dir, filename)
+                try:
+                    self._index[filename[:-4]] = os.path.getmtime(path)
+                except OSError:
+                    pass
+
+    @staticmethod
+    def make_key(model, prompt):
+        """Content hash of the model name and prompt text"""
+        return hashlib.sha256(f"{model}\0{prompt}".encode('utf-8')).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.pkl")
+
+    def get(self, key):
+        """Return the cached value for key, or None on a miss or expired entry"""
+        with self._lock:
+            if key not in self._index:
+                self.misses += 1
+                return None
+
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+        except Exception:
+            self._remove(key)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        now = time.time()
+        if self.ttl is not None and now - entry.get('created', 0) > self.ttl:
+            self._remove(key)
+            with self._lock:
+                self.misses += 1
+            return None
+
+        # Touch the file so LRU order survives restarts
+        try:
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+        with self._lock:
+            self._index[key] = now
+            self.hits += 1
+        return entry['value']
+
+    def put(self, key, value):
+        """Store value under key and evict least recently used entries beyond max_entries"""
+        path = self._path(key)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                pickle.dump({'created': time.time(), 'value': value}, f)
+            os.replace(temp_path, path)
+        except Exception as e:
+            print(f"Error writing summary cache entry: {e}")
+            return
+
+        with self._lock:
+            self._index[key] = time.time()
+            excess = len(self._index) - self.max_entries if self.max_entries else 0
+            evicted = sorted(self._index, key=self._index.get)[:excess] if excess > 0 else []
+            for old_key in evicted:
+                self._index.pop(old_key, None)
+        for old_key in evicted:
+            try:
+                os.remove(self._path(old_key))
+            except OSError:
+                pass
+
+    def _remove(self, key):
+        with self._lock:
+            self._index.pop(key, None)
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def clear(self):
+        """Delete every cached entry"""
+        with self._lock:
+            keys = list(self._index)
+        for key in keys:
+            self._remove(key)
@@ -0,0 +1,111 @@
+import os
+import json
+import pickle
+import sqlite3
+from contextlib import closing
+from src.config import NEWS_SUMMARY_DB, DATA_DIR
+
+
+class SummaryStore:
+    """SQLite store of news summaries keyed by (ticker, date)
+
+    Saving a summary is a single-row upsert and the latest summary for a
+    ticker is an index lookup on the (ticker, date) primary key, so neither
+    reads nor rewrites a ticker's whole history. Summaries are stored as JSON.
+    On first use, existing per-ticker pickles from legacy_dir are imported.
+    """
+
+    def __init__(self, path=NEWS_SUMMARY_DB, legacy_dir=os.path.join(DATA_DIR, 'news_summaries')):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        is_new = not os.path.exists(path)
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS summaries (
+                    ticker TEXT NOT NULL,
+                    date TEXT NOT NULL,
+                    last_updated TEXT,
+                    payload TEXT NOT NULL,
+                    PRIMARY KEY (ticker, date)
+                ) WITHOUT ROWID
+            """)
+        if is_new and legacy_dir and os.path.isdir(legacy_dir):
+            self.import_pickles(legacy_dir)
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def put(self, ticker, date, summary):
+        """Insert or replace the summary for one ticker and date"""
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO summaries (ticker, date, last_updated, payload) VALUES (?, ?, ?, ?)",
+                (ticker, date, summary.get('last_updated'), json.dumps(summary, default=str))
+            )
+
+    def put_many(self, rows):
+        """Insert or replace (ticker, date, summary) rows in one transaction"""
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO summaries (ticker, date, last_updated, payload) VALUES (?, ?, ?, ?)",
+                [(ticker, date, summary.get('last_updated'), json.dumps(summary, default=str))
+                 for ticker, date, summary in rows]
+            )
+
+    def get(self, ticker, date):
+        """Return the summary for a ticker on a date, or None"""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT payload FROM summaries WHERE ticker = ? AND date = ?", (ticker, date)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def latest(self, ticker):
+        """Return (date, summary) for the most recent summary of a ticker, or (None, None)"""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT date, payload FROM summaries WHERE ticker = ? ORDER BY date DESC LIMIT 1", (ticker,)
+            ).fetchone()
+        return (row[0], json.loads(row[1])) if row else (None, None)
+
+    def dates(self, ticker):
+        """Dates with a summary for a ticker, newest first"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT date FROM summaries WHERE ticker = ? ORDER BY date DESC", (ticker,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def history(self, ticker):
+        """All summaries for a ticker as {date: summary}"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT date, payload FROM summaries WHERE ticker = ? ORDER BY date", (ticker,)
+            ).fetchall()
+        return {date: json.loads(payload) for date, payload in rows}
+
+    def tickers(self):
+        """Tickers with at least one summary"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute("SELECT DISTINCT ticker FROM summaries ORDER BY ticker").fetchall()
+        return [row[0] for row in rows]
+
+    def import_pickles(self, summaries_dir):
+        """Import legacy {date: summary} pickles named {ticker}.pkl"""
+        rows = []
+        for filename in sorted(os.listdir(summaries_dir)):
+            if not filename.endswith('.pkl'):
+                continue
+            try:
+                with open(os.path.join(summaries_dir, filename), 'rb') as f:
+                    history = pickle.load(f)
+            except Exception as e:
+                print(f"Error reading legacy summary file {filename}: {e}")
+                continue
+            ticker = filename[:-4]
+            rows.extend((ticker, date, summary) for date, summary in history.items() if isinstance(summary, dict))
+        if rows:
+            self.put_many(rows)
+            print(f"Imported {len(rows)} news summaries from {summaries_dir} into {self.path}")
+        return len(rows)
@@ -0,0 +1,95 @@
+import pandas as pd
+
+# Pandas resample rules per timeframe; monthly falls back to 'M' on pandas < 2.2
+RESAMPLE_RULES = {
+    'weekly': ['W-FRI'],
+    'monthly': ['ME', 'M']
+}
+
+# Bars per year, used to annualize volatility on each timeframe
+PERIODS_PER_YEAR = {
+    'daily': 252,
+    'weekly': 52,
+    'monthly': 12
+}
+
+TIMEFRAMES = ['daily'] + list(RESAMPLE_RULES.keys())
+
+# How each OHLCV column is aggregated when resampling
+OHLCV_AGGREGATION = {
+    'Open': 'first',
+    'High': 'max',
+    'Low': 'min',
+    'Close': 'last',
+    'Volume': 'sum'
+}
+
+
+class TimeframeCache:
+    """Resample daily price history to weekly/monthly bars once per symbol and reuse it
+
+    Each cache entry remembers the length and first/last timestamps of the
+    daily history it was built from. An unchanged history is a cache hit;
+    when new daily bars are only appended, just the last (possibly partial)
+    period is resampled again; any other change rebuilds the entry.
+    """
+
+    def __init__(self):
+        self._cache = {}
+
+    def _resample(self, history, timeframe):
+        """Aggregate daily OHLCV bars into the requested timeframe"""
+        aggregation = {col: how for col, how in OHLCV_AGGREGATION.items() if col in history.columns}
+        last_error = None
+        for rule in RESAMPLE_RULES[timeframe]:
+            try:
+                frame = history[list(aggregation.keys())].resample(rule).agg(aggregation)
+                return frame.dropna(subset=['Close']) if 'Close' in frame.columns else frame
+            except ValueError as e:
+                last_error = e
+        raise last_error
+
+    def get(self, key, history, timeframe='daily'):
+        """Return history on the given timeframe for a symbol key, resampling only when needed"""
+        if timeframe == 'daily':
+            return history
+        if timeframe not in RESAMPLE_RULES:
+            raise ValueError(f"Unsupported timeframe: {timeframe}. Expected one of {TIMEFRAMES}")
+        if not isinstance(history, pd.DataFrame) or history.empty:
+            return history
+
+        entry = self._cache.get((key, timeframe))
+        length, first_index, last_index = len(history), history.index[0], history.index[-1]
+
+        if entry and (entry['length'], entry['first_index'], entry['last_index']) == (length, first_index, last_index):
+            return entry['frame']
+
+        cached = entry['frame'] if entry else None
+        appended_only = (
+            entry is not None
+            and len(cached) >= 2
+            and length > entry['length']
+            and first_index == entry['first_index']
+            and history.index[entry['length'] - 1] == entry['last_index']
+        )
+        if appended_only:
+            # Bars after the second-to-last period label belong to the last period onwards
+            tail = self._resample(history[history.index > cached.index[-2]], timeframe)
+            frame = pd.concat([cached.iloc[:-1], tail])
+        else:
+            frame = self._resample(history, timeframe)
+
+        self._cache[(key, timeframe)] = {
+            'frame': frame,
+            'length': length,
+            'first_index': first_index,
+            'last_index': last_index
+        }
+        return frame
+
+    def invalidate(self, key=None):
+        """Drop cached frames for one symbol key, or everything when key is None"""
+        if key is None:
+            self._cache = {}
+        else:
+            self._cache = {k: v for k, v in self._cache.items() if k[0] != key}
@@ -0,0 +1,124 @@
+import queue
+import threading
+from contextlib import contextmanager
+
+
+class WebDriverPool:
+    """Bounded pool of Selenium WebDrivers handed out through checkout/checkin
+
+    Drivers are created lazily by factory, up to size. checkout blocks until
+    a driver is free. Drivers are health-checked on checkout and checkin;
+    one whose browser or session has died is quit and replaced on the next
+    checkout, as is a driver that has served max_uses checkouts (long-lived
+    Chrome sessions grow in memory). close quits every driver, including
+    ones still checked out; the pool stays usable and starts new drivers on
+    the next checkout.
+    """
+
+    def __init__(self, factory, size=1, max_uses=None):
+        if size < 1:
+            raise ValueError(f"Pool size must be at least 1, got {size}")
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self._idle = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._drivers = {}  # id(driver) -> [driver, uses]
+        self._created = 0
+        self.recycled = 0
+
+    @staticmethod
+    def is_alive(driver):
+        """True if the browser still answers WebDriver commands"""
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, driver):
+        with self._lock:
+            if self._drivers.pop(id(driver), None) is not None:
+                self._created -= 1
+                # Wake a thread blocked in checkout so it can create the replacement
+                self._idle.put(None)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def checkout(self, timeout=None):
+        """Return a live driver, creating one if the pool has room"""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                with self._lock:
+                    can_create = self._created < self.size
+                    if can_create:
+                        self._created += 1
+                if can_create:
+                    try:
+                        driver = self.factory()
+                    except Exception:
+                        with self._lock:
+                            self._created -= 1
+                        raise
+                    with self._lock:
+                        self._drivers[id(driver)] = [driver, 0]
+                else:
+                    try:
+                        driver = self._idle.get(timeout=timeout)
+                    except queue.Empty:
+                        raise TimeoutError(f"No WebDriver available within {timeout}s")
+            if driver is None:
+                continue  # a slot was freed; loop round to create a driver
+
+            if not self.is_alive(driver):
+                print("Recycling a crashed WebDriver")
+                self.recycled += 1
+                self._discard(driver)
+                continue
+            with self._lock:
+                self._drivers[id(driver)][1] += 1
+            return driver
+
+    def checkin(self, driver, broken=False):
+        """Return a driver to the pool; broken, dead or worn-out drivers are replaced"""
+        with self._lock:
+            entry = self._drivers.get(id(driver))
+        if entry is None:
+            return  # already discarded (e.g. by close)
+        worn_out = self.max_uses is not None and entry[1] >= self.max_uses
+        if broken or worn_out or not self.is_alive(driver):
+            self.recycled += 1
+            self._discard(driver)
+            return
+        self._idle.put(driver)
+
+    @contextmanager
+    def driver(self, timeout=None):
+        """Check out a driver for the duration of a with block"""
+        driver = self.checkout(timeout)
+        broken = False
+        try:
+            yield driver
+        except Exception:
+            broken = not self.is_alive(driver)
+            raise
+        finally:
+            self.checkin(driver, broken=broken)
+
+    def close(self):
+        """Quit every driver created by the pool"""
+        with self._lock:
+            drivers = [entry[0] for entry in self._drivers.values()]
+            self._drivers.clear()
+            self._created = 0
+            while not self._idle.empty():
+                self._idle.get_nowait()
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
@@ -0,0 +1,179 @@
+import requests
+import lxml.html
+from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from src.config import MAX_ARTICLES_PER_COMPANY, NEWS_HTTP_TIMEOUT, NEWS_HTTP_WORKERS
+from src.crawl_frontier import PRIORITY_LISTING, PRIORITY_ARTICLE
+
+YAHOO_BASE_URL = "https://finance.yahoo.com"
+
+HTTP_HEADERS = {
+    "User-Agent": ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                   "(KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+
+def _has_class(name):
+    """XPath predicate matching elements whose class list contains name"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+def _text(element):
+    return " ".join(element.text_content().split()) if element is not None else ""
+
+
+class YahooPageError(Exception):
+    """The HTTP response is not a usable Yahoo page (consent wall, block or empty listing)"""
+
+
+def parse_news_listing(html, max_articles=MAX_ARTICLES_PER_COMPANY, base_url=YAHOO_BASE_URL):
+    """Extract articles from a Yahoo Finance quote news page
+
+    Mirrors the Selenium scraper: one article per li.story-item, headline
+    from its h3, link from its first anchor and summary from its first
+    paragraph. Source and relative date come from the publishing line
+    ("Reuters • 2 hours ago") when present.
+    """
+    doc = lxml.html.fromstring(html)
+    articles = []
+    for item in doc.xpath(f"//li[{_has_class('story-item')}]")[:max_articles]:
+        headline = _text(next(iter(item.xpath(".//h3")), None))
+        links = item.xpath(".//a[@href]/@href")
+        if not headline or not links:
+            continue
+        paragraphs = item.xpath(".//p")
+        article = {
+            "headline": headline,
+            "summary": _text(paragraphs[0]) if paragraphs else "No summary available",
+            "link": urljoin(base_url, links[0])
+        }
+        publishing = item.xpath(f".//div[{_has_class('publishing')}]")
+        if publishing:
+            parts = [part.strip() for part in _text(publishing[0]).split("•")]
+            if parts[0]:
+                article["source"] = parts[0]
+            if len(parts) > 1 and parts[1]:
+                article["date"] = parts[1]
+        articles.append(article)
+    return articles
+
+
+def parse_article_content(html):
+    """Extract the body paragraphs of a Yahoo Finance article page"""
+    doc = lxml.html.fromstring(html)
+    paragraphs = doc.xpath(f"//div[{_has_class('atoms-wrapper')}]//p")
+    if not paragraphs:
+        paragraphs = doc.xpath("//article//p")
+    return "\n\n".join(text for text in (_text(p) for p in paragraphs) if text)
+
+
+def take_until(articles, stop_at):
+    """Articles before the first one whose link is stop_at (all of them if it is absent)"""
+    for i, article in enumerate(articles):
+        if stop_at is not None and article["link"] == stop_at:
+            return articles[:i]
+    return articles
+
+
+class YahooNewsClient:
+    """Browserless Yahoo Finance news scraper over a pooled HTTP session
+
+    The listing page is fetched once, then every article page is fetched
+    concurrently over the same keep-alive connection pool. Transient HTTP
+    errors are retried by the session adapter. Consent walls and pages
+    without story items raise YahooPageError so callers can fall back to the
+    Selenium scraper. With a url_index (SeenURLIndex), articles whose link
+    was scraped before get their stored full_content and only new links are
+    fetched. With a frontier (CrawlFrontier), every request waits for Yahoo's
+    politeness budget and article pages are queued on the frontier.
+    """
+
+    def __init__(self, session=None, timeout=NEWS_HTTP_TIMEOUT, max_workers=NEWS_HTTP_WORKERS, url_index=None,
+                 frontier=None):
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.url_index = url_index
+        self.frontier = frontier
+        self.session = session or self._make_session(max_workers)
+
+    @staticmethod
+    def _make_session(pool_size):
+        session = requests.Session()
+        session.headers.update(HTTP_HEADERS)
+        retry = Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods=["GET"])
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=retry)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _get(self, url):
+        response = self.session.get(url, timeout=self.timeout)
+        response.raise_for_status()
+        if "consent." in response.url:
+            raise YahooPageError(f"Redirected to consent page: {response.url}")
+        return response.text
+
+    def fetch(self, url, priority=PRIORITY_ARTICLE):
+        if self.frontier is None:
+            return self._get(url)
+        with self.frontier.slot(url, priority):
+            return self._get(url)
+
+    def _set_content(self, article, html=None, error=None):
+        """Fill in full_content from an article page; failures leave a placeholder"""
+        try:
+            if error is not None:
+                raise error
+            content = parse_article_content(html)
+            article["full_content"] = content or "No content available"
+        except Exception as e:
+            print(f"Error fetching article {article['link']}: {e}")
+            article["full_content"] = "No content available"
+        return article
+
+    def fetch_article(self, article):
+        """Fill in full_content for one article; failures leave a placeholder"""
+        try:
+            html = self.fetch(article["link"])
+        except Exception as e:
+            return self._set_content(article, error=e)
+        return self._set_content(article, html)
+
+    def get_news(self, company, max_articles=MAX_ARTICLES_PER_COMPANY, stop_at=None):
+        """Return articles with full content for a ticker
+
+        The listing is newest first; with stop_at (the link of the newest
+        article already ingested) only the articles above it are returned.
+        """
+        html = self.fetch(f"{YAHOO_BASE_URL}/quote/{company}/news", PRIORITY_LISTING)
+        articles = parse_news_listing(html, max_articles)
+        if not articles:
+            raise YahooPageError(f"No story items found on the Yahoo news page for {company}")
+        articles = take_until(articles, stop_at)
+        new_articles = self.url_index.fill_known(articles) if self.url_index is not None else articles
+        if new_articles and self.frontier is not None:
+            futures = [self.frontier.submit(article["link"], self._get) for article in new_articles]
+            for article, future in zip(new_articles, futures):
+                try:
+                    html = future.result()
+                except Exception as e:
+                    self._set_content(article, error=e)
+                else:
+                    self._set_content(article, html)
+        elif new_articles:
+            with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(new_articles)))) as executor:
+                list(executor.map(self.fetch_article, new_articles))
+        if self.url_index is not None and articles:
+            print(f"{len(articles) - len(new_articles)} of {len(articles)} articles already known, "
+                  f"fetched {len(new_articles)}")
+            self.url_index.put_many((article["link"], article["full_content"]) for article in new_articles
+                                    if article["full_content"] != "No content available")
+        return articles
+
+    def close(self):
+        self.session.close()
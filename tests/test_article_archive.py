@@ -0,0 +1,77 @@
+import pickle
+import sqlite3
+from contextlib import closing
+
+from src.article_archive import ArticleArchive
+
+BODY = "Apple reported record services revenue. " * 20
+
+
+def news(ticker, *bodies):
+    return {ticker: [{'headline': f'{ticker} {i}', 'link': f'https://example.com/{ticker}/{i}',
+                      'full_content': body} for i, body in enumerate(bodies)]}
+
+
+def archive(tmp_path):
+    return ArticleArchive(str(tmp_path / 'archive.db'), legacy_path=None)
+
+
+def count(path, table):
+    with closing(sqlite3.connect(path)) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def test_round_trip_and_body_deduplication(tmp_path):
+    store = archive(tmp_path)
+    assert store.put_snapshot('2026-10-18', {**news('AAPL', BODY, "Other body"), **news('MSFT', BODY)}) == 2
+    # The same bodies on a later date are not stored again
+    assert store.put_snapshot('2026-10-19', news('AAPL', BODY)) == 0
+    assert count(store.path, 'bodies') == 2
+
+    snapshot = store.snapshot('2026-10-18')
+    assert [a['full_content'] for a in snapshot['AAPL']] == [BODY, "Other body"]
+    assert snapshot['MSFT'][0]['headline'] == 'MSFT 0'
+    assert store.snapshot('2026-10-18', 'MSFT') == {'MSFT': snapshot['MSFT']}
+    assert store.dates() == ['2026-10-19', '2026-10-18']
+    assert store.latest() == news('AAPL', BODY)
+
+
+def test_replacing_a_date(tmp_path):
+    store = archive(tmp_path)
+    store.put_snapshot('2026-10-19', news('AAPL', BODY, "Second"))
+    store.put_snapshot('2026-10-19', news('AAPL', "Replacement"))
+    assert store.snapshot('2026-10-19') == news('AAPL', "Replacement")
+
+
+def test_articles_without_body_and_missing_dates(tmp_path):
+    store = archive(tmp_path)
+    store.put_snapshot('2026-10-19', {'AAPL': [{'headline': 'No body', 'link': 'x'}]})
+    assert store.latest() == {'AAPL': [{'headline': 'No body', 'link': 'x'}]}
+    assert store.snapshot('2000-01-01') == {}
+    assert archive(tmp_path / 'empty').latest() == {}
+
+
+def test_latest_by_ticker(tmp_path):
+    store = archive(tmp_path)
+    store.put_snapshots({
+        '2026-10-17': {**news('AAPL', "Old apple"), **news('MSFT', "Old msft")},
+        '2026-10-19': news('AAPL', "New apple"),
+    })
+    latest = store.latest_by_ticker()
+    assert latest['AAPL'][0]['full_content'] == "New apple"
+    assert latest['MSFT'][0]['full_content'] == "Old msft"
+
+
+def test_imports_legacy_pickle_once(tmp_path):
+    history = {'2026-10-18': news('AAPL', BODY), '2026-10-19': news('AAPL', BODY, "New")}
+    legacy = tmp_path / 'news_data.pkl'
+    with open(legacy, 'wb') as f:
+        pickle.dump(history, f)
+    store = ArticleArchive(str(tmp_path / 'archive.db'), legacy_path=str(legacy))
+    assert store.history() == history
+    assert count(store.path, 'bodies') == 2
+
+    # An existing archive does not import again
+    store.put_snapshot('2026-10-19', news('AAPL', "Edited"))
+    reopened = ArticleArchive(str(tmp_path / 'archive.db'), legacy_path=str(legacy))
+    assert reopened.latest() == news('AAPL', "Edited")
@@ -0,0 +1,46 @@
+from src.article_clusters import TopicClusterer
+
+
+def article(headline, summary, body, source='', date=''):
+    return {'headline': headline, 'summary': summary, 'full_content': body, 'source': source, 'date': date}
+
+
+EARNINGS = [
+    article("Apple revenue rises 6% as iPhone sales in China recover",
+            "Apple quarterly revenue rose 6% to $94.9 billion on iPhone demand in China.",
+            "Apple reported quarterly revenue of $94.9 billion, up 6%, as iPhone sales in China recovered "
+            "and services revenue hit a record.", 'Reuters', '2024-02-01'),
+    article("Apple beats revenue estimates on China iPhone rebound",
+            "iPhone sales in China lifted Apple quarterly revenue 6% to $94.9 billion.",
+            "Quarterly revenue at Apple climbed 6% to $94.9 billion after iPhone sales in China rebounded, "
+            "with services revenue also at a record.", 'Yahoo Finance', '2024-02-02'),
+]
+LAWSUIT = article("Regulators sue Apple over App Store antitrust violations",
+                  "The Justice Department filed an antitrust lawsuit over App Store payment rules.",
+                  "The Justice Department sued Apple alleging antitrust violations in App Store payment rules "
+                  "and developer fees, seeking penalties.", 'CNBC', '2024-02-03')
+LAUNCH = article("Apple unveils Vision headset for enterprise customers",
+                 "A headset launch aimed at enterprise customers and developers.",
+                 "Apple unveiled a Vision headset for enterprise customers, with developer tools and "
+                 "a subscription plan for corporate fleets.", 'Barron\'s', '2024-02-04')
+
+
+def test_same_event_merges_and_distinct_stories_stay_apart():
+    articles = [EARNINGS[0], LAWSUIT, EARNINGS[1], LAUNCH]
+    assert TopicClusterer().cluster(articles) == [[0, 2], [1], [3]]
+
+
+def test_digest_keeps_one_article_per_topic():
+    digests, report = TopicClusterer().digests([EARNINGS[0], LAWSUIT, EARNINGS[1]])
+    assert report == {'articles': 3, 'topics': 2, 'largest_topic': 2}
+    earnings, lawsuit = digests
+    assert earnings['topic_size'] == 2
+    assert earnings['source'] == "Reuters, Yahoo Finance"
+    assert earnings['date'] == "2024-02-01 to 2024-02-02"
+    assert "Also reported:" in earnings['summary']
+    assert lawsuit is LAWSUIT
+
+
+def test_empty_input():
+    assert TopicClusterer().cluster([]) == []
+    assert TopicClusterer().digests([]) == ([], {'articles': 0, 'topics': 0, 'largest_topic': 0})
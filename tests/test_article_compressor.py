@@ -0,0 +1,72 @@
+import pytest
+
+from src.article_compressor import ArticleCompressor
+from src.article_packer import estimate_tokens
+
+LEXICON = {'surge': 1.0, 'beat': 0.8, 'miss': -0.8, 'lawsuit': -1.0}
+NAMES = {'ACME': ['Acme Corp']}
+
+
+def compressor(**kwargs):
+    kwargs.setdefault('aggressiveness', 0.5)
+    kwargs.setdefault('max_tokens', 600)
+    return ArticleCompressor(company_names=NAMES, lexicon=LEXICON, chars_per_token=4, **kwargs)
+
+
+def test_keeps_lede_and_key_sentences_in_order():
+    text = ("Markets opened quietly on Tuesday morning. "
+            "Acme Corp said revenue rose 12% to $4.2 billion. "
+            "The weather in the city was mild and pleasant for the season. "
+            "Analysts said the results beat expectations. "
+            "A spokesperson declined to comment further on the matter today.")
+    result = compressor(aggressiveness=0.3).compress_text(text, 'ACME')
+    assert result.startswith("Markets opened quietly on Tuesday morning.")
+    assert "revenue rose 12%" in result
+    assert "weather" not in result
+    assert result.index("revenue") < result.index("beat expectations")
+
+
+def test_lede_without_signals_is_kept():
+    text = "Nothing to see here today. " * 40
+    result = compressor().compress_text(text, 'ACME')
+    assert result == "Nothing to see here today."
+
+
+def test_single_oversized_sentence_is_truncated():
+    text = "word " * 2000
+    comp = compressor(max_tokens=50)
+    result = comp.compress_text(text, 'ACME')
+    assert result
+    assert result.endswith(" [...]")
+    assert estimate_tokens(result, 4) <= 50
+
+
+def test_oversized_lede_is_truncated_not_dropped():
+    lede = "Acme Corp reported " + "strong results " * 200 + "for the quarter."
+    text = lede + " Revenue rose 5%."
+    result = compressor(max_tokens=40).compress_text(text, 'ACME')
+    assert result.startswith("Acme Corp reported strong results")
+    assert estimate_tokens(result, 4) <= 40
+
+
+def test_whitespace_only_content():
+    assert compressor().compress_text(" " * 400, 'ACME') == ''
+
+
+def test_aggressiveness_zero_is_identity():
+    text = "Acme Corp sales surge 40%. " * 50
+    assert compressor(aggressiveness=0).compress_text(text, 'ACME') == text
+
+
+def test_compress_report_and_untouched_fields():
+    articles = [{'headline': 'Acme beats', 'summary': 'Short', 'full_content': "Filler sentence here. " * 100}]
+    compressed, report = compressor().compress(articles, 'ACME')
+    assert compressed[0]['headline'] == 'Acme beats'
+    assert compressed[0]['full_content']
+    assert report['content_tokens_after'] < report['content_tokens_before']
+    assert 0 < report['compression_ratio'] < 1
+
+
+def test_rejects_invalid_aggressiveness():
+    with pytest.raises(ValueError):
+        compressor(aggressiveness=1)
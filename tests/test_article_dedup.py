@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from src.article_dedup import ArticleDeduplicator, shingles
+
+BODY = ("Apple reported quarterly revenue of $94.9 billion on Thursday, up 6% from a year earlier, "
+        "as iPhone sales in China recovered and services revenue reached a record $24.2 billion. "
+        "Chief executive Tim Cook said demand for the new models was strong heading into the holidays, "
+        "and the company guided for revenue growth in the low to mid single digits next quarter.")
+
+
+def article(headline, body, source='', summary=''):
+    return {'headline': headline, 'summary': summary, 'full_content': body, 'source': source}
+
+
+def test_syndicated_copies_collapse_to_the_longest():
+    articles = [
+        article("Apple revenue rises 6% on China iPhone recovery", BODY, 'Reuters'),
+        article("Tesla deliveries fall short of forecasts",
+                "Tesla delivered fewer vehicles than analysts expected in the third quarter, "
+                "citing factory upgrades and weaker demand in Europe.", 'Bloomberg'),
+        article("Apple revenue rises 6% on China iPhone recovery", BODY + " Shares rose 2% after hours.",
+                'Yahoo Finance'),
+    ]
+    kept, report = ArticleDeduplicator().deduplicate(articles)
+    assert [a['headline'] for a in kept] == [articles[0]['headline'], articles[1]['headline']]
+    apple = kept[0]
+    assert apple['full_content'].endswith("Shares rose 2% after hours.")
+    assert apple['duplicates'] == 1
+    assert apple['duplicate_sources'] == ['Reuters', 'Yahoo Finance']
+    assert 'duplicates' not in kept[1]
+    assert report['articles_before'] == 3
+    assert report['duplicates_removed'] == 1
+    assert report['tokens_saved'] > 0
+
+
+def test_distinct_articles_are_kept():
+    articles = [article(f"Story {i}", f"Completely different text number {i} about topic {i * 7} and more {i}")
+                for i in range(5)]
+    kept, report = ArticleDeduplicator().deduplicate(articles)
+    assert kept == articles
+    assert report['duplicates_removed'] == 0
+
+
+def test_empty_articles_are_never_merged():
+    articles = [article('', ''), article('', '')]
+    kept, _ = ArticleDeduplicator().deduplicate(articles)
+    assert len(kept) == 2
+
+
+def test_similarity_estimates_jaccard():
+    dedup = ArticleDeduplicator(num_perm=256, bands=32)
+    a = dedup.signature(BODY)
+    assert dedup.similarity(a, dedup.signature(BODY)) == 1.0
+    half = " ".join(BODY.split()[:30])
+    exact = len(np.intersect1d(shingles(BODY), shingles(half))) / len(np.union1d(shingles(BODY), shingles(half)))
+    assert abs(dedup.similarity(a, dedup.signature(half)) - exact) < 0.15
+
+
+def test_rejects_uneven_bands():
+    with pytest.raises(ValueError):
+        ArticleDeduplicator(num_perm=100, bands=16)
@@ -0,0 +1,89 @@
+import pytest
+
+from src.article_packer import ArticlePacker, article_digest, estimate_tokens
+
+
+def article(i, body_chars):
+    return {'headline': f'Headline {i}', 'date': '2026-10-19', 'source': 'Reuters',
+            'summary': f'Summary {i}', 'full_content': ("Revenue rose 5%. " * body_chars)[:body_chars]}
+
+
+def flatten(batches):
+    return [a['headline'] for batch in batches for a in batch]
+
+
+@pytest.mark.parametrize("strategy", ['ffd', 'content'])
+def test_batches_respect_budget_and_cap(strategy):
+    articles = [article(i, size) for i, size in enumerate([800, 200, 1500, 60, 900, 300, 1200, 40, 700])]
+    packer = ArticlePacker(token_budget=600, max_articles=3, strategy=strategy, chars_per_token=4)
+    batches = packer.pack(articles)
+    assert sorted(flatten(batches)) == sorted(a['headline'] for a in articles)
+    for batch in batches:
+        assert len(batch) <= 3
+        assert sum(packer.article_tokens(a) for a in batch) <= 600
+
+
+def test_ffd_uses_fewer_requests_than_fixed_batches():
+    articles = [article(i, size) for i, size in enumerate([1600, 100, 1600, 100, 1600, 100, 1600, 100])]
+    packer = ArticlePacker(token_budget=500, max_articles=8, strategy='ffd', chars_per_token=4)
+    batches = packer.pack(articles)
+    assert len(batches) == 4
+    # Original order is kept within each request
+    for batch in batches:
+        positions = [int(a['headline'].split()[-1]) for a in batch]
+        assert positions == sorted(positions)
+
+
+def test_ffd_is_deterministic():
+    articles = [article(i, 400) for i in range(6)]
+    packer = ArticlePacker(token_budget=300, max_articles=4, strategy='ffd', chars_per_token=4)
+    # Equal-sized articles are placed by content hash, so input order does not change the grouping
+    groups = {frozenset(a['headline'] for a in batch) for batch in packer.pack(articles)}
+    shuffled = {frozenset(a['headline'] for a in batch) for batch in packer.pack(articles[::-1])}
+    assert groups == shuffled
+
+
+def test_content_defined_boundaries_are_stable():
+    articles = [article(i, 100) for i in range(20)]
+    packer = ArticlePacker(token_budget=10000, max_articles=20, strategy='content', chars_per_token=4)
+    before = packer.pack(articles)
+    # Adding an article at the end leaves the earlier requests unchanged
+    after = packer.pack(articles + [article(20, 100)])
+    assert after[:len(before) - 1] == before[:-1]
+
+
+def test_oversized_article_is_truncated_keeping_lede_and_figures():
+    # The lede runs until a sentence no longer fits; later sentences with figures fill the rest
+    body = ("The company held its annual meeting. " + "The chair spoke at length" + " and at length" * 80 + ". " +
+            "Revenue rose 12% to $4 billion. " + "More filler text follows here. " * 40)
+    big = {'headline': 'Big', 'summary': 'S', 'full_content': body}
+    packer = ArticlePacker(token_budget=120, max_articles=4, chars_per_token=4)
+    truncated = packer.truncate_article(big, 120)
+    assert packer.article_tokens(truncated) <= 120
+    assert truncated['full_content'].startswith("The company held its annual meeting.")
+    assert "Revenue rose 12%" in truncated['full_content']
+    assert "The chair spoke" not in truncated['full_content']
+    assert "More filler" not in truncated['full_content']
+    assert truncated['full_content'].endswith(" [...]")
+    assert truncated['headline'] == 'Big'
+
+
+def test_article_without_sentence_breaks_is_cut_to_a_prefix():
+    big = {'headline': 'Big', 'summary': 'S', 'full_content': "x" * 5000}
+    packer = ArticlePacker(token_budget=100, chars_per_token=4)
+    truncated = packer.truncate_article(big, 100)
+    assert truncated['full_content'].startswith("xxx")
+    assert packer.article_tokens(truncated) <= 100
+
+
+def test_digest_and_estimate():
+    a = article(1, 100)
+    assert article_digest(a) == article_digest(dict(a))
+    assert article_digest(a) != article_digest(dict(a, summary='changed'))
+    assert estimate_tokens("abcdefgh", 4) == 2
+    assert estimate_tokens(None) == 0
+
+
+def test_rejects_unknown_strategy():
+    with pytest.raises(ValueError):
+        ArticlePacker(strategy='greedy')
@@ -0,0 +1,121 @@
+import threading
+import time
+
+from src.crawl_frontier import CrawlFrontier, PRIORITY_LISTING, PRIORITY_FOLLOWUP
+
+BUDGETS = {
+    'default': {'concurrency': 4, 'delay': 0},
+    'slow.example': {'concurrency': 1, 'delay': 0.05},
+}
+
+
+def test_domain_matching():
+    frontier = CrawlFrontier(budgets={**BUDGETS, 'example.com': {'concurrency': 1, 'delay': 0}})
+    assert frontier.domain('https://www.slow.example/a') == 'slow.example'
+    assert frontier.domain('https://news.example.com/b') == 'example.com'
+    assert frontier.domain('https://notexample.com/c') == 'notexample.com'
+    assert frontier.budget('slow.example') == {'concurrency': 1, 'delay': 0.05}
+    assert frontier.budget('other.org') == {'concurrency': 4, 'delay': 0}
+
+
+def test_submit_runs_fetches_and_propagates_errors():
+    frontier = CrawlFrontier(budgets=BUDGETS, max_workers=2)
+
+    def fetch(url):
+        if url.endswith('bad'):
+            raise ValueError(url)
+        return url.upper()
+
+    try:
+        ok = frontier.submit('https://a.example/ok', fetch)
+        bad = frontier.submit('https://a.example/bad', fetch)
+        assert ok.result(timeout=5) == 'HTTPS://A.EXAMPLE/OK'
+        assert isinstance(bad.exception(timeout=5), ValueError)
+    finally:
+        frontier.close()
+    assert frontier.stats['a.example']['requests'] == 2
+
+
+def test_domain_budget_limits_rate_and_concurrency():
+    frontier = CrawlFrontier(budgets=BUDGETS, max_workers=4)
+    lock = threading.Lock()
+    active = {'now': 0, 'max': 0}
+    starts = []
+
+    def fetch(url):
+        with lock:
+            starts.append(time.monotonic())
+            active['now'] += 1
+            active['max'] = max(active['max'], active['now'])
+        time.sleep(0.01)
+        with lock:
+            active['now'] -= 1
+        return url
+
+    try:
+        futures = [frontier.submit(f'https://slow.example/{i}', fetch) for i in range(4)]
+        for future in futures:
+            future.result(timeout=5)
+    finally:
+        frontier.close()
+    assert active['max'] == 1
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert min(gaps) >= 0.045
+
+
+def test_priority_order_within_a_domain():
+    frontier = CrawlFrontier(budgets=BUDGETS, max_workers=1)
+    order = []
+    gate = threading.Event()
+    try:
+        # Hold the only slot so the rest queue up, then release it
+        first = frontier.submit('https://slow.example/first', lambda url: gate.wait(5))
+        followup = frontier.submit('https://slow.example/followup', order.append, PRIORITY_FOLLOWUP)
+        listing = frontier.submit('https://slow.example/listing', order.append, PRIORITY_LISTING)
+        article = frontier.submit('https://slow.example/article', order.append)
+        gate.set()
+        for future in (first, followup, listing, article):
+            future.result(timeout=5)
+    finally:
+        frontier.close()
+    assert [url.rsplit('/', 1)[1] for url in order] == ['listing', 'article', 'followup']
+
+
+def test_slot_blocks_until_the_domain_has_room():
+    frontier = CrawlFrontier(budgets={'default': {'concurrency': 1, 'delay': 0}})
+    entered = threading.Event()
+
+    def enter_second():
+        with frontier.slot('https://a.example/2'):
+            entered.set()
+
+    try:
+        with frontier.slot('https://a.example/1') as domain:
+            assert domain == 'a.example'
+            second = threading.Thread(target=enter_second)
+            second.start()
+            time.sleep(0.05)
+            assert not entered.is_set()
+        second.join(timeout=5)
+        assert entered.is_set()
+    finally:
+        frontier.close()
+
+
+def test_close_lets_blocked_slot_waiters_through():
+    frontier = CrawlFrontier(budgets={'default': {'concurrency': 1, 'delay': 0}})
+    released = threading.Event()
+
+    def wait_for_slot():
+        frontier.acquire('https://a.example/2')
+        released.set()
+
+    domain = frontier.acquire('https://a.example/1')
+    waiter = threading.Thread(target=wait_for_slot)
+    waiter.start()
+    time.sleep(0.05)
+    assert not released.is_set()
+    frontier.close()
+    waiter.join(timeout=5)
+    assert released.is_set()
+    frontier.release(domain)
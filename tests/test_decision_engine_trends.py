@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("scipy")
+
+from src.decision_engine import DecisionEngine
+
+
+def history(bars, seed=0):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.cumprod(1 + rng.normal(0.001, 0.02, bars))
+    index = pd.bdate_range('2025-10-01', periods=bars)
+    return pd.DataFrame({'Open': close, 'High': close * 1.01, 'Low': close * 0.99, 'Close': close,
+                         'Volume': rng.integers(1_000_000, 2_000_000, bars)}, index=index)
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("TOGETHER_API_KEY", "test")
+    stock_data = {'stocks': {'SHORT': {'history': history(15)}, 'SIXTY': {'history': history(60, 1)},
+                             'FULL': {'history': history(252, 2)}}}
+    return DecisionEngine(stock_data=stock_data)
+
+
+def test_daily_short_history_keeps_full_entry(engine):
+    trends = engine.analyze_price_trends()
+    short = trends['SHORT']
+    assert short['trend'] is None
+    assert short['latest_close'] == pytest.approx(engine.stock_data['stocks']['SHORT']['history']['Close'].iloc[-1])
+    assert short['recommendation'] in ('BUY', 'SELL', 'HOLD')
+    # The double bottom check needs more than 60 daily bars
+    assert trends['SIXTY']['pattern_double_bottom'] is None
+    assert trends['FULL']['trend'] in ('UPTREND', 'DOWNTREND', 'SIDEWAYS')
+
+
+def test_longer_timeframes_report_insufficient_data(engine):
+    weekly = engine.analyze_price_trends('weekly')
+    assert weekly['SHORT']['trend'] == 'INSUFFICIENT DATA'
+    assert weekly['SHORT']['recommendation'] == 'INSUFFICIENT DATA'
+    assert 'latest_close' not in weekly['SHORT']
+    assert weekly['FULL']['trend'] in ('UPTREND', 'DOWNTREND', 'SIDEWAYS')
+    monthly = engine.analyze_price_trends('monthly')
+    assert monthly['FULL']['ma200'] is not None
@@ -0,0 +1,28 @@
+from src.keyword_sentiment import KeywordAutomaton, KeywordSentimentScorer
+
+LEXICON = {"beat": 1.0, "beat expectations": 1.5, "expectations": 0.2, "gain": 1.0, "miss": -1.0,
+           "record high": 1.5, "high": 0.3}
+
+
+def test_phrase_replaces_its_sub_words():
+    automaton = KeywordAutomaton(LEXICON)
+    assert list(automaton.matches("shares beat expectations".split())) == [("beat expectations", 1.5)]
+    assert automaton.score("Shares beat expectations") == (1.5, 1, 0)
+
+
+def test_leftmost_match_wins_and_later_words_still_count():
+    automaton = KeywordAutomaton(LEXICON)
+    tokens = "beat beat expectations at a record high high".split()
+    assert [phrase for phrase, _ in automaton.matches(tokens)] == ["beat", "beat expectations", "record high", "high"]
+
+
+def test_matches_respect_word_boundaries():
+    automaton = KeywordAutomaton(LEXICON)
+    assert list(automaton.matches("against the odds".split())) == []
+    assert automaton.score("Analysts expect a miss") == (-1.0, 0, 1)
+
+
+def test_scorer_labels_articles():
+    scorer = KeywordSentimentScorer(LEXICON, threshold=0.2)
+    result = scorer.score_article({'headline': "Apple beat expectations", 'summary': None})
+    assert result == {'score': 1.5, 'positive_hits': 1, 'negative_hits': 0}
@@ -0,0 +1,104 @@
+import pytest
+
+from src.llm_stream import (ThinkFilter, IncrementalJSONParser, MalformedStreamError,
+                            MAX_PREAMBLE, parse_stream)
+
+ANSWER = '```json\n{"summary": "Revenue beat estimates", "sentiment": 0.6, "tags": ["earnings", "guidance"]}\n```'
+EXPECTED = {"summary": "Revenue beat estimates", "sentiment": 0.6, "tags": ["earnings", "guidance"]}
+
+
+def chunked(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 64])
+def test_think_tags_split_across_chunks(size):
+    text = "<think>The user wants {a summary}.</think>" + ANSWER
+    assert parse_stream(chunked(text, size)) == EXPECTED
+
+
+def test_think_filter_holds_back_partial_tag():
+    think = ThinkFilter()
+    assert think.feed("before <thi") == "before "
+    assert think.feed("nk>hidden</th") == ""
+    assert think.feed("ink>after") == "after"
+    assert think.seen_tag
+
+
+def test_missing_opening_tag_with_brace_in_reasoning():
+    reasoning = "Okay, the article says {the company} raised guidance. " * 5
+    text = reasoning + "</think>\n" + ANSWER
+    for size in (1, 16, len(text)):
+        assert parse_stream(chunked(text, size)) == EXPECTED
+
+
+def test_missing_opening_tag_with_long_reasoning():
+    reasoning = "Let me think about the numbers. " * (MAX_PREAMBLE // 10)
+    assert len(reasoning) > MAX_PREAMBLE
+    text = reasoning + "</think>" + ANSWER
+    assert parse_stream(chunked(text, 50)) == EXPECTED
+
+
+def test_object_in_reasoning_without_opening_tag_is_replaced():
+    fields = []
+    text = 'Draft: {"summary": "draft"} looks wrong.</think>' + ANSWER
+    result = parse_stream(chunked(text, 5), on_field=lambda key, value: fields.append(key))
+    assert result == EXPECTED
+    assert fields[-3:] == ["summary", "sentiment", "tags"]
+
+
+def test_preamble_limit_applies_once_think_state_is_known():
+    text = "<think>short</think>" + "x" * (MAX_PREAMBLE + 1) + ANSWER
+    with pytest.raises(MalformedStreamError, match="No JSON object"):
+        parse_stream(chunked(text, 100))
+
+
+def test_parser_resyncs_at_next_brace():
+    parser = IncrementalJSONParser()
+    parser.feed('Here is {the answer}: {"summary": "ok", "sentiment": -1}')
+    assert parser.result() == {"summary": "ok", "sentiment": -1}
+
+
+def test_parser_without_resync_raises():
+    parser = IncrementalJSONParser(resync=False)
+    with pytest.raises(MalformedStreamError, match="Expected a key"):
+        parser.feed('Here is {the answer}')
+
+
+def test_parser_publishes_fields_as_they_complete():
+    fields = []
+    parser = IncrementalJSONParser(on_field=lambda key, value: fields.append((key, value)))
+    parser.feed('{"summary": "ok", "sent')
+    assert fields == [("summary", "ok")]
+    parser.feed('iment": 0.5}')
+    assert fields == [("summary", "ok"), ("sentiment", 0.5)]
+    assert parser.done
+
+
+def test_truncated_stream_raises():
+    with pytest.raises(MalformedStreamError, match="ended before"):
+        parse_stream(chunked(ANSWER[:40], 8))
+
+
+def test_reasoning_budget():
+    text = "<think>" + "a" * 500 + "</think>" + ANSWER
+    with pytest.raises(MalformedStreamError, match="Reasoning exceeded"):
+        parse_stream(chunked(text, 20), max_think_chars=100)
+
+
+def test_malformed_answer_after_reasoning_aborts_at_once():
+    consumed = []
+
+    def chunks():
+        for chunk in ["<think>Plan the answer.</think>", '{"summary": "ok", ', 'oops', ' more text'] + ["x" * 50] * 60:
+            consumed.append(chunk)
+            yield chunk
+
+    with pytest.raises(MalformedStreamError, match="Expected a key"):
+        parse_stream(chunks())
+    assert len(consumed) == 3
+
+
+def test_text_before_opening_tag_is_not_the_answer():
+    text = 'Sure {draft} <think>reasoning</think>' + ANSWER
+    assert parse_stream(chunked(text, 4)) == EXPECTED
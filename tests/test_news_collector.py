@@ -0,0 +1,71 @@
+import threading
+import time
+
+from src.news_collector import NewsCollector, link_key, merge_articles
+
+
+def test_collects_ok_error_and_timeout():
+    late_finished = threading.Event()
+    late_saw_cancel = threading.Event()
+
+    def ok(company, deadline):
+        return [{'link': f'https://example.com/{company}/1', 'headline': 'one'}]
+
+    def broken(company, deadline):
+        raise RuntimeError("listing changed")
+
+    def slow(company, deadline):
+        # Checks its deadline between "article visits", like the scrapers do
+        for _ in range(200):
+            if deadline.expired():
+                late_saw_cancel.set()
+                break
+            time.sleep(0.01)
+        late_finished.set()
+        return [{'link': 'https://example.com/late', 'headline': 'late'}]
+
+    collector = NewsCollector({'ok': ok, 'broken': broken, 'slow': slow}, {'slow': 0.1}, default_deadline=5)
+    try:
+        start = time.monotonic()
+        results, report = collector.collect('AAPL')
+        elapsed = time.monotonic() - start
+    finally:
+        collector.close()
+
+    assert elapsed < 1
+    assert set(results) == {'ok'}
+    assert report['ok']['status'] == 'ok' and report['ok']['articles'] == 1
+    assert report['broken']['status'] == 'error' and 'listing changed' in report['broken']['error']
+    assert report['slow']['status'] == 'timeout'
+    # The late source is told to stop and its result never reaches the caller
+    assert late_saw_cancel.wait(1)
+    assert late_finished.wait(1)
+    assert 'slow' not in results
+
+
+def test_deadline_remaining():
+    seen = {}
+
+    def source(company, deadline):
+        seen['remaining'] = deadline.remaining()
+        seen['expired'] = deadline.expired()
+        return []
+
+    collector = NewsCollector({'a': source}, {'a': 30})
+    try:
+        collector.collect('AAPL')
+    finally:
+        collector.close()
+    assert 29 < seen['remaining'] <= 30
+    assert seen['expired'] is False
+
+
+def test_merge_articles_dedups_by_normalized_link():
+    results = {
+        'Yahoo Finance': [{'link': 'https://www.example.com/a/?utm=1', 'headline': 'A'}],
+        'Reuters': [{'link': 'https://example.com/a', 'headline': 'A copy'},
+                    {'link': None, 'headline': 'No link'}],
+    }
+    merged = merge_articles(results, ['Yahoo Finance', 'Reuters', 'MarketWatch'])
+    assert [a['headline'] for a in merged] == ['A', 'No link']
+    assert link_key('HTTPS://WWW.Example.com/a/#x') == 'https://example.com/a'
@@ -0,0 +1,52 @@
+import pytest
+
+from src.news_search import NewsSearchIndex, match_query
+
+
+def article(link, headline, summary='', body=''):
+    return {'link': link, 'headline': headline, 'summary': summary, 'full_content': body, 'source': 'Reuters'}
+
+
+@pytest.fixture
+def index(tmp_path):
+    index = NewsSearchIndex(str(tmp_path / 'search.db'))
+    index.add('2024-03-01', {
+        'AAPL': [article("https://a.com/1", "Apple earnings beat estimates", "iPhone revenue rose 6%"),
+                 article("https://a.com/2", "Apple faces antitrust lawsuit", body="Regulators cite App Store fees")],
+        'MSFT': [article("https://m.com/1", "Microsoft earnings lifted by cloud")],
+    })
+    index.add('2024-03-05', {'AAPL': [article("https://a.com/3", "Apple shares hit record after earnings")]})
+    return index
+
+
+def test_match_query_quotes_words_and_keeps_prefix_star():
+    assert match_query('earn* "beat" AND (guidance) -NEAR') == '"earn"* "beat" "AND" "guidance" "NEAR"'
+    assert match_query("  ?!  ") == ""
+
+
+def test_operators_and_punctuation_do_not_raise(index):
+    assert [r['link'] for r in index.search('earnings: "beat')] == ["https://a.com/1"]
+    assert index.search("NOT (") == []
+    assert index.search("") == []
+
+
+def test_filters_by_ticker_and_date(index):
+    assert {r['ticker'] for r in index.search("earnings")} == {'AAPL', 'MSFT'}
+    assert [r['link'] for r in index.search("earnings", ticker='MSFT')] == ["https://m.com/1"]
+    assert [r['link'] for r in index.search("earnings", ticker='AAPL', date_from='2024-03-02')] == ["https://a.com/3"]
+    assert [r['link'] for r in index.search("earnings", ticker='AAPL', date_to='2024-03-01')] == ["https://a.com/1"]
+
+
+def test_body_and_prefix_matches(index):
+    assert [r['link'] for r in index.search("regulators")] == ["https://a.com/2"]
+    assert len(index.search("earn*")) == 3
+
+
+def test_each_ticker_link_is_indexed_once(index):
+    assert len(index) == 4
+    again = {'AAPL': [article("https://a.com/1", "Apple earnings beat estimates")],
+             'MSFT': [article("https://a.com/1", "Apple earnings mentioned in Microsoft coverage")]}
+    assert index.add('2024-03-06', again) == 1
+    assert len(index) == 5
+    first = [r for r in index.search("estimates") if r['ticker'] == 'AAPL']
+    assert [r['date'] for r in first] == ['2024-03-01']
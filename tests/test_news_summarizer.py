@@ -0,0 +1,48 @@
+from src.news_summarizer import NewsSummarizer
+from src.summarizer_backends import SummarizerBackend
+from src.summary_store import SummaryStore
+
+ARTICLES = [{'headline': 'Acme revenue rises 8%', 'summary': 'Acme beat estimates.', 'source': 'Reuters',
+             'full_content': 'Acme reported revenue of $2.1 billion, up 8%. Margins improved to 31%.'}]
+
+
+class FailingBackend(SummarizerBackend):
+    name = 'failing'
+    cacheable = False
+
+    def summarize(self, ticker, articles_batch, prompt):
+        raise RuntimeError("service unavailable")
+
+
+class FixedBackend(SummarizerBackend):
+    name = 'fixed'
+    cacheable = False
+
+    def summarize(self, ticker, articles_batch, prompt):
+        return {'summary': 'Fine.', 'positive_factors': [], 'negative_factors': [],
+                'sentiment': 'positive', 'price_impact': 'up'}
+
+
+def summarizer(tmp_path, backend, fallback, max_retries=1):
+    return NewsSummarizer(backend=backend, fallback_backend=fallback, max_retries=max_retries, retry_delay=0,
+                          use_cache=False, store=SummaryStore(str(tmp_path / 'summaries.db'), legacy_dir=None),
+                          dedup=False, topic_clustering=False)
+
+
+def test_result_names_the_backend_that_answered(tmp_path):
+    result = summarizer(tmp_path, FixedBackend(), None).summarize_news('ACME', ARTICLES)
+    assert result['backend'] == 'fixed'
+    assert result['sentiment'] == 'positive'
+
+
+def test_fallback_backend_is_named(tmp_path):
+    result = summarizer(tmp_path, FailingBackend(), 'local').summarize_news('ACME', ARTICLES)
+    assert result['backend'] == 'local'
+    assert result['summary'].strip()
+
+
+def test_no_backend_when_every_attempt_fails(tmp_path):
+    news = summarizer(tmp_path, FailingBackend(), None, max_retries=0)
+    result = news.process_article_batch_with_retries('ACME', ARTICLES)
+    assert 'error' in result
+    assert news.merge_summaries([result])['backend'] is None
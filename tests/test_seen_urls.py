@@ -0,0 +1,58 @@
+from src.seen_urls import BloomFilter, SeenURLIndex
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(1000, 0.01)
+    keys = [f"https://example.com/news/{i}" for i in range(1000)]
+    for key in keys:
+        bloom.add(key)
+    assert all(key in bloom for key in keys)
+    false_positives = sum(f"https://example.com/other/{i}" in bloom for i in range(10000))
+    assert false_positives < 300  # ~1% expected
+
+
+def test_stored_links_are_found_and_unknown_links_are_not(tmp_path):
+    index = SeenURLIndex(str(tmp_path / 'seen.db'), capacity=100)
+    index.put_many([("https://a.com/1", "first body"), ("https://a.com/2", "second body"), ("", "no link")])
+    assert len(index) == 2
+    assert index.get("https://a.com/1") == {'content_hash': SeenURLIndex.content_hash("first body"),
+                                            'full_content': "first body"}
+    assert index.get("https://a.com/3") is None
+
+
+def test_bloom_filter_is_rebuilt_when_full(tmp_path):
+    index = SeenURLIndex(str(tmp_path / 'seen.db'), capacity=10)
+    links = [f"https://a.com/{i}" for i in range(25)]
+    index.put_many((link, f"body {link}") for link in links)
+    assert index.bloom.capacity >= 25
+    assert index.bloom.count <= index.bloom.capacity
+    assert all(index.might_contain(link) for link in links)
+
+
+def test_bloom_filter_survives_reopen(tmp_path):
+    path = str(tmp_path / 'seen.db')
+    index = SeenURLIndex(path, capacity=100)
+    index.put("https://a.com/1", "body")
+    index.save()
+    reopened = SeenURLIndex(path, capacity=100)
+    assert reopened.get("https://a.com/1")['full_content'] == "body"
+
+    # A lost filter file is rebuilt from the table
+    (tmp_path / 'seen.bloom').unlink()
+    assert SeenURLIndex(path, capacity=100).might_contain("https://a.com/1")
+
+
+def test_fill_known_returns_articles_still_to_fetch(tmp_path):
+    index = SeenURLIndex(str(tmp_path / 'seen.db'))
+    index.put("https://a.com/1", "stored body")
+    known, unknown = {'link': "https://a.com/1"}, {'link': "https://a.com/2"}
+    assert index.fill_known([known, unknown]) == [unknown]
+    assert known['full_content'] == "stored body"
+
+
+def test_high_water_marks(tmp_path):
+    index = SeenURLIndex(str(tmp_path / 'seen.db'))
+    assert index.high_water_mark('AAPL', 'Reuters') is None
+    index.set_high_water_marks({('AAPL', 'Reuters'): "https://a.com/1"})
+    index.set_high_water_marks({('AAPL', 'Reuters'): "https://a.com/2"})
+    assert index.high_water_mark('AAPL', 'Reuters') == "https://a.com/2"
@@ -0,0 +1,60 @@
+import os
+
+import pytest
+
+from src import summary_cache
+from src.summary_cache import SummaryCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(summary_cache.time, 'time', lambda: now[0])
+    return now
+
+
+def test_key_depends_on_model_and_prompt():
+    key = SummaryCache.make_key('model-a', 'prompt')
+    assert key == SummaryCache.make_key('model-a', 'prompt')
+    assert key != SummaryCache.make_key('model-b', 'prompt')
+    assert key != SummaryCache.make_key('model-a', 'prompt ')
+
+
+def test_hit_and_miss_counts(tmp_path):
+    cache = SummaryCache(str(tmp_path), ttl=None)
+    assert cache.get('k') is None
+    cache.put('k', {'summary': 'cached'})
+    assert cache.get('k') == {'summary': 'cached'}
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_expired_entries_are_misses_and_deleted(tmp_path, clock):
+    cache = SummaryCache(str(tmp_path), ttl=60)
+    cache.put('k', 'value')
+    clock[0] += 59
+    assert cache.get('k') == 'value'
+    clock[0] += 2
+    assert cache.get('k') is None
+    assert not os.path.exists(os.path.join(str(tmp_path), 'k.pkl'))
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path, clock):
+    cache = SummaryCache(str(tmp_path), ttl=None, max_entries=2)
+    cache.put('a', 1)
+    clock[0] += 1
+    cache.put('b', 2)
+    clock[0] += 1
+    assert cache.get('a') == 1  # a is now more recent than b
+    clock[0] += 1
+    cache.put('c', 3)
+    assert cache.get('b') is None
+    assert (cache.get('a'), cache.get('c')) == (1, 3)
+    assert sorted(os.listdir(str(tmp_path))) == ['a.pkl', 'c.pkl']
+
+
+def test_entries_survive_reopen(tmp_path):
+    SummaryCache(str(tmp_path), ttl=None).put('k', 'value')
+    reopened = SummaryCache(str(tmp_path), ttl=None)
+    assert reopened.get('k') == 'value'
+    reopened.clear()
+    assert os.listdir(str(tmp_path)) == []
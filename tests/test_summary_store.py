@@ -0,0 +1,45 @@
+import pickle
+
+from src.summary_store import SummaryStore
+
+
+def summary(text, updated='2024-03-01 08:00:00'):
+    return {'summary': text, 'sentiment': 'neutral', 'last_updated': updated}
+
+
+def test_put_upserts_one_ticker_and_date(tmp_path):
+    store = SummaryStore(str(tmp_path / 'summaries.db'), legacy_dir=None)
+    store.put('AAPL', '2024-03-01', summary('first'))
+    store.put('AAPL', '2024-03-01', summary('rewritten', '2024-03-01 18:00:00'))
+    assert store.get('AAPL', '2024-03-01') == summary('rewritten', '2024-03-01 18:00:00')
+    assert store.dates('AAPL') == ['2024-03-01']
+    assert store.get('AAPL', '2024-03-02') is None
+
+
+def test_latest_dates_and_history(tmp_path):
+    store = SummaryStore(str(tmp_path / 'summaries.db'), legacy_dir=None)
+    assert store.latest('AAPL') == (None, None)
+    store.put_many([('AAPL', '2024-03-02', summary('newer')), ('AAPL', '2024-03-01', summary('older')),
+                    ('MSFT', '2024-03-03', summary('other ticker'))])
+    assert store.latest('AAPL') == ('2024-03-02', summary('newer'))
+    assert store.dates('AAPL') == ['2024-03-02', '2024-03-01']
+    assert list(store.history('AAPL')) == ['2024-03-01', '2024-03-02']
+    assert store.tickers() == ['AAPL', 'MSFT']
+
+
+def test_legacy_pickles_are_imported_once(tmp_path):
+    legacy = tmp_path / 'news_summaries'
+    legacy.mkdir()
+    with open(legacy / 'AAPL.pkl', 'wb') as f:
+        pickle.dump({'2024-02-28': summary('legacy'), '2024-02-29': 'not a summary'}, f)
+    (legacy / 'MSFT.pkl').write_bytes(b'not a pickle')
+    (legacy / 'notes.txt').write_text('ignored')
+
+    path = str(tmp_path / 'summaries.db')
+    store = SummaryStore(path, legacy_dir=str(legacy))
+    assert store.history('AAPL') == {'2024-02-28': summary('legacy')}
+    assert store.tickers() == ['AAPL']
+
+    # An existing database is not re-seeded from the pickles
+    store.put('AAPL', '2024-02-28', summary('edited'))
+    assert SummaryStore(path, legacy_dir=str(legacy)).get('AAPL', '2024-02-28') == summary('edited')
@@ -0,0 +1,111 @@
+import threading
+import time
+
+import pytest
+
+from src.webdriver_pool import WebDriverPool
+
+
+class FakeDriver:
+    """Answers current_url until crashed, and records quit"""
+
+    def __init__(self, number):
+        self.number = number
+        self.crashed = False
+        self.quit_called = False
+
+    @property
+    def current_url(self):
+        if self.crashed:
+            raise RuntimeError("session deleted")
+        return "about:blank"
+
+    def quit(self):
+        self.quit_called = True
+
+
+def make_pool(**kwargs):
+    created = []
+
+    def factory():
+        created.append(FakeDriver(len(created)))
+        return created[-1]
+
+    return WebDriverPool(factory, **kwargs), created
+
+
+def test_idle_driver_is_reused():
+    pool, created = make_pool(size=2)
+    driver = pool.checkout()
+    pool.checkin(driver)
+    assert pool.checkout() is driver
+    assert len(created) == 1
+
+
+def test_dead_driver_is_replaced_on_checkout():
+    pool, created = make_pool()
+    driver = pool.checkout()
+    pool.checkin(driver)
+    driver.crashed = True
+    replacement = pool.checkout()
+    assert replacement is not driver
+    assert driver.quit_called
+    assert pool.recycled == 1
+    assert len(created) == 2
+
+
+def test_broken_checkin_is_replaced():
+    pool, created = make_pool()
+    with pytest.raises(ValueError):
+        with pool.driver() as driver:
+            driver.crashed = True
+            raise ValueError("page failed")
+    assert driver.quit_called
+    assert pool.checkout() is not driver
+
+
+def test_worn_out_driver_is_replaced_after_max_uses():
+    pool, created = make_pool(max_uses=2)
+    first = pool.checkout()
+    pool.checkin(first)
+    assert pool.checkout() is first
+    pool.checkin(first)
+    assert first.quit_called
+    assert pool.checkout() is created[1]
+    assert pool.recycled == 1
+
+
+def test_checkout_times_out_when_pool_is_exhausted():
+    pool, _ = make_pool(size=1)
+    pool.checkout()
+    start = time.perf_counter()
+    with pytest.raises(TimeoutError):
+        pool.checkout(timeout=0.1)
+    assert time.perf_counter() - start < 1
+
+
+def test_waiting_checkout_gets_replacement_for_discarded_driver():
+    pool, created = make_pool(size=1)
+    driver = pool.checkout()
+    results = []
+    waiter = threading.Thread(target=lambda: results.append(pool.checkout(timeout=2)))
+    waiter.start()
+    time.sleep(0.05)
+    pool.checkin(driver, broken=True)
+    waiter.join()
+    assert results == [created[1]]
+
+
+def test_close_quits_every_driver_and_pool_stays_usable():
+    pool, created = make_pool(size=2)
+    first, second = pool.checkout(), pool.checkout()
+    pool.checkin(first)
+    pool.close()
+    assert first.quit_called and second.quit_called
+    pool.checkin(second)  # already discarded; ignored
+    assert pool.checkout() is created[2]
+
+
+def test_size_must_be_positive():
+    with pytest.raises(ValueError):
+        WebDriverPool(lambda: None, size=0)
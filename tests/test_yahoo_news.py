@@ -0,0 +1,162 @@
+import os
+
+import pytest
+
+from src.yahoo_news import (YahooNewsClient, YahooPageError, parse_article_content, parse_news_listing,
+                            take_until)
+from src.seen_urls import SeenURLIndex
+from src.crawl_frontier import CrawlFrontier
+
+FIXTURES = os.path.join(os.path.dirname(__file__), 'fixtures')
+LISTING_URL = "https://finance.yahoo.com/quote/AAPL/news"
+FIRST_LINK = "https://finance.yahoo.com/news/apple-iphone-sales-beat-estimates-120000123.html"
+
+
+def fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding='utf-8') as f:
+        return f.read()
+
+
+class FakeResponse:
+    def __init__(self, url, text, status=200):
+        self.url = url
+        self.text = text
+        self.status = status
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise RuntimeError(f"HTTP {self.status}")
+
+
+class FakeSession:
+    """Serves saved pages by URL and records the requests made"""
+
+    def __init__(self, pages, redirects=None):
+        self.pages = pages
+        self.redirects = redirects or {}
+        self.requested = []
+
+    def get(self, url, timeout=None):
+        self.requested.append(url)
+        if url not in self.pages:
+            return FakeResponse(url, "", status=404)
+        return FakeResponse(self.redirects.get(url, url), self.pages[url])
+
+    def close(self):
+        pass
+
+
+def test_parse_news_listing():
+    articles = parse_news_listing(fixture('yahoo_listing.html'))
+    assert [a['headline'] for a in articles] == [
+        "Apple iPhone sales beat estimates as China demand recovers",
+        "Apple services revenue hits a record",
+        "Apple faces EU fine over App Store rules",
+    ]
+    first, second, third = articles
+    assert first['link'] == FIRST_LINK
+    assert first['summary'].startswith("Apple reported iPhone revenue of $46.2 billion")
+    assert first['source'] == "Reuters"
+    assert first['date'] == "2 hours ago"
+    # Relative links are resolved and a missing preview gets the placeholder
+    assert second['link'] == "https://finance.yahoo.com/news/apple-services-revenue-record-093000456.html"
+    assert second['summary'] == "No summary available"
+    # A publishing line without a date only gives the source
+    assert third['source'] == "Yahoo Finance"
+    assert 'date' not in third
+
+
+def test_parse_news_listing_max_articles():
+    articles = parse_news_listing(fixture('yahoo_listing.html'), max_articles=2)
+    assert len(articles) == 2
+
+
+def test_parse_news_listing_without_story_items():
+    assert parse_news_listing("<html><body><p>Please enable JavaScript</p></body></html>") == []
+
+
+def test_parse_article_content():
+    content = parse_article_content(fixture('yahoo_article.html'))
+    paragraphs = content.split("\n\n")
+    assert paragraphs == [
+        "(Reuters) - Apple reported iPhone revenue of $46.2 billion for the quarter, "
+        "ahead of analyst estimates of $44.9 billion.",
+        "Sales in Greater China rose 4%, the first increase in three quarters.",
+        "Shares rose 3% in extended trading.",
+    ]
+    assert "Related" not in content
+
+
+def test_parse_article_content_falls_back_to_article_paragraphs():
+    html = "<html><body><article><p>First.</p><p>Second.</p></article><p>Footer</p></body></html>"
+    assert parse_article_content(html) == "First.\n\nSecond."
+
+
+def test_take_until():
+    articles = [{'link': 'a'}, {'link': 'b'}, {'link': 'c'}]
+    assert take_until(articles, 'b') == [{'link': 'a'}]
+    assert take_until(articles, 'missing') == articles
+    assert take_until(articles, None) == articles
+
+
+def listing_session():
+    article = fixture('yahoo_article.html')
+    pages = {LISTING_URL: fixture('yahoo_listing.html')}
+    for link in [a['link'] for a in parse_news_listing(pages[LISTING_URL])]:
+        pages[link] = article
+    return FakeSession(pages)
+
+
+def test_client_fetches_listing_and_articles(tmp_path):
+    session = listing_session()
+    index = SeenURLIndex(str(tmp_path / 'seen.db'))
+    client = YahooNewsClient(session=session, url_index=index)
+    articles = client.get_news('AAPL')
+    assert len(articles) == 3
+    assert all(a['full_content'].startswith("(Reuters) - Apple reported") for a in articles)
+    assert session.requested[0] == LISTING_URL
+
+    # A second run only fetches the listing: every article is already in the index
+    session.requested = []
+    again = YahooNewsClient(session=session, url_index=index).get_news('AAPL')
+    assert session.requested == [LISTING_URL]
+    assert [a['full_content'] for a in again] == [a['full_content'] for a in articles]
+
+
+def test_client_stops_at_high_water_mark():
+    session = listing_session()
+    articles = YahooNewsClient(session=session).get_news(
+        'AAPL', stop_at="https://finance.yahoo.com/news/apple-services-revenue-record-093000456.html")
+    assert [a['link'] for a in articles] == [FIRST_LINK]
+    assert session.requested == [LISTING_URL, FIRST_LINK]
+
+
+def test_client_through_frontier():
+    frontier = CrawlFrontier(budgets={'default': {'concurrency': 2, 'delay': 0}}, max_workers=2)
+    try:
+        articles = YahooNewsClient(session=listing_session(), frontier=frontier).get_news('AAPL')
+    finally:
+        frontier.close()
+    assert len(articles) == 3
+    assert frontier.stats['finance.yahoo.com']['requests'] == 4
+
+
+def test_client_failed_article_gets_placeholder():
+    session = listing_session()
+    del session.pages[FIRST_LINK]
+    articles = YahooNewsClient(session=session).get_news('AAPL')
+    assert articles[0]['full_content'] == "No content available"
+    assert articles[1]['full_content'] != "No content available"
+
+
+def test_client_consent_redirect_raises():
+    session = FakeSession({LISTING_URL: "<html></html>"},
+                          redirects={LISTING_URL: "https://consent.yahoo.com/v2/collectConsent"})
+    with pytest.raises(YahooPageError, match="consent"):
+        YahooNewsClient(session=session).get_news('AAPL')
+
+
+def test_client_empty_listing_raises():
+    session = FakeSession({LISTING_URL: "<html><body></body></html>"})
+    with pytest.raises(YahooPageError, match="No story items"):
+        YahooNewsClient(session=session).get_news('AAPL')
@@ -0,0 +1,137 @@
+import os
+import sys
+import time
+import argparse
+import statistics
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+from src.browser_profile import BROWSER_PROFILES, chrome_options, block_requests
+from src.page_readiness import load_page
+
+DEFAULT_URLS = [
+    "https://finance.yahoo.com/quote/AAPL/news",
+    "https://finance.yahoo.com/quote/MSFT/news",
+    "https://www.marketwatch.com/search?q=NVDA&m=Keyword",
+    "https://www.reuters.com/site-search/?query=AMZN"
+]
+
+
+def process_tree_rss(pid):
+    """Resident memory (MB) of a process and its descendants, from /proc (None elsewhere)"""
+    if not os.path.isdir('/proc'):
+        return None
+    children = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/stat') as f:
+                parent = int(f.read().rsplit(')', 1)[1].split()[1])
+            children.setdefault(parent, []).append(int(entry))
+        except (OSError, ValueError, IndexError):
+            continue
+    total_kb = 0
+    stack = [pid]
+    while stack:
+        current = stack.pop()
+        stack.extend(children.get(current, []))
+        try:
+            with open(f'/proc/{current}/status') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        total_kb += int(line.split()[1])
+                        break
+        except OSError:
+            continue
+    return total_kb / 1024
+
+
+def page_stats(driver):
+    """Requests and bytes transferred by the current page, and its JS heap (MB)"""
+    resources = driver.execute_script(
+        "return performance.getEntriesByType('resource').map(r => r.transferSize || 0)"
+    )
+    heap = None
+    try:
+        metrics = driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+        heap = next(m["value"] for m in metrics if m["name"] == "JSHeapUsedSize") / 2 ** 20
+    except Exception:
+        pass
+    return len(resources), sum(resources) / 2 ** 20, heap
+
+
+def run_profile(profile, urls, rounds, headless):
+    """Load every URL rounds times in one browser with the given profile"""
+    # A bare driver rather than a NewsTracker, which would open the data/ stores
+    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()),
+                              options=chrome_options(headless, profile))
+    if profile == 'lean':
+        block_requests(driver)
+    try:
+        driver.execute_cdp_cmd("Performance.enable", {})
+    except Exception:
+        pass
+    loads, requests, megabytes, heaps = [], [], [], []
+    try:
+        for _ in range(rounds):
+            for url in urls:
+                start = time.perf_counter()
+                try:
+                    load_page(driver, url)
+                except Exception as e:
+                    print(f"[{profile}] Error loading {url}: {e}")
+                    continue
+                loads.append(time.perf_counter() - start)
+                count, size, heap = page_stats(driver)
+                requests.append(count)
+                megabytes.append(size)
+                if heap is not None:
+                    heaps.append(heap)
+        rss = process_tree_rss(driver.service.process.pid)
+    finally:
+        driver.quit()
+
+    return {
+        'profile': profile,
+        'pages': len(loads),
+        'median_load': statistics.median(loads) if loads else None,
+        'max_load': max(loads) if loads else None,
+        'requests': statistics.mean(requests) if requests else None,
+        'transfer_mb': statistics.mean(megabytes) if megabytes else None,
+        'js_heap_mb': statistics.mean(heaps) if heaps else None,
+        'rss_mb': rss
+    }
+
+
+def fmt(value, spec):
+    return format(value, spec) if value is not None else 'n/a'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare page load time and memory of the Chrome scraping profiles')
+    parser.add_argument('--urls', type=str, nargs='+', default=DEFAULT_URLS, help='Pages to load')
+    parser.add_argument('--rounds', type=int, default=2, help='Times each page is loaded per profile')
+    parser.add_argument('--profiles', type=str, nargs='+', default=list(BROWSER_PROFILES),
+                        choices=BROWSER_PROFILES, help='Profiles to compare')
+    parser.add_argument('--show-browser', action='store_true', help='Run Chrome with a window')
+    args = parser.parse_args()
+
+    results = [run_profile(profile, args.urls, args.rounds, not args.show_browser) for profile in args.profiles]
+
+    print(f"\n{'profile':<8} {'pages':>6} {'median s':>9} {'max s':>7} {'requests':>9} "
+          f"{'MB/page':>8} {'JS heap MB':>11} {'Chrome RSS MB':>14}")
+    for r in results:
+        print(f"{r['profile']:<8} {r['pages']:>6} {fmt(r['median_load'], '.2f'):>9} {fmt(r['max_load'], '.2f'):>7} "
+              f"{fmt(r['requests'], '.0f'):>9} {fmt(r['transfer_mb'], '.2f'):>8} {fmt(r['js_heap_mb'], '.1f'):>11} "
+              f"{fmt(r['rss_mb'], '.0f'):>14}")
+    if len(results) == 2 and all(r['median_load'] for r in results):
+        print(f"\n{results[1]['profile']} loads pages {results[0]['median_load'] / results[1]['median_load']:.1f}x "
+              f"faster than {results[0]['profile']} (median)")
+
+
+if __name__ == "__main__":
+    main()
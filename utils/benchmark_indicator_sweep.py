@@ -0,0 +1,79 @@
+import os
+import sys
+import time
+import pickle
+import argparse
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.indicator_sweep import IndicatorSweep
+
+
+def synthetic_stock_data(tickers, bars, seed=0):
+    """Build a stock_data dict of random-walk closes shaped like StockTracker.track output"""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=bars)
+    stocks = {}
+    for i in range(tickers):
+        returns = rng.normal(0.0003, 0.02, size=bars)
+        close = 100 * np.exp(np.cumsum(returns))
+        stocks[f"SYN{i}"] = {"history": pd.DataFrame({"Close": close}, index=dates)}
+    return {"stocks": stocks}
+
+
+def naive_rolling_sweep(stock_data, grid):
+    """Reference timing: one pandas rolling pass per ticker per window"""
+    start = time.perf_counter()
+    windows = set(grid['ma_short']) | set(grid['ma_long']) | set(grid['bollinger']) | set(grid['rsi'])
+    for data in stock_data['stocks'].values():
+        close = data['history']['Close']
+        for window in windows:
+            close.rolling(window=window).mean()
+            close.rolling(window=window).std()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the indicator window sweep')
+    parser.add_argument('--data', type=str, default='data/stock_data.pkl',
+                        help='stock_data pickle to sweep (falls back to synthetic data)')
+    parser.add_argument('--tickers', type=int, default=500, help='Synthetic tickers')
+    parser.add_argument('--bars', type=int, default=2520, help='Synthetic daily bars per ticker')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed repetitions')
+    args = parser.parse_args()
+
+    if os.path.exists(args.data):
+        with open(args.data, 'rb') as f:
+            stock_data = pickle.load(f)
+        print(f"Loaded {len(stock_data.get('stocks', {}))} tickers from {args.data}")
+    else:
+        stock_data = synthetic_stock_data(args.tickers, args.bars)
+        print(f"Using synthetic panel: {args.tickers} tickers x {args.bars} bars")
+
+    sweep = IndicatorSweep(stock_data)
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        results = sweep.run()
+        timings.append(time.perf_counter() - start)
+
+    if 'error' in results:
+        print(results['error'])
+        return
+
+    settings = sum(len(results[k]) for k in ['moving_average', 'rsi', 'macd', 'bollinger'])
+    print(f"Swept {settings} scored settings over {results['tickers']} tickers x {results['bars']} bars")
+    print(f"Sweep time: best {min(timings):.3f}s, median {sorted(timings)[len(timings) // 2]:.3f}s")
+    print(f"Naive per-ticker rolling (MA/std only): {naive_rolling_sweep(stock_data, sweep.grid):.3f}s")
+
+    print("\nBest settings by mean forward return:")
+    for indicator, best in results['best'].items():
+        print(f"  {indicator}: {best['params']} "
+              f"(mean {best['mean_return']:.4f}, hit rate {best['hit_rate']:.2%}, {best['signals']} signals)")
+    print(f"\nindicator_windows = {sweep.best_windows()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+import os
+import sys
+import time
+import pickle
+import random
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.config import SENTIMENT_LEXICON
+from src.keyword_sentiment import KeywordSentimentScorer
+from src.article_archive import ArticleArchive
+
+FILLER = ("the company said on tuesday that its quarterly results and outlook for the year "
+          "were in line with analyst estimates as investors weighed the market reaction").split()
+
+
+def synthetic_news_data(tickers, articles_per_ticker, seed=0):
+    """Build a {ticker: [articles]} dict with headline/summary text sprinkled with lexicon terms"""
+    rng = random.Random(seed)
+    phrases = list(SENTIMENT_LEXICON.keys())
+    news_data = {}
+    for i in range(tickers):
+        articles = []
+        for _ in range(articles_per_ticker):
+            headline = rng.sample(FILLER, 8) + [rng.choice(phrases)]
+            summary = rng.sample(FILLER, 20) + rng.sample(phrases, 2) + rng.sample(FILLER, 10)
+            articles.append({"headline": " ".join(headline).capitalize(), "summary": " ".join(summary)})
+        news_data[f"SYN{i}"] = articles
+    return news_data
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the local keyword sentiment scorer')
+    parser.add_argument('--data', type=str, default='data/news_archive.db',
+                        help='news archive (or legacy news_data pickle) to score (falls back to synthetic articles)')
+    parser.add_argument('--tickers', type=int, default=500, help='Synthetic tickers')
+    parser.add_argument('--articles', type=int, default=100, help='Synthetic articles per ticker')
+    args = parser.parse_args()
+
+    if os.path.exists(args.data) and args.data.endswith('.pkl'):
+        with open(args.data, 'rb') as f:
+            history = pickle.load(f)
+        news_data = history[max(history.keys())] if history else {}
+        print(f"Loaded latest news snapshot from {args.data}")
+    elif os.path.exists(args.data):
+        news_data = ArticleArchive(args.data, legacy_path=None).latest()
+        print(f"Loaded latest news snapshot from {args.data}")
+    else:
+        news_data = synthetic_news_data(args.tickers, args.articles)
+        print(f"Using synthetic news: {args.tickers} tickers x {args.articles} articles")
+
+    article_count = sum(len(a) for a in news_data.values() if isinstance(a, list))
+    start = time.perf_counter()
+    scorer = KeywordSentimentScorer()
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    results = scorer.score_news_data(news_data)
+    elapsed = time.perf_counter() - start
+
+    print(f"Automaton build: {build_time * 1000:.2f} ms ({len(scorer.automaton.goto)} states)")
+    print(f"Scored {article_count} articles for {len(results)} tickers in {elapsed:.3f}s "
+          f"({article_count / elapsed if elapsed else float('inf'):,.0f} articles/s)")
+
+
+if __name__ == "__main__":
+    main()
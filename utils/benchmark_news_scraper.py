@@ -0,0 +1,98 @@
+import os
+import sys
+import glob
+import time
+import json
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.yahoo_news import YahooNewsClient, YAHOO_BASE_URL, parse_news_listing, parse_article_content
+
+
+def save_fixtures(ticker, fixtures_dir, max_articles):
+    """Download a ticker's Yahoo news listing and article pages as HTML fixtures"""
+    os.makedirs(fixtures_dir, exist_ok=True)
+    client = YahooNewsClient()
+    listing = client.fetch(f"{YAHOO_BASE_URL}/quote/{ticker}/news")
+    with open(os.path.join(fixtures_dir, 'listing.html'), 'w', encoding='utf-8') as f:
+        f.write(listing)
+    articles = parse_news_listing(listing, max_articles)
+    for i, article in enumerate(articles):
+        try:
+            html = client.fetch(article['link'])
+        except Exception as e:
+            print(f"Skipping {article['link']}: {e}")
+            continue
+        with open(os.path.join(fixtures_dir, f'article_{i:02d}.html'), 'w', encoding='utf-8') as f:
+            f.write(html)
+    client.close()
+    print(f"Saved listing and {len(articles)} article pages to {fixtures_dir}")
+
+
+def parse_fixtures(fixtures_dir, max_articles, show):
+    """Parse saved fixtures and report what was extracted and how long it took"""
+    with open(os.path.join(fixtures_dir, 'listing.html'), encoding='utf-8') as f:
+        listing = f.read()
+    pages = []
+    for path in sorted(glob.glob(os.path.join(fixtures_dir, 'article_*.html'))):
+        with open(path, encoding='utf-8') as f:
+            pages.append((os.path.basename(path), f.read()))
+
+    start = time.perf_counter()
+    articles = parse_news_listing(listing, max_articles)
+    contents = [(name, parse_article_content(html)) for name, html in pages]
+    elapsed = time.perf_counter() - start
+
+    print(f"Parsed {len(articles)} listing items and {len(contents)} article pages in {elapsed * 1000:.1f} ms")
+    empty = [name for name, content in contents if not content]
+    if empty:
+        print(f"No body text found in: {', '.join(empty)}")
+    if show:
+        print(json.dumps(articles[:3], indent=2))
+        for name, content in contents[:3]:
+            print(f"{name}: {content[:200]!r}")
+    return articles, contents
+
+
+def time_live(ticker, max_articles, selenium):
+    """Time a live HTTP scrape (and optionally the Selenium scraper) for one ticker"""
+    client = YahooNewsClient()
+    start = time.perf_counter()
+    articles = client.get_news(ticker, max_articles)
+    print(f"HTTP: {len(articles)} articles for {ticker} in {time.perf_counter() - start:.2f}s")
+    client.close()
+
+    if selenium:
+        from src.news_tracker import NewsTracker
+        tracker = NewsTracker(tickers=[ticker], scraper_mode='selenium')
+        try:
+            start = time.perf_counter()
+            articles = tracker.scrape_yahoo_finance(ticker, max_articles)
+            print(f"Selenium: {len(articles)} articles for {ticker} in {time.perf_counter() - start:.2f}s")
+        finally:
+            tracker.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check and time the HTTP Yahoo Finance news scraper')
+    parser.add_argument('--ticker', type=str, default='AAPL', help='Ticker to scrape')
+    parser.add_argument('--max-articles', type=int, default=20, help='Articles per ticker')
+    parser.add_argument('--fixtures', type=str, default=None,
+                        help='Directory with listing.html and article_*.html to parse offline')
+    parser.add_argument('--save-fixtures', type=str, default=None,
+                        help='Download the live pages for --ticker into this directory')
+    parser.add_argument('--selenium', action='store_true', help='Also time the Selenium scraper on the live site')
+    parser.add_argument('--show', action='store_true', help='Print a sample of the parsed articles')
+    args = parser.parse_args()
+
+    if args.save_fixtures:
+        save_fixtures(args.ticker, args.save_fixtures, args.max_articles)
+    elif args.fixtures:
+        parse_fixtures(args.fixtures, args.max_articles, args.show)
+    else:
+        time_live(args.ticker, args.max_articles, args.selenium)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,172 @@
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from together import Together
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.fake_llm_server import FakeLLMServer, LatencyModel
+from src.summarizer_backends import TogetherBackend
+from src.news_summarizer import NewsSummarizer
+from src.summary_store import SummaryStore
+from src.article_compressor import ArticleCompressor
+
+WORDS = ("revenue growth margin guidance quarter services demand analysts shares outlook costs supply "
+         "market customers product launch regulators investment earnings forecast").split()
+
+
+class TimedBackend(TogetherBackend):
+    """TogetherBackend that records the wall time of every model call"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.latencies = []
+        self.failures = 0
+        self._lock = threading.Lock()
+
+    def summarize(self, ticker, articles_batch, prompt):
+        start = time.perf_counter()
+        try:
+            return super().summarize(ticker, articles_batch, prompt)
+        except Exception:
+            with self._lock:
+                self.failures += 1
+            raise
+        finally:
+            with self._lock:
+                self.latencies.append(time.perf_counter() - start)
+
+
+def percentile(values, q):
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return float('nan')
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(round(q / 100 * len(ordered))) - 1))]
+
+
+def synthetic_articles(count, words_per_article=400, seed=0):
+    """Articles with enough body text for the packer to build several requests"""
+    rng = random.Random(seed)
+    articles = []
+    for i in range(count):
+        body = " ".join(rng.choice(WORDS) for _ in range(words_per_article))
+        articles.append({
+            "headline": f"Synthetic headline {i}: {' '.join(rng.sample(WORDS, 5))}",
+            "date": f"2024-01-{i % 28 + 1:02d}",
+            "source": "Synthetic",
+            "summary": f"Revenue rose {rng.randint(1, 30)}% to ${rng.randint(1, 90)}B.",
+            "full_content": body
+        })
+    return articles
+
+
+def synthetic_10k(ticker, blocks=200):
+    """Minimal EDGAR full-text submission with a 10-K document of span text blocks"""
+    rng = random.Random(ticker)
+    spans = "".join(f"<span>{' '.join(rng.choice(WORDS) for _ in range(30))}</span>" for _ in range(blocks))
+    return (f"<SEC-DOCUMENT><DOCUMENT>\n<TYPE>10-K\n<TEXT>\n<html><body>{spans}</body></html>\n"
+            f"</TEXT>\n</DOCUMENT></SEC-DOCUMENT>")
+
+
+def report(label, wall, items, latencies, failures):
+    print(f"{label:<28} wall {wall:7.2f}s  {items / wall if wall else 0:7.2f} items/s  "
+          f"calls {len(latencies):4d}  failed {failures:3d}  "
+          f"p50 {percentile(latencies, 50):6.3f}s  p95 {percentile(latencies, 95):6.3f}s  "
+          f"p99 {percentile(latencies, 99):6.3f}s")
+
+
+def benchmark_news(base_url, concurrency, tickers, articles, retries, client_retries):
+    backend = TimedBackend(client=Together(api_key='fake', base_url=base_url, max_retries=client_retries))
+    # Dedup, topic clustering and compression would collapse the synthetic articles (all drawn from
+    # one vocabulary) into a single request per ticker, leaving nothing to run concurrently
+    summarizer = NewsSummarizer(max_concurrency=concurrency, max_retries=retries, retry_delay=0.1,
+                                use_cache=False, backend=backend, fallback_backend=None,
+                                store=SummaryStore(os.path.join(tempfile.mkdtemp(), 'news_summaries.db'), legacy_dir=None),
+                                dedup=False, topic_clustering=False, compressor=ArticleCompressor(aggressiveness=0))
+    ticker_articles = [synthetic_articles(articles, seed=i) for i in range(tickers)]
+    batches = min(len(summarizer.packer.pack(batch)) for batch in ticker_articles)
+    assert batches > 1, f"{articles} articles pack into {batches} request per ticker; raise --articles"
+
+    start = time.perf_counter()
+    for i, batch in enumerate(ticker_articles):
+        summarizer.summarize_news(f"SYN{i}", batch)
+    wall = time.perf_counter() - start
+    report(f"news concurrency={concurrency}", wall, tickers * articles, backend.latencies, backend.failures)
+
+
+def benchmark_10k(base_url, concurrency, tickers, client_retries):
+    # Imported here so --skip-10k works without the fundamentals dependencies (yfinance, bs4)
+    from src.fundamentals_tracker import FundamentalsTracker
+
+    tracker = FundamentalsTracker()
+    tracker.client = Together(api_key='fake', base_url=base_url, max_retries=client_retries)
+    for i in range(tickers):
+        ticker = f"SYN{i}"
+        tracker.fundamentals[ticker] = {}
+        tracker.links[ticker] = [{'filing_date': '2024-12-31', 'text_file': synthetic_10k(ticker)}]
+
+    latencies, failures = [], 0
+
+    def run(ticker):
+        start = time.perf_counter()
+        result = tracker.summarize_10k(ticker)
+        return time.perf_counter() - start, result
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        for elapsed, result in executor.map(run, list(tracker.links)):
+            latencies.append(elapsed)
+            if isinstance(result, dict) and 'error' in result:
+                failures += 1
+    wall = time.perf_counter() - start
+    report(f"10-K concurrency={concurrency}", wall, tickers, latencies, failures)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark summarizer throughput and tail latency against a fake LLM server')
+    parser.add_argument('--base-url', type=str, default=None,
+                        help='Use a running chat-completions server instead of starting a local fake one')
+    parser.add_argument('--concurrency', type=str, default='1,2,5,10', help='Comma-separated concurrency levels')
+    parser.add_argument('--tickers', type=int, default=5, help='Tickers to summarize per run')
+    parser.add_argument('--articles', type=int, default=40, help='Articles per ticker')
+    parser.add_argument('--latency', type=str, default='lognormal', choices=['fixed', 'uniform', 'lognormal'],
+                        help='Fake server latency distribution')
+    parser.add_argument('--median', type=float, default=0.5, help='Fake server median latency in seconds')
+    parser.add_argument('--sigma', type=float, default=0.5, help='Fake server lognormal sigma')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fake server failure fraction')
+    parser.add_argument('--retries', type=int, default=3, help='NewsSummarizer attempts per batch')
+    parser.add_argument('--client-retries', type=int, default=0, help='Together client built-in retries')
+    parser.add_argument('--skip-10k', action='store_true', help='Only benchmark NewsSummarizer')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for the fake server')
+    args = parser.parse_args()
+
+    server = None
+    base_url = args.base_url
+    if base_url is None:
+        latency = LatencyModel(args.latency, args.median, args.sigma, seed=args.seed)
+        server = FakeLLMServer(latency=latency, error_rate=args.error_rate, seed=args.seed)
+        base_url = server.start()
+        print(f"Fake LLM server at {base_url} ({args.latency}, median {args.median}s, "
+              f"error rate {args.error_rate:.0%})")
+
+    levels = [int(level) for level in args.concurrency.split(',') if level.strip()]
+    try:
+        for concurrency in levels:
+            benchmark_news(base_url, concurrency, args.tickers, args.articles, args.retries, args.client_retries)
+        if not args.skip_10k:
+            for concurrency in levels:
+                benchmark_10k(base_url, concurrency, args.tickers, args.client_retries)
+    finally:
+        if server is not None:
+            server.stop()
+            print(f"Fake server handled {server.requests} requests ({server.errors} injected errors)")
+
+
+if __name__ == "__main__":
+    main()
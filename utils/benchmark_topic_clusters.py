@@ -0,0 +1,127 @@
+import os
+import sys
+import time
+import random
+import argparse
+import tempfile
+from together import Together
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.fake_llm_server import FakeLLMServer, LatencyModel
+from utils.benchmark_summarizers import TimedBackend, percentile
+from src.news_summarizer import NewsSummarizer
+from src.summary_store import SummaryStore
+from src.article_packer import ArticlePacker, estimate_tokens, format_article
+from src.article_compressor import ArticleCompressor
+
+EVENTS = [
+    ("earnings", "reported quarterly revenue of ${n} billion, up {p}% from a year earlier, beating analyst estimates"),
+    ("buyback", "announced a ${n} billion share buyback program and raised its dividend by {p}%"),
+    ("lawsuit", "faces a lawsuit from regulators alleging antitrust violations that could cost ${n} billion in fines"),
+    ("launch", "unveiled a new product line expected to add {p}% to sales and ${n} billion in annual revenue"),
+    ("downgrade", "was downgraded by analysts who cut their price target by {p}% citing weak demand in China"),
+    ("supply", "warned of supply chain disruptions that could delay shipments and reduce margins by {p}%"),
+]
+FILLER = ("market investors traders session index broader stocks sector week morning afternoon "
+          "commentary outlook expectations reaction volume").split()
+
+
+class FixedBatchPacker:
+    """The original batching: consecutive groups of batch_size articles"""
+
+    def __init__(self, batch_size=4):
+        self.batch_size = batch_size
+
+    def pack(self, articles):
+        return [articles[i:i + self.batch_size] for i in range(0, len(articles), self.batch_size)]
+
+
+def synthetic_ticker_news(ticker, articles, events, seed=0):
+    """Articles about a few events, each event covered by several outlets in different words"""
+    rng = random.Random(seed)
+    chosen = rng.sample(EVENTS, events)
+    facts = {name: template.format(n=rng.randint(2, 90), p=rng.randint(2, 30)) for name, template in chosen}
+    news = []
+    for i in range(articles):
+        name, _ = chosen[i % events]
+        fact = facts[name]
+        body = " ".join(
+            f"{ticker} {fact}. The {' '.join(rng.choice(FILLER) for _ in range(12))} "
+            f"{rng.choice(['reacted', 'responded', 'moved'])} to the {name} news."
+            for _ in range(rng.randint(6, 10))
+        )
+        news.append({
+            "headline": f"{ticker} {name}: {fact[:60]}",
+            "date": f"2024-03-{i % 28 + 1:02d}",
+            "source": rng.choice(["Reuters", "Yahoo Finance", "MarketWatch", "CNBC", "Barron's"]),
+            "summary": f"{ticker} {fact}.",
+            "full_content": body
+        })
+    rng.shuffle(news)
+    return news
+
+
+def run(label, base_url, news, concurrency, **options):
+    backend = TimedBackend(client=Together(api_key='fake', base_url=base_url, max_retries=0))
+    summarizer = NewsSummarizer(max_concurrency=concurrency, use_cache=False, backend=backend, fallback_backend=None,
+                                store=SummaryStore(os.path.join(tempfile.mkdtemp(), 'news_summaries.db'),
+                                                   legacy_dir=None),
+                                **options)
+    prompt_tokens = 0
+    original = summarizer.process_article_batch_with_retries
+
+    def counting(ticker, batch):
+        nonlocal prompt_tokens
+        prompt_tokens += estimate_tokens(summarizer.build_prompt(ticker, batch))
+        return original(ticker, batch)
+
+    summarizer.process_article_batch_with_retries = counting
+    start = time.perf_counter()
+    for ticker, articles in news.items():
+        summarizer.summarize_news(ticker, articles)
+    wall = time.perf_counter() - start
+    return label, wall, len(backend.latencies), prompt_tokens, backend.latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare LLM calls and latency of fixed batching, token packing and topic clustering')
+    parser.add_argument('--tickers', type=int, default=5, help='Synthetic tickers')
+    parser.add_argument('--articles', type=int, default=20, help='Articles per ticker')
+    parser.add_argument('--events', type=int, default=4, help='Distinct events per ticker')
+    parser.add_argument('--concurrency', type=int, default=5, help='Concurrent requests per ticker')
+    parser.add_argument('--median', type=float, default=0.5, help='Fake server median latency in seconds')
+    parser.add_argument('--per-1k-tokens', type=float, default=0.1,
+                        help='Extra fake latency per 1k prompt tokens (seconds)')
+    args = parser.parse_args()
+
+    news = {f"SYN{i}": synthetic_ticker_news(f"SYN{i}", args.articles, args.events, seed=i) for i in range(args.tickers)}
+    article_tokens = sum(estimate_tokens(format_article(1, a)) for articles in news.values() for a in articles)
+
+    server = FakeLLMServer(latency=LatencyModel('lognormal', args.median, 0.3, seed=0),
+                           per_1k_tokens=args.per_1k_tokens, seed=0)
+    base_url = server.start()
+    print(f"{args.tickers} tickers x {args.articles} articles ({args.events} events each), "
+          f"~{article_tokens} article tokens, fake server {base_url}")
+
+    # Compression off in every row so the rows differ only in batching and clustering
+    plain = dict(dedup=False, topic_clustering=False, compressor=ArticleCompressor(aggressiveness=0))
+    configurations = [
+        ("fixed 4-article batches", dict(plain, packer=FixedBatchPacker(4))),
+        ("token-budget packing", dict(plain, packer=ArticlePacker())),
+        ("topic digests + packing", dict(plain, topic_clustering=True, packer=ArticlePacker())),
+    ]
+    try:
+        results = [run(label, base_url, news, args.concurrency, **options) for label, options in configurations]
+    finally:
+        server.stop()
+
+    print()
+    print(f"{'configuration':<26} {'calls':>6} {'prompt tokens':>14} {'wall':>8} {'p50 call':>9} {'p95 call':>9}")
+    for label, wall, calls, tokens, latencies in results:
+        print(f"{label:<26} {calls:>6} {tokens:>14} {wall:>7.2f}s "
+              f"{percentile(latencies, 50):>8.3f}s {percentile(latencies, 95):>8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
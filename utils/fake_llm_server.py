@@ -0,0 +1,252 @@
+import sys
+import json
+import time
+import random
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Canned answers in the JSON shapes the summarizer prompts ask for
+NEWS_RESPONSE = {
+    "summary": "Revenue increased 12% to $4.1B on strong services demand, while operating margin narrowed to 28%.",
+    "positive_factors": [
+        {"factor": "Services revenue growth", "metrics": "+12% year over year to $4.1B"},
+        {"factor": "Share buyback expansion", "metrics": "$10B additional authorization"}
+    ],
+    "negative_factors": [
+        {"factor": "Margin compression", "metrics": "Operating margin down 150bp to 28%"}
+    ],
+    "sentiment": "positive",
+    "price_impact": "Modest upward pressure in the near term"
+}
+
+TEN_K_RESPONSE = {
+    "risks": ["Supply chain concentration in a small number of regions", "Regulatory scrutiny of app store fees"],
+    "positive_factors": ["Growing installed base", "Recurring services revenue"],
+    "earning_boosters": ["Price increases on subscriptions", "Expansion into emerging markets"],
+    "earning_sinks": ["Rising component costs", "Litigation expenses"]
+}
+
+
+class LatencyModel:
+    """Per-request latency in seconds drawn from a fixed, uniform or lognormal distribution
+
+    'fixed' always waits median; 'uniform' draws from [median - spread, median + spread];
+    'lognormal' has the given median and log-space sigma, which gives the long
+    right tail typical of hosted LLM endpoints.
+    """
+
+    def __init__(self, distribution='lognormal', median=1.0, sigma=0.5, spread=0.5, seed=None):
+        if distribution not in ('fixed', 'uniform', 'lognormal'):
+            raise ValueError(f"Unknown latency distribution: {distribution}")
+        self.distribution = distribution
+        self.median = median
+        self.sigma = sigma
+        self.spread = spread
+        self.rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def sample(self):
+        with self._lock:
+            if self.distribution == 'fixed':
+                return self.median
+            if self.distribution == 'uniform':
+                return max(0.0, self.rng.uniform(self.median - self.spread, self.median + self.spread))
+            return self.rng.lognormvariate(0, self.sigma) * self.median
+
+
+class FakeLLMServer:
+    """Local stand-in for the Together chat-completions endpoint
+
+    Accepts POSTs to any path ending in /chat/completions and answers in the
+    OpenAI-compatible format the Together client parses, after a delay drawn
+    from the latency model plus per_1k_tokens seconds per 1,000 prompt tokens
+    (estimated at 4 characters per token). A fraction error_rate of requests fail with 429 or
+    500. The reply is the 10-K canned JSON when the prompt mentions a 10-K and
+    the news JSON otherwise, optionally wrapped in a <think> block and a
+    ```json fence the way reasoning models answer. Requests with "stream": true
+    get the same content as server-sent event chunks.
+
+    Point the summarizers at it with TOGETHER_BASE_URL=http://host:port/v1.
+    """
+
+    def __init__(self, host='127.0.0.1', port=0, latency=None, error_rate=0.0, news_response=None,
+                 ten_k_response=None, think=True, seed=None, per_1k_tokens=0.0):
+        self.latency = latency or LatencyModel(seed=seed)
+        self.per_1k_tokens = per_1k_tokens
+        self.error_rate = error_rate
+        self.news_response = news_response or NEWS_RESPONSE
+        self.ten_k_response = ten_k_response or TEN_K_RESPONSE
+        self.think = think
+        self.rng = random.Random(seed)
+        self.requests = 0
+        self.errors = 0
+        self._lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def reply_text(self, prompt):
+        """Canned completion text for a prompt"""
+        payload = self.ten_k_response if '10-K' in prompt else self.news_response
+        text = f"```json\n{json.dumps(payload, indent=2)}\n```"
+        if self.think:
+            text = "<think>\nReading the articles and extracting figures.\n</think>\n" + text
+        return text
+
+    def _should_fail(self):
+        with self._lock:
+            self.requests += 1
+            fail = self.rng.random() < self.error_rate
+            if fail:
+                self.errors += 1
+            return fail
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                pass
+
+            def _send_json(self, status, body):
+                data = json.dumps(body).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0) or 0)
+                try:
+                    request = json.loads(self.rfile.read(length) or b'{}')
+                except json.JSONDecodeError:
+                    request = {}
+                if not self.path.rstrip('/').endswith('/chat/completions'):
+                    self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+                    return
+
+                prompt = " ".join(str(m.get('content', '')) for m in request.get('messages', []))
+                time.sleep(server.latency.sample() + server.per_1k_tokens * len(prompt) / 4000)
+                if server._should_fail():
+                    status = server.rng.choice([429, 500])
+                    self._send_json(status, {"error": {"message": "Injected failure", "type": "fake_server_error"}})
+                    return
+
+                text = server.reply_text(prompt)
+                model = request.get('model', 'fake-model')
+                completion_id = f"fake-{time.time_ns()}"
+                if request.get('stream'):
+                    self._stream(completion_id, model, text)
+                    return
+                self._send_json(200, {
+                    "id": completion_id,
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": [{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": text},
+                        "finish_reason": "stop"
+                    }],
+                    "usage": {
+                        "prompt_tokens": len(prompt) // 4,
+                        "completion_tokens": len(text) // 4,
+                        "total_tokens": (len(prompt) + len(text)) // 4
+                    }
+                })
+
+            def _stream(self, completion_id, model, text, chunk_chars=16):
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/event-stream')
+                self.send_header('Connection', 'close')
+                self.end_headers()
+                for i in range(0, len(text), chunk_chars):
+                    chunk = {
+                        "id": completion_id,
+                        "object": "chat.completion.chunk",
+                        "created": int(time.time()),
+                        "model": model,
+                        "choices": [{"index": 0, "delta": {"content": text[i:i + chunk_chars]}, "finish_reason": None}]
+                    }
+                    self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode('utf-8'))
+                final = {
+                    "id": completion_id,
+                    "object": "chat.completion.chunk",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]
+                }
+                self.wfile.write(f"data: {json.dumps(final)}\n\ndata: [DONE]\n\n".encode('utf-8'))
+                self.wfile.flush()
+                self.close_connection = True
+
+        return Handler
+
+    def start(self):
+        """Serve in a background thread and return the base URL"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run a fake chat-completions server for offline summarizer testing')
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='Host to bind')
+    parser.add_argument('--port', type=int, default=8011, help='Port to bind')
+    parser.add_argument('--latency', type=str, default='lognormal', choices=['fixed', 'uniform', 'lognormal'],
+                        help='Latency distribution')
+    parser.add_argument('--median', type=float, default=1.0, help='Median latency in seconds')
+    parser.add_argument('--sigma', type=float, default=0.5, help='Lognormal sigma')
+    parser.add_argument('--spread', type=float, default=0.5, help='Uniform half-width in seconds')
+    parser.add_argument('--per-1k-tokens', type=float, default=0.0,
+                        help='Extra latency in seconds per 1,000 prompt tokens')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with 429/500')
+    parser.add_argument('--news-response', type=str, help='JSON file with the canned news summary')
+    parser.add_argument('--10k-response', dest='ten_k_response', type=str, help='JSON file with the canned 10-K summary')
+    parser.add_argument('--no-think', action='store_true', help='Omit the <think> block from replies')
+    parser.add_argument('--seed', type=int, default=None, help='Random seed for latency and errors')
+    args = parser.parse_args()
+
+    def load(path):
+        if not path:
+            return None
+        with open(path) as f:
+            return json.load(f)
+
+    server = FakeLLMServer(
+        host=args.host,
+        port=args.port,
+        latency=LatencyModel(args.latency, args.median, args.sigma, args.spread, seed=args.seed),
+        error_rate=args.error_rate,
+        news_response=load(args.news_response),
+        ten_k_response=load(args.ten_k_response),
+        think=not args.no_think,
+        seed=args.seed,
+        per_1k_tokens=args.per_1k_tokens
+    )
+    print(f"Fake LLM server listening on {server.base_url}")
+    print(f"Use it with: TOGETHER_BASE_URL={server.base_url} TOGETHER_API_KEY=fake")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(f"Served {server.requests} requests ({server.errors} injected errors)")
+
+
+if __name__ == "__main__":
+    sys.exit(main())